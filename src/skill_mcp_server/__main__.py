@@ -2,6 +2,7 @@
 # Copyright (c) 2025
 # SPDX-License-Identifier: MIT
 """Skill MCP Server - Command Line Entry Point."""
+
 from __future__ import annotations
 
 # Early silent mode check - MUST be before ANY other imports
@@ -20,6 +21,7 @@ import asyncio
 import sys
 from pathlib import Path
 
+from .config.loader import parse_tool_concurrency
 from .core.server import create_server
 
 
@@ -44,6 +46,30 @@ Examples:
   # Specify both directories
   skill-mcp-server --skills-dir ./my-skills --workspace ./output
 
+  # Layer personal and team skills over a shared library (first wins)
+  skill-mcp-server --skills-dir ~/skills --skills-dir /team/skills --skills-dir /opt/skills
+
+  # Keep the skill catalog short and always list two skills first
+  skill-mcp-server --catalog-max-skills 30 --pin-skill deploy-helper --pin-skill code-review
+
+  # Serve many agents from one process over streamable HTTP (http://127.0.0.1:8000/mcp)
+  skill-mcp-server --transport http --port 8000
+  skill-mcp-server --transport http --session-workspaces
+
+  # Run at most 2 scripts of a skill at once, and reject calls once 16 wait
+  skill-mcp-server --skill-concurrency 2 --queue-size 16
+
+  # Start Python scripts from warm pre-forked interpreters, keeping at most
+  # 512 MB of interpreters with skills' preloaded modules
+  skill-mcp-server --python-pool --python-pool-memory 512
+
+  # Keep 256 KB of each script output stream, writing longer output to
+  # workspace/script_output/
+  skill-mcp-server --script-output-max 256 --spill-output
+
+  # Pick up new and edited skills without restarting
+  skill-mcp-server --watch
+
   # Enable verbose logging
   skill-mcp-server -v
 
@@ -55,9 +81,13 @@ For more information, visit:
     parser.add_argument(
         "--skills-dir",
         type=str,
+        action="append",
         default=None,
         metavar="PATH",
-        help="Directory containing skill folders (default: ./skills)",
+        help=(
+            "Directory containing skill folders (default: ./skills). "
+            "Repeat to add more roots; earlier roots override later ones"
+        ),
     )
 
     parser.add_argument(
@@ -68,6 +98,201 @@ For more information, visit:
         help="Working directory for file operations (default: ./workspace)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Directory for persistent caches (default: $XDG_CACHE_HOME/skill-mcp-server)",
+    )
+
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Disable the persistent skill catalog index",
+    )
+
+    parser.add_argument(
+        "--discovery-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Threads parsing SKILL.md files at startup (default: 1)",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch skill directories and notify clients when skills change",
+    )
+
+    parser.add_argument(
+        "--watch-backend",
+        choices=["auto", "inotify", "poll"],
+        default=None,
+        help="Filesystem watcher backend (default: auto)",
+    )
+
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http"],
+        default=None,
+        help="MCP transport: stdio (default) or streamable HTTP for many clients",
+    )
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=None,
+        help="Address to listen on with --transport http (default: 127.0.0.1)",
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Port to listen on with --transport http (default: 8000)",
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Listen on a unix socket instead of host/port with --transport http",
+    )
+
+    parser.add_argument(
+        "--session-workspaces",
+        action="store_true",
+        help="Give each client session its own workspace, deleted when it disconnects",
+    )
+
+    parser.add_argument(
+        "--tool-concurrency",
+        type=str,
+        action="append",
+        default=None,
+        metavar="NAME=N",
+        help="Maximum concurrent calls of a tool, e.g. skill_script=2 (repeatable)",
+    )
+
+    parser.add_argument(
+        "--pin-skill",
+        type=str,
+        action="append",
+        default=None,
+        metavar="NAME",
+        help="Always list this skill first in the skill tool description (repeatable)",
+    )
+
+    parser.add_argument(
+        "--catalog-max-skills",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Maximum skills listed in the skill tool description (default: 100, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--catalog-max-tokens",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Approximate token budget of that list (default: 8000, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--catalog-max-chars",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Character budget of that list (default: no limit)",
+    )
+
+    parser.add_argument(
+        "--skill-concurrency",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Maximum concurrent script runs of one skill (default: 4, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Calls that may wait for a busy tool or skill before new ones are "
+        "rejected (default: 64)",
+    )
+
+    parser.add_argument(
+        "--queue-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Maximum time a call waits for a busy tool or skill (default: 60, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="JSON file with settings (e.g. skill_limits); CLI flags and env vars take precedence",
+    )
+
+    parser.add_argument(
+        "--response-max-chars",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Characters per file, resource or script output response; longer output "
+        "is paged with read_more (default: 40000, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Minimum time between progress notifications streaming script output "
+        "(default: 0.5, 0 = no throttling)",
+    )
+
+    parser.add_argument(
+        "--python-pool",
+        action="store_true",
+        help="Run Python scripts in pre-forked warm interpreters instead of starting "
+        "a new interpreter per script (POSIX only)",
+    )
+
+    parser.add_argument(
+        "--python-pool-memory",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Memory of the warm interpreters that preloaded skills' modules; the least "
+        "recently used are stopped beyond it (default: 1024, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--script-output-max",
+        type=int,
+        default=None,
+        metavar="KB",
+        help="Script output kept per stream (stdout, stderr): its head and tail, the "
+        "middle is dropped (default: 1024, 0 = no limit)",
+    )
+
+    parser.add_argument(
+        "--spill-output",
+        action="store_true",
+        help="Write script output longer than --script-output-max in full to "
+        "script_output/ in the workspace",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -93,15 +318,50 @@ def main() -> int:
     args = parse_args()
 
     # Parse paths
-    skills_dir = Path(args.skills_dir) if args.skills_dir else None
+    skills_dirs = [Path(p) for p in args.skills_dir] if args.skills_dir else None
     workspace_dir = Path(args.workspace) if args.workspace else None
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
 
     try:
+        tool_concurrency = (
+            parse_tool_concurrency(args.tool_concurrency) if args.tool_concurrency else None
+        )
         # Create and run server
         server = create_server(
-            skills_dir=skills_dir,
             workspace_dir=workspace_dir,
             verbose=args.verbose,
+            skills_dirs=skills_dirs,
+            cache_dir=cache_dir,
+            skill_index=False if args.no_index else None,
+            discovery_workers=args.discovery_workers,
+            watch=True if args.watch else None,
+            watch_backend=args.watch_backend,
+            transport=args.transport,
+            host=args.host,
+            port=args.port,
+            unix_socket=Path(args.socket) if args.socket else None,
+            session_workspaces=True if args.session_workspaces else None,
+            tool_concurrency=tool_concurrency,
+            pinned_skills=args.pin_skill,
+            catalog_max_skills=args.catalog_max_skills,
+            catalog_max_tokens=args.catalog_max_tokens,
+            catalog_max_chars=args.catalog_max_chars,
+            progress_interval=args.progress_interval,
+            python_pool=True if args.python_pool else None,
+            python_pool_memory=(
+                args.python_pool_memory * 1024 * 1024
+                if args.python_pool_memory is not None
+                else None
+            ),
+            response_max_chars=args.response_max_chars,
+            script_output_max=(
+                args.script_output_max * 1024 if args.script_output_max is not None else None
+            ),
+            script_output_spill=True if args.spill_output else None,
+            skill_concurrency=args.skill_concurrency,
+            tool_queue_size=args.queue_size,
+            tool_queue_timeout=args.queue_timeout,
+            config_file=Path(args.config) if args.config else None,
         )
         asyncio.run(server.run())
         return 0
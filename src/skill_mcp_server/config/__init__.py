@@ -12,12 +12,13 @@ from .defaults import (
     MAX_READ_SIZE,
     SCRIPT_TIMEOUT,
 )
-from .loader import load_config
+from .loader import load_config, load_config_file
 from .settings import Settings
 
 __all__ = [
     "Settings",
     "load_config",
+    "load_config_file",
     "DEFAULT_SKILLS_DIR",
     "DEFAULT_WORKSPACE_DIR",
     "ALLOWED_FILE_EXTENSIONS",
@@ -7,6 +7,14 @@
 DEFAULT_SKILLS_DIR = "skills"
 DEFAULT_WORKSPACE_DIR = "workspace"
 
+# HTTP transport
+DEFAULT_HTTP_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8000
+DEFAULT_HTTP_PATH = "/mcp"
+
+# Cache directory name (created under $XDG_CACHE_HOME or ~/.cache)
+CACHE_DIR_NAME = "skill-mcp-server"
+
 # File type restrictions
 ALLOWED_FILE_EXTENSIONS: frozenset[str] = frozenset(
     {
@@ -49,6 +57,31 @@ MAX_READ_SIZE = 1024 * 1024  # 1MB for reading
 
 # Execution limits
 SCRIPT_TIMEOUT = 120  # seconds
+SCRIPT_KILL_GRACE = 2.0  # seconds between SIGTERM and SIGKILL
+SCRIPT_OUTPUT_MAX = 1024 * 1024  # bytes kept of each output stream (head and tail)
+SCRIPT_OUTPUT_DIR = "script_output"  # workspace directory for spilled output
+
+# Warm Python worker pool (see executor.pool), off by default
+PYTHON_POOL_IDLE = 2  # forked interpreters kept waiting for a script
+PYTHON_POOL_TEMPLATES = 4  # fork servers with a skill's preloaded modules
+PYTHON_POOL_MEMORY = 1024 * 1024 * 1024  # resident bytes of those (0 = no limit)
+
+# Tool responses longer than this are paginated (see tools.pagination)
+RESPONSE_MAX_CHARS = 40_000  # characters per response (~10k tokens)
+RESPONSE_BUFFER_TTL = 600.0  # seconds the rest of a response stays readable
+RESPONSE_BUFFER_MAX_CHARS = 32 * 1024 * 1024  # total characters buffered
+
+# Script output streamed as progress notifications (when the client asks)
+PROGRESS_INTERVAL = 0.5  # minimum seconds between notifications
+PROGRESS_MAX_CHARS = 4096  # maximum characters of output per notification
+
+# Concurrent calls per tool (each call runs in a worker thread)
+TOOL_CONCURRENCY = 8
+
+# Admission control (see core.scheduler)
+SKILL_CONCURRENCY = 4  # concurrent calls running one skill's code (0 = no limit)
+TOOL_QUEUE_SIZE = 64  # calls waiting per tool or skill before rejecting
+TOOL_QUEUE_TIMEOUT = 60.0  # seconds a call may wait for admission (0 = no limit)
 
 # Resource directories within a skill
 RESOURCE_DIRS: tuple[str, ...] = (
@@ -58,6 +91,19 @@ RESOURCE_DIRS: tuple[str, ...] = (
     "templates",
 )
 
+# Threads parsing SKILL.md files during discovery (1 = sequential)
+DISCOVERY_WORKERS = 1
+
+# Maximum bytes of skill bodies cached in memory (bodies are loaded lazily)
+CONTENT_CACHE_SIZE = 8 * 1024 * 1024
+
+# Budget of the skill list embedded in the `skill` tool description (0 = no limit)
+CATALOG_MAX_SKILLS = 100
+CATALOG_MAX_CHARS = 0
+CATALOG_MAX_TOKENS = 8000
+CHARS_PER_TOKEN = 4  # rough estimate used to turn a token budget into characters
+CATALOG_DESCRIPTION_CHARS = 1024  # longer descriptions are truncated in the list
+
 # Skill file name
 SKILL_FILENAME = "SKILL.md"
 
@@ -65,3 +111,7 @@ SKILL_FILENAME = "SKILL.md"
 SKILL_SCAN_PATTERNS: tuple[str, ...] = (
     "*/SKILL.md",  # Standard: skills/skill-name/SKILL.md
 )
+
+# Catalog watching
+WATCH_DEBOUNCE = 0.5  # seconds of quiet before applying filesystem changes
+WATCH_POLL_INTERVAL = 2.0  # seconds between polls for the polling watcher
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .settings import Settings
 
@@ -16,36 +18,95 @@ def load_config(
     skills_dir: Optional[Path] = None,
     workspace_dir: Optional[Path] = None,
     verbose: bool = False,
+    config_file: Optional[Path] = None,
+    **overrides: Any,
 ) -> Settings:
     """Load configuration with environment variable overrides.
 
     Priority (highest to lowest):
     1. Function arguments
     2. Environment variables
-    3. Default values
+    3. Configuration file (see load_config_file)
+    4. Default values
 
     Environment variables:
-    - SKILL_MCP_SKILLS_DIR: Skills directory path
+    - SKILL_MCP_SKILLS_DIR: Skills directory path; several roots may be
+      given separated by os.pathsep (":" on POSIX), highest priority first
     - SKILL_MCP_WORKSPACE_DIR: Workspace directory path
     - SKILL_MCP_VERBOSE: Enable verbose logging ("1", "true", "yes")
+    - SKILL_MCP_CACHE_DIR: Cache directory path
+    - SKILL_MCP_NO_INDEX: Disable the persistent skill index ("1", "true", "yes")
+    - SKILL_MCP_WATCH: Watch skill directories for changes ("1", "true", "yes")
+    - SKILL_MCP_DISCOVERY_WORKERS: Threads parsing skills during discovery
+    - SKILL_MCP_TRANSPORT: "stdio" or "http"
+    - SKILL_MCP_HOST / SKILL_MCP_PORT: Address of the HTTP transport
+    - SKILL_MCP_SOCKET: Unix socket of the HTTP transport
+    - SKILL_MCP_SESSION_WORKSPACES: Give each session its own workspace ("1", "true", "yes")
+    - SKILL_MCP_CONFIG: JSON configuration file
+    - SKILL_MCP_SKILL_CONCURRENCY: Concurrent calls running one skill's scripts
+    - SKILL_MCP_QUEUE_SIZE / SKILL_MCP_QUEUE_TIMEOUT: Admission queue of each
+      tool and skill (calls, seconds)
+    - SKILL_MCP_RESPONSE_MAX_CHARS: Characters per response before paging
+    - SKILL_MCP_PROGRESS_INTERVAL: Minimum seconds between script progress notifications
+    - SKILL_MCP_PYTHON_POOL: Run Python scripts in warm pre-forked interpreters
+      ("1", "true", "yes")
+    - SKILL_MCP_SCRIPT_OUTPUT_MAX: Bytes kept of each script output stream
+    - SKILL_MCP_SPILL_OUTPUT: Write long script output to the workspace ("1", "true", "yes")
+    - SKILL_MCP_TOOL_CONCURRENCY: Per-tool concurrency ("skill_script=2,file_read=16")
+    - SKILL_MCP_PINNED_SKILLS: Comma-separated skills listed first in the catalog
+    - SKILL_MCP_CATALOG_MAX_SKILLS: Maximum skills listed in the catalog
+    - SKILL_MCP_CATALOG_MAX_TOKENS: Approximate token budget of the catalog
 
     Args:
         skills_dir: Optional skills directory (overrides env var).
         workspace_dir: Optional workspace directory (overrides env var).
         verbose: Enable verbose logging (overrides env var).
+        config_file: Optional configuration file (overrides env var).
+        **overrides: Other Settings fields (override env vars when not None).
 
     Returns:
         Configured Settings instance.
+
+    Raises:
+        ValueError: If the configuration file is invalid.
     """
     # Check environment variables for defaults
     env_skills_dir = os.environ.get("SKILL_MCP_SKILLS_DIR")
     env_workspace_dir = os.environ.get("SKILL_MCP_WORKSPACE_DIR")
     env_verbose = os.environ.get("SKILL_MCP_VERBOSE", "").lower() in ("1", "true", "yes")
+    env_cache_dir = os.environ.get("SKILL_MCP_CACHE_DIR")
+    env_no_index = os.environ.get("SKILL_MCP_NO_INDEX", "").lower() in ("1", "true", "yes")
+    env_watch = os.environ.get("SKILL_MCP_WATCH", "").lower() in ("1", "true", "yes")
+    env_discovery_workers = os.environ.get("SKILL_MCP_DISCOVERY_WORKERS")
+    env_pinned_skills = os.environ.get("SKILL_MCP_PINNED_SKILLS")
+    env_tool_concurrency = os.environ.get("SKILL_MCP_TOOL_CONCURRENCY")
+    env_progress_interval = os.environ.get("SKILL_MCP_PROGRESS_INTERVAL")
+    env_python_pool = os.environ.get("SKILL_MCP_PYTHON_POOL", "").lower() in ("1", "true", "yes")
+    env_script_output_max = os.environ.get("SKILL_MCP_SCRIPT_OUTPUT_MAX")
+    env_spill_output = os.environ.get("SKILL_MCP_SPILL_OUTPUT", "").lower() in ("1", "true", "yes")
+    env_skill_concurrency = os.environ.get("SKILL_MCP_SKILL_CONCURRENCY")
+    env_queue_size = os.environ.get("SKILL_MCP_QUEUE_SIZE")
+    env_queue_timeout = os.environ.get("SKILL_MCP_QUEUE_TIMEOUT")
+    env_config = os.environ.get("SKILL_MCP_CONFIG")
+    env_response_max_chars = os.environ.get("SKILL_MCP_RESPONSE_MAX_CHARS")
+    env_transport = os.environ.get("SKILL_MCP_TRANSPORT")
+    env_host = os.environ.get("SKILL_MCP_HOST")
+    env_port = os.environ.get("SKILL_MCP_PORT")
+    env_socket = os.environ.get("SKILL_MCP_SOCKET")
+    env_session_workspaces = os.environ.get("SKILL_MCP_SESSION_WORKSPACES", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    env_catalog_max_skills = os.environ.get("SKILL_MCP_CATALOG_MAX_SKILLS")
+    env_catalog_max_tokens = os.environ.get("SKILL_MCP_CATALOG_MAX_TOKENS")
 
     # Apply priority: argument > env var > default
     final_skills_dir = skills_dir
-    if final_skills_dir is None and env_skills_dir:
-        final_skills_dir = Path(env_skills_dir)
+    if final_skills_dir is None and not overrides.get("skills_dirs") and env_skills_dir:
+        roots = [Path(p) for p in env_skills_dir.split(os.pathsep) if p]
+        if roots:
+            overrides["skills_dirs"] = roots
 
     final_workspace_dir = workspace_dir
     if final_workspace_dir is None and env_workspace_dir:
@@ -53,8 +114,134 @@ def load_config(
 
     final_verbose = verbose or env_verbose
 
+    if overrides.get("cache_dir") is None and env_cache_dir:
+        overrides["cache_dir"] = Path(env_cache_dir)
+    if overrides.get("skill_index") is None and env_no_index:
+        overrides["skill_index"] = False
+    if overrides.get("watch") is None and env_watch:
+        overrides["watch"] = True
+    if overrides.get("discovery_workers") is None and env_discovery_workers:
+        overrides["discovery_workers"] = int(env_discovery_workers)
+    if overrides.get("transport") is None and env_transport:
+        overrides["transport"] = env_transport
+    if overrides.get("host") is None and env_host:
+        overrides["host"] = env_host
+    if overrides.get("port") is None and env_port:
+        overrides["port"] = int(env_port)
+    if overrides.get("unix_socket") is None and env_socket:
+        overrides["unix_socket"] = Path(env_socket)
+    if overrides.get("session_workspaces") is None and env_session_workspaces:
+        overrides["session_workspaces"] = True
+    if overrides.get("tool_concurrency") is None and env_tool_concurrency:
+        overrides["tool_concurrency"] = parse_tool_concurrency(env_tool_concurrency.split(","))
+    if overrides.get("progress_interval") is None and env_progress_interval:
+        overrides["progress_interval"] = float(env_progress_interval)
+    if overrides.get("python_pool") is None and env_python_pool:
+        overrides["python_pool"] = True
+    if overrides.get("script_output_max") is None and env_script_output_max:
+        overrides["script_output_max"] = int(env_script_output_max)
+    if overrides.get("script_output_spill") is None and env_spill_output:
+        overrides["script_output_spill"] = True
+    if overrides.get("skill_concurrency") is None and env_skill_concurrency:
+        overrides["skill_concurrency"] = int(env_skill_concurrency)
+    if overrides.get("tool_queue_size") is None and env_queue_size:
+        overrides["tool_queue_size"] = int(env_queue_size)
+    if overrides.get("tool_queue_timeout") is None and env_queue_timeout:
+        overrides["tool_queue_timeout"] = float(env_queue_timeout)
+    if overrides.get("response_max_chars") is None and env_response_max_chars:
+        overrides["response_max_chars"] = int(env_response_max_chars)
+    if overrides.get("pinned_skills") is None and env_pinned_skills:
+        overrides["pinned_skills"] = [n.strip() for n in env_pinned_skills.split(",") if n.strip()]
+    if overrides.get("catalog_max_skills") is None and env_catalog_max_skills:
+        overrides["catalog_max_skills"] = int(env_catalog_max_skills)
+    if overrides.get("catalog_max_tokens") is None and env_catalog_max_tokens:
+        overrides["catalog_max_tokens"] = int(env_catalog_max_tokens)
+
+    # The configuration file only fills in what nothing above set
+    final_config_file = config_file or (Path(env_config) if env_config else None)
+    if final_config_file is not None:
+        for key, value in load_config_file(final_config_file).items():
+            if key == "skills_dir":
+                if final_skills_dir is None and not overrides.get("skills_dirs"):
+                    final_skills_dir = value
+            elif key == "workspace_dir":
+                if final_workspace_dir is None:
+                    final_workspace_dir = value
+            elif key == "verbose":
+                final_verbose = final_verbose or value
+            elif overrides.get(key) is None:
+                overrides[key] = value
+
     return Settings.from_args(
         skills_dir=final_skills_dir,
         workspace_dir=final_workspace_dir,
         verbose=final_verbose,
+        **overrides,
     )
+
+
+def parse_tool_concurrency(specs: list[str]) -> dict[str, int]:
+    """Parse per-tool concurrency limits.
+
+    Args:
+        specs: Items of the form "tool_name=N"; empty items are ignored.
+
+    Returns:
+        Mapping of tool name to limit.
+
+    Raises:
+        ValueError: If an item is malformed or a limit is not positive.
+    """
+    limits: dict[str, int] = {}
+    for spec in specs:
+        spec = spec.strip()
+        if not spec:
+            continue
+        name, sep, value = spec.partition("=")
+        if not sep or not name.strip() or not value.strip().isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid tool concurrency {spec!r}, expected NAME=N with N >= 1")
+        limits[name.strip()] = int(value)
+    return limits
+
+
+def load_config_file(path: Path) -> dict[str, Any]:
+    """Read Settings fields from a JSON configuration file.
+
+    The file holds an object whose keys are Settings field names, e.g.
+    {"skill_concurrency": 2, "tool_concurrency": {"skill_script": 8},
+    "skill_limits": {"pdf": 1}}. Lists are converted for tuple and
+    frozenset fields; paths are given as strings.
+
+    Args:
+        path: Configuration file.
+
+    Returns:
+        Field values keyed by field name.
+
+    Raises:
+        ValueError: If the file cannot be read, is not a JSON object or
+            names unknown fields.
+    """
+    try:
+        data = json.loads(Path(path).expanduser().read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read configuration file {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Configuration file {path} must contain a JSON object")
+
+    fields = {f.name: f for f in dataclasses.fields(Settings)}
+    unknown = sorted(set(data) - set(fields))
+    if unknown:
+        raise ValueError(f"Unknown settings in {path}: {', '.join(unknown)}")
+
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        default = fields[key].default
+        if isinstance(default, frozenset) and isinstance(value, list):
+            value = frozenset(value)
+        elif isinstance(default, tuple) and isinstance(value, list):
+            value = tuple(value)
+        elif key == "skills_dirs" and isinstance(value, list):
+            value = [Path(p) for p in value]
+        values[key] = value
+    return values
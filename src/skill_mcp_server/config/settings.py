@@ -5,45 +5,134 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .defaults import (
     ALLOWED_FILE_EXTENSIONS,
     ALLOWED_SCRIPT_EXTENSIONS,
+    CACHE_DIR_NAME,
+    CATALOG_MAX_CHARS,
+    CATALOG_MAX_SKILLS,
+    CATALOG_MAX_TOKENS,
+    CONTENT_CACHE_SIZE,
+    DEFAULT_HTTP_HOST,
+    DEFAULT_HTTP_PATH,
+    DEFAULT_HTTP_PORT,
     DEFAULT_SKILLS_DIR,
     DEFAULT_WORKSPACE_DIR,
+    DISCOVERY_WORKERS,
     MAX_FILE_SIZE,
     MAX_READ_SIZE,
+    PROGRESS_INTERVAL,
+    PROGRESS_MAX_CHARS,
+    PYTHON_POOL_IDLE,
+    PYTHON_POOL_MEMORY,
+    PYTHON_POOL_TEMPLATES,
     RESOURCE_DIRS,
+    RESPONSE_BUFFER_MAX_CHARS,
+    RESPONSE_BUFFER_TTL,
+    RESPONSE_MAX_CHARS,
+    SCRIPT_OUTPUT_MAX,
     SCRIPT_TIMEOUT,
+    SKILL_CONCURRENCY,
     SKILL_FILENAME,
     SKILL_SCAN_PATTERNS,
+    TOOL_QUEUE_SIZE,
+    TOOL_QUEUE_TIMEOUT,
+    WATCH_DEBOUNCE,
+    WATCH_POLL_INTERVAL,
 )
 
 
+def default_cache_dir() -> Path:
+    """Get the default cache directory, honoring XDG_CACHE_HOME.
+
+    Returns:
+        Path to the cache directory.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / CACHE_DIR_NAME
+
+
 @dataclass
 class Settings:
     """Configuration settings for Skill MCP Server.
 
     Attributes:
-        skills_dir: Directory containing skill folders.
+        skills_dir: Directory containing skill folders (the highest-priority
+            root; always skills_dirs[0]).
+        skills_dirs: All skill roots in priority order. A skill in an earlier
+            root overrides a skill with the same name in a later one.
         workspace_dir: Working directory for file operations.
+        cache_dir: Directory for persistent caches (catalog index, compiled
+            TypeScript scripts, etc.).
         allowed_file_extensions: File extensions allowed for read/write.
         allowed_script_extensions: Script extensions allowed for execution.
         max_file_size: Maximum file size for writing (bytes).
         max_read_size: Maximum file size for reading (bytes).
+        response_max_chars: Maximum characters of a file, resource or script
+            output response; the rest is paged with `read_more` (0 = no limit).
+        response_buffer_ttl: Seconds the rest of a paged response is kept.
+        response_buffer_max_chars: Maximum characters of paged responses kept.
         script_timeout: Script execution timeout (seconds).
+        script_output_max: Bytes kept of each script output stream, its
+            head and tail (0 = no limit).
+        script_output_spill: Write script output exceeding
+            script_output_max in full to a file under `script_output/`
+            in the workspace.
+        progress_interval: Minimum seconds between progress notifications
+            streaming script output (0 = no throttling).
+        progress_max_chars: Maximum characters of output per notification.
+        python_pool: Run Python scripts in pre-forked warm interpreters
+            instead of starting a new interpreter per script.
+        python_pool_idle: Warm interpreters kept waiting for a script.
+        python_pool_templates: Maximum warm interpreters that preloaded a
+            skill's `preload` modules (0 = never preload).
+        python_pool_memory: Maximum resident bytes of those (0 = no limit);
+            the least recently used are stopped first.
+        tool_concurrency: Maximum concurrent calls per tool name, overriding
+            the tool's own default.
+        skill_concurrency: Maximum concurrent calls running one skill's
+            scripts (0 = no per-skill limit).
+        skill_limits: Per-skill overrides of skill_concurrency.
+        tool_queue_size: Maximum calls waiting for a tool or skill before
+            further calls are rejected.
+        tool_queue_timeout: Maximum seconds a call waits for admission
+            (0 = no limit).
         resource_dirs: Subdirectories to scan for resources within skills.
         skill_filename: Expected filename for skill definitions.
         skill_scan_patterns: Glob patterns for discovering skills.
+        skill_index: Persist the parsed skill catalog for fast warm starts.
+        discovery_workers: Threads parsing SKILL.md files during discovery.
+        content_cache_size: Maximum bytes of skill bodies kept in memory.
+        watch: Watch skill directories and push catalog changes to clients.
+        watch_backend: Watcher backend ("auto", "inotify" or "poll").
+        watch_debounce: Seconds of quiet before applying filesystem changes.
+        watch_poll_interval: Seconds between polls for the polling backend.
+        pinned_skills: Skills always listed first in the `skill` tool description.
+        catalog_max_skills: Maximum skills listed in the `skill` tool description.
+        catalog_max_chars: Maximum characters of that list (0 = no limit).
+        catalog_max_tokens: Approximate maximum tokens of that list (0 = no limit).
+        transport: "stdio" (one client per process) or "http" (streamable
+            HTTP, many clients per process).
+        host: Address the HTTP transport listens on.
+        port: Port the HTTP transport listens on.
+        unix_socket: Unix socket the HTTP transport listens on instead of host/port.
+        http_path: URL path of the MCP endpoint.
+        session_workspaces: Give each client session its own workspace,
+            a subdirectory of workspace_dir removed when the session ends.
         verbose: Enable verbose logging.
     """
 
     # Directory settings
     skills_dir: Path = field(default_factory=lambda: Path.cwd() / DEFAULT_SKILLS_DIR)
+    skills_dirs: list[Path] = field(default_factory=list)
     workspace_dir: Path = field(default_factory=lambda: Path.cwd() / DEFAULT_WORKSPACE_DIR)
+    cache_dir: Path = field(default_factory=default_cache_dir)
 
     # File restrictions
     allowed_file_extensions: frozenset[str] = ALLOWED_FILE_EXTENSIONS
@@ -52,14 +141,53 @@ class Settings:
     # Size limits
     max_file_size: int = MAX_FILE_SIZE
     max_read_size: int = MAX_READ_SIZE
+    response_max_chars: int = RESPONSE_MAX_CHARS
+    response_buffer_ttl: float = RESPONSE_BUFFER_TTL
+    response_buffer_max_chars: int = RESPONSE_BUFFER_MAX_CHARS
 
     # Execution limits
     script_timeout: int = SCRIPT_TIMEOUT
+    script_output_max: int = SCRIPT_OUTPUT_MAX
+    script_output_spill: bool = False
+    progress_interval: float = PROGRESS_INTERVAL
+    progress_max_chars: int = PROGRESS_MAX_CHARS
+    python_pool: bool = False
+    python_pool_idle: int = PYTHON_POOL_IDLE
+    python_pool_templates: int = PYTHON_POOL_TEMPLATES
+    python_pool_memory: int = PYTHON_POOL_MEMORY
+    tool_concurrency: dict[str, int] = field(default_factory=dict)
+    skill_concurrency: int = SKILL_CONCURRENCY
+    skill_limits: dict[str, int] = field(default_factory=dict)
+    tool_queue_size: int = TOOL_QUEUE_SIZE
+    tool_queue_timeout: float = TOOL_QUEUE_TIMEOUT
 
     # Skill discovery
     resource_dirs: tuple[str, ...] = RESOURCE_DIRS
     skill_filename: str = SKILL_FILENAME
     skill_scan_patterns: tuple[str, ...] = SKILL_SCAN_PATTERNS
+    skill_index: bool = True
+    discovery_workers: int = DISCOVERY_WORKERS
+    content_cache_size: int = CONTENT_CACHE_SIZE
+
+    # Catalog watching
+    watch: bool = False
+    watch_backend: str = "auto"
+    watch_debounce: float = WATCH_DEBOUNCE
+    watch_poll_interval: float = WATCH_POLL_INTERVAL
+
+    # Skill catalog in the `skill` tool description
+    pinned_skills: list[str] = field(default_factory=list)
+    catalog_max_skills: int = CATALOG_MAX_SKILLS
+    catalog_max_chars: int = CATALOG_MAX_CHARS
+    catalog_max_tokens: int = CATALOG_MAX_TOKENS
+
+    # Transport
+    transport: str = "stdio"
+    host: str = DEFAULT_HTTP_HOST
+    port: int = DEFAULT_HTTP_PORT
+    unix_socket: Optional[Path] = None
+    http_path: str = DEFAULT_HTTP_PATH
+    session_workspaces: bool = False
 
     # Logging
     verbose: bool = False
@@ -70,13 +198,58 @@ class Settings:
             self.skills_dir = Path(self.skills_dir)
         if isinstance(self.workspace_dir, str):
             self.workspace_dir = Path(self.workspace_dir)
+        if isinstance(self.cache_dir, str):
+            self.cache_dir = Path(self.cache_dir)
+        if isinstance(self.unix_socket, str):
+            self.unix_socket = Path(self.unix_socket)
 
         # Resolve to absolute paths
         self.skills_dir = self.skills_dir.resolve()
+        roots: list[Path] = []
+        for root in self.skills_dirs or [self.skills_dir]:
+            resolved = Path(root).expanduser().resolve()
+            if resolved not in roots:
+                roots.append(resolved)
+        self.skills_dirs = roots
+        self.skills_dir = roots[0]
         self.workspace_dir = self.workspace_dir.resolve()
+        self.cache_dir = self.cache_dir.expanduser().resolve()
+        if self.unix_socket is not None:
+            self.unix_socket = self.unix_socket.expanduser().resolve()
+
+    @property
+    def index_dir(self) -> Optional[Path]:
+        """Get the catalog index directory, or None if indexing is disabled.
+
+        Returns:
+            Path to the index directory or None.
+        """
+        return self.cache_dir / "index" if self.skill_index else None
+
+    @property
+    def usage_path(self) -> Path:
+        """Get the file the skill usage history is persisted to.
+
+        Returns:
+            Path to the usage history file.
+        """
+        return self.cache_dir / "usage.json"
+
+    @property
+    def transpile_dir(self) -> Path:
+        """Get the directory compiled TypeScript scripts are cached in.
+
+        Returns:
+            Path to the transpile cache directory.
+        """
+        return self.cache_dir / "ts"
 
     def ensure_directories(self) -> None:
-        """Create skills and workspace directories if they don't exist."""
+        """Create skills and workspace directories if they don't exist.
+
+        Only the highest-priority skills root is created; additional roots
+        (e.g. shared read-only libraries) are expected to exist already.
+        """
         self.skills_dir.mkdir(parents=True, exist_ok=True)
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
 
@@ -86,6 +259,7 @@ class Settings:
         skills_dir: Optional[Path] = None,
         workspace_dir: Optional[Path] = None,
         verbose: bool = False,
+        **overrides: Any,
     ) -> Settings:
         """Create Settings from command-line arguments.
 
@@ -93,6 +267,7 @@ class Settings:
             skills_dir: Optional skills directory path.
             workspace_dir: Optional workspace directory path.
             verbose: Enable verbose logging.
+            **overrides: Other Settings fields; None values keep the default.
 
         Returns:
             Configured Settings instance.
@@ -104,4 +279,8 @@ class Settings:
         if workspace_dir is not None:
             kwargs["workspace_dir"] = workspace_dir
 
+        for key, value in overrides.items():
+            if value is not None:
+                kwargs[key] = value
+
         return cls(**kwargs)
@@ -3,14 +3,17 @@
 
 """Core module for Skill MCP Server."""
 
-from .exceptions import ServerError, ToolNotFoundError
+from .exceptions import ServerError, ToolBusyError, ToolNotFoundError
 from .registry import ToolRegistry
+from .scheduler import ToolScheduler
 from .server import SkillMCPServer, create_server
 
 __all__ = [
     "SkillMCPServer",
     "create_server",
     "ToolRegistry",
+    "ToolScheduler",
     "ServerError",
     "ToolNotFoundError",
+    "ToolBusyError",
 ]
@@ -18,6 +18,15 @@ class ToolNotFoundError(ServerError):
         super().__init__(f"Tool not found: {tool_name}")
 
 
+class ToolBusyError(ServerError):
+    """Raised when a tool call is not admitted because its lane is full."""
+
+    def __init__(self, lane: str, reason: str) -> None:
+        self.lane = lane
+        self.reason = reason
+        super().__init__(f"{lane} is busy ({reason}); try again later")
+
+
 class ConfigurationError(ServerError):
     """Raised when there's a configuration problem."""
 
@@ -0,0 +1,153 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Streamable HTTP transport.
+
+Serves the MCP server over the streamable HTTP transport (POST requests
+answered with JSON or an SSE stream, plus an optional GET stream for
+server notifications) on a TCP port or a unix socket. Every client gets
+its own MCP session, but all sessions share the server's skill manager
+and tool registry. Server statistics (e.g. admission queue counters) are
+served as JSON at /stats, behind the same Host/Origin checks as MCP.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any, Callable, Optional
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.server.transport_security import TransportSecurityMiddleware, TransportSecuritySettings
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from ..config.settings import Settings
+from ..utils.logging import get_logger
+
+logger = get_logger("core.http")
+
+# Hosts for which DNS rebinding protection is enabled
+LOOPBACK_HOSTS: frozenset[str] = frozenset({"127.0.0.1", "localhost", "::1"})
+
+# Path of the JSON statistics endpoint
+STATS_PATH = "/stats"
+
+
+def create_http_app(
+    server: Server,
+    settings: Settings,
+    stats: Optional[Callable[[], dict[str, Any]]] = None,
+) -> Starlette:
+    """Create the ASGI application serving MCP at settings.http_path.
+
+    Args:
+        server: MCP server whose handlers answer the requests.
+        settings: Server configuration (host and path).
+        stats: Optional function returning server statistics, served as
+            JSON at /stats.
+
+    Returns:
+        Starlette application; its lifespan runs the session manager.
+    """
+    security_settings = _security_settings(settings)
+    session_manager = StreamableHTTPSessionManager(
+        app=server,
+        security_settings=security_settings,
+    )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    routes = [Route(settings.http_path, endpoint=_MCPEndpoint(session_manager))]
+    if stats is not None:
+        # The same Host/Origin checks as the MCP endpoint, so web pages
+        # cannot read the statistics through DNS rebinding either
+        security = TransportSecurityMiddleware(security_settings)
+
+        async def stats_endpoint(request: Request) -> Response:
+            error = await security.validate_request(request)
+            if error is not None:
+                return error
+            return JSONResponse(stats())
+
+        routes.append(Route(STATS_PATH, endpoint=stats_endpoint, methods=["GET"]))
+
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+async def serve_http(
+    server: Server,
+    settings: Settings,
+    stats: Optional[Callable[[], dict[str, Any]]] = None,
+) -> None:
+    """Serve MCP over streamable HTTP until interrupted.
+
+    Args:
+        server: MCP server whose handlers answer the requests.
+        settings: Server configuration (host, port, socket and path).
+        stats: Optional function returning server statistics.
+    """
+    app = create_http_app(server, settings, stats)
+    config = uvicorn.Config(
+        app,
+        host=settings.host,
+        port=settings.port,
+        uds=str(settings.unix_socket) if settings.unix_socket else None,
+        log_level="debug" if settings.verbose else "warning",
+        lifespan="on",
+    )
+
+    if settings.unix_socket:
+        logger.info(f"Serving MCP over HTTP on unix:{settings.unix_socket}{settings.http_path}")
+    else:
+        logger.info(
+            f"Serving MCP over HTTP on http://{settings.host}:{settings.port}{settings.http_path}"
+        )
+
+    await uvicorn.Server(config).serve()
+
+
+class _MCPEndpoint:
+    """ASGI endpoint handing requests to the session manager.
+
+    A class rather than a function, so Starlette routes the raw ASGI
+    call to it instead of wrapping it as a request handler.
+    """
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager) -> None:
+        self.session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def _security_settings(settings: Settings) -> Optional[TransportSecuritySettings]:
+    """Get the transport security settings for a listening address.
+
+    When listening on a loopback address, requests must carry a local
+    Host (and Origin, if any) header, which stops web pages from reaching
+    the server through DNS rebinding. Unix sockets are protected by file
+    permissions instead.
+
+    Args:
+        settings: Server configuration.
+
+    Returns:
+        TransportSecuritySettings, or None to accept any Host.
+    """
+    if settings.unix_socket or settings.host not in LOOPBACK_HOSTS:
+        return None
+
+    return TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=["127.0.0.1:*", "localhost:*", "[::1]:*"],
+        allowed_origins=["http://127.0.0.1:*", "http://localhost:*", "http://[::1]:*"],
+    )
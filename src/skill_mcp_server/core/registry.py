@@ -5,13 +5,17 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import math
+from typing import Any, Optional
 
+import anyio
 from mcp.types import Tool
 
 from ..tools.base import BaseTool
 from ..utils.logging import get_logger
 from .exceptions import ToolNotFoundError
+from .scheduler import ToolScheduler
 
 logger = get_logger("core.registry")
 
@@ -21,11 +25,33 @@ class ToolRegistry:
 
     Manages tool registration, lookup, and provides
     MCP-compatible tool definitions.
+
+    The tool definitions are cached and only rebuilt when a tool is
+    registered or removed, or when a tool's revision changes.
+
+    Calls are admitted by a ToolScheduler, which enforces the per-tool
+    and per-skill concurrency limits.
     """
 
-    def __init__(self) -> None:
-        """Initialize the registry."""
+    def __init__(
+        self,
+        concurrency: Optional[dict[str, int]] = None,
+        scheduler: Optional[ToolScheduler] = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            concurrency: Maximum concurrent calls per tool name, overriding
+                the tools' own defaults (ignored if scheduler is given).
+            scheduler: Scheduler admitting calls; by default one with the
+                given per-tool limits.
+        """
+        self.scheduler = scheduler or ToolScheduler(tool_limits=concurrency)
         self._tools: dict[str, BaseTool] = {}
+        # Admission already bounds running calls, so threads need no other limit
+        self._threads = anyio.CapacityLimiter(math.inf)
+        self._definitions: Optional[list[Tool]] = None
+        self._revisions: tuple[int, ...] = ()
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool.
@@ -37,6 +63,8 @@ class ToolRegistry:
             logger.warning(f"Overwriting existing tool: {tool.name}")
 
         self._tools[tool.name] = tool
+        self.scheduler.reset(tool.name)
+        self._definitions = None
         logger.debug(f"Registered tool: {tool.name}")
 
     def register_many(self, tools: list[BaseTool]) -> None:
@@ -76,13 +104,46 @@ class ToolRegistry:
             raise ToolNotFoundError(name)
         return tool
 
+    async def call(self, name: str, arguments: dict[str, Any]) -> str:
+        """Call a tool, without blocking the event loop.
+
+        Tools with an async implementation are awaited directly; others
+        run in a worker thread. Calls beyond the tool's (or skill's)
+        concurrency wait in a bounded queue for a running call to finish.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            Tool result.
+
+        Raises:
+            ToolNotFoundError: If tool is not registered.
+            ToolBusyError: If the call is not admitted.
+        """
+        tool = self.get_or_raise(name)
+
+        async with self.scheduler.admit(tool, arguments):
+            if tool.supports_async:
+                return await tool.aexecute(**arguments)
+
+            return await anyio.to_thread.run_sync(
+                functools.partial(tool.execute, **arguments), limiter=self._threads
+            )
+
     def list_tools(self) -> list[Tool]:
         """Get MCP Tool definitions for all registered tools.
 
         Returns:
             List of MCP Tool objects.
         """
-        return [tool.to_mcp_tool() for tool in self._tools.values()]
+        revisions = tuple(tool.revision for tool in self._tools.values())
+        if self._definitions is None or revisions != self._revisions:
+            self._definitions = [tool.to_mcp_tool() for tool in self._tools.values()]
+            self._revisions = revisions
+            logger.debug(f"Rebuilt {len(self._definitions)} tool definitions")
+        return list(self._definitions)
 
     def names(self) -> list[str]:
         """Get all registered tool names.
@@ -102,7 +163,10 @@ class ToolRegistry:
 
     def clear(self) -> None:
         """Remove all registered tools."""
+        for name in self._tools:
+            self.scheduler.reset(name)
         self._tools.clear()
+        self._definitions = None
 
     def __contains__(self, name: str) -> bool:
         """Check if a tool is registered.
@@ -0,0 +1,252 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Admission control for tool calls.
+
+Every tool has a lane: at most `limit` calls run at once, up to
+`queue_size` more wait in FIFO order for at most `queue_timeout`
+seconds, and anything beyond that is rejected immediately with
+ToolBusyError. Tools that run skill code (BaseTool.skill_argument) also
+go through a lane per skill, so one busy skill cannot take all of a
+tool's slots. Each lane keeps counters for monitoring.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import anyio
+
+from ..config.defaults import SKILL_CONCURRENCY, TOOL_QUEUE_SIZE, TOOL_QUEUE_TIMEOUT
+from ..tools.base import BaseTool
+from ..utils.logging import get_logger
+from .exceptions import ToolBusyError
+
+logger = get_logger("core.scheduler")
+
+# Skill lanes kept before idle ones are dropped
+MAX_SKILL_LANES = 1024
+
+
+class _Lane:
+    """A concurrency limit with a bounded wait queue and counters."""
+
+    def __init__(self, name: str, limit: int, queue_size: int) -> None:
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue_size = max(0, queue_size)
+        self.running = 0
+        # Waiters in arrival order; a released slot is handed to the first
+        self._waiters: deque[anyio.Event] = deque()
+
+        # Counters
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_waiting = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def acquire(self, deadline: Optional[float]) -> None:
+        """Take a slot, waiting in the queue until the deadline if needed.
+
+        Args:
+            deadline: time.monotonic() value to give up at, or None to
+                wait as long as it takes.
+
+        Raises:
+            ToolBusyError: If the queue is full or the deadline passes.
+        """
+        if self.running < self.limit and not self._waiters:
+            self.running += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise ToolBusyError(
+                self.name, f"{self.running} calls running and {len(self._waiters)} waiting"
+            )
+
+        event = anyio.Event()
+        self._waiters.append(event)
+        self.max_waiting = max(self.max_waiting, len(self._waiters))
+        started = time.monotonic()
+        timeout = None if deadline is None else max(0.0, deadline - started)
+
+        try:
+            with anyio.move_on_after(timeout):
+                await event.wait()
+        except BaseException:
+            # Cancelled while queued; pass on a slot handed over meanwhile
+            if event.is_set():
+                self.release()
+            else:
+                self._waiters.remove(event)
+            raise
+
+        waited = time.monotonic() - started
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+        if not event.is_set():
+            self._waiters.remove(event)
+            self.timed_out += 1
+            raise ToolBusyError(self.name, f"no slot became free within {waited:.1f} seconds")
+
+        # release() transferred its slot to this call
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Free a slot, handing it to the first waiter if there is one."""
+        if self._waiters:
+            self._waiters.popleft().set()
+        else:
+            self.running -= 1
+
+    @property
+    def idle(self) -> bool:
+        """Check that no call holds or waits for a slot."""
+        return self.running == 0 and not self._waiters
+
+    def stats(self) -> dict[str, Any]:
+        """Get the lane's current state and counters."""
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "waiting": len(self._waiters),
+            "max_waiting": self.max_waiting,
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_seconds_total": round(self.wait_total, 6),
+            "wait_seconds_max": round(self.wait_max, 6),
+        }
+
+
+class ToolScheduler:
+    """Admits tool calls through per-tool and per-skill lanes.
+
+    All methods must be called from the event loop.
+    """
+
+    def __init__(
+        self,
+        tool_limits: Optional[dict[str, int]] = None,
+        skill_limit: int = SKILL_CONCURRENCY,
+        skill_limits: Optional[dict[str, int]] = None,
+        queue_size: int = TOOL_QUEUE_SIZE,
+        queue_timeout: float = TOOL_QUEUE_TIMEOUT,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            tool_limits: Maximum concurrent calls per tool name, overriding
+                the tools' own defaults (BaseTool.concurrency).
+            skill_limit: Maximum concurrent calls running code of one
+                skill (0 = no per-skill limit).
+            skill_limits: Per-skill overrides of skill_limit.
+            queue_size: Maximum calls waiting in each lane.
+            queue_timeout: Maximum seconds a call waits for admission
+                (0 = no limit).
+        """
+        self.tool_limits = dict(tool_limits or {})
+        self.skill_limit = skill_limit
+        self.skill_limits = dict(skill_limits or {})
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._tool_lanes: dict[str, _Lane] = {}
+        self._skill_lanes: dict[str, _Lane] = {}
+
+    @contextlib.asynccontextmanager
+    async def admit(self, tool: BaseTool, arguments: dict[str, Any]) -> AsyncIterator[None]:
+        """Hold a slot for one call of a tool while the block runs.
+
+        The skill lane, if any, is entered first, so a call waiting for a
+        busy skill does not take one of the tool's slots meanwhile.
+
+        Args:
+            tool: Tool being called.
+            arguments: Call arguments (used to find the skill).
+
+        Raises:
+            ToolBusyError: If the call is not admitted.
+        """
+        deadline = time.monotonic() + self.queue_timeout if self.queue_timeout > 0 else None
+
+        lanes = []
+        skill_lane = self._skill_lane(tool, arguments)
+        if skill_lane is not None:
+            lanes.append(skill_lane)
+        lanes.append(self._tool_lane(tool))
+
+        acquired: list[_Lane] = []
+        try:
+            try:
+                for lane in lanes:
+                    await lane.acquire(deadline)
+                    acquired.append(lane)
+            except ToolBusyError as e:
+                logger.debug(f"Rejected {tool.name} call: {e}")
+                raise
+            yield
+        finally:
+            for lane in reversed(acquired):
+                lane.release()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the state and counters of every lane.
+
+        Returns:
+            Lane statistics keyed by "tool:<name>" or "skill:<name>".
+        """
+        stats = {f"tool:{name}": lane.stats() for name, lane in self._tool_lanes.items()}
+        stats.update({f"skill:{name}": lane.stats() for name, lane in self._skill_lanes.items()})
+        return stats
+
+    def reset(self, tool_name: str) -> None:
+        """Forget a tool's lane, e.g. because the tool was replaced.
+
+        Args:
+            tool_name: Tool name.
+        """
+        self._tool_lanes.pop(tool_name, None)
+
+    def _tool_lane(self, tool: BaseTool) -> _Lane:
+        """Get the lane of a tool, creating it on first use."""
+        lane = self._tool_lanes.get(tool.name)
+        if lane is None:
+            limit = self.tool_limits.get(tool.name, tool.concurrency)
+            lane = self._tool_lanes[tool.name] = _Lane(tool.name, limit, self.queue_size)
+        return lane
+
+    def _skill_lane(self, tool: BaseTool, arguments: dict[str, Any]) -> Optional[_Lane]:
+        """Get the lane of the skill a call runs code of, if limited."""
+        if tool.skill_argument is None:
+            return None
+        skill_name = arguments.get(tool.skill_argument)
+        if not isinstance(skill_name, str) or not skill_name:
+            return None
+        limit = self.skill_limits.get(skill_name, self.skill_limit)
+        if limit <= 0:
+            return None
+
+        lane = self._skill_lanes.get(skill_name)
+        if lane is None:
+            if len(self._skill_lanes) >= MAX_SKILL_LANES:
+                self._prune_skill_lanes()
+            lane = self._skill_lanes[skill_name] = _Lane(
+                f"skill {skill_name}", limit, self.queue_size
+            )
+        return lane
+
+    def _prune_skill_lanes(self) -> None:
+        """Drop idle skill lanes (skill names come from clients)."""
+        for name, lane in list(self._skill_lanes.items()):
+            if lane.idle:
+                del self._skill_lanes[name]
@@ -5,31 +5,84 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import weakref
 from pathlib import Path
 from typing import Any, Optional
 
-from mcp.server import Server
+import anyio
+from mcp.server import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from mcp.server.session import ServerSession
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent
+from mcp.types import TextContent, Tool
 
 from ..config.loader import load_config
 from ..config.settings import Settings
+from ..executor.factory import ExecutorFactory
+from ..executor.pool import PoolError, PythonWorkerPool
+from ..executor.transpile import TranspileCache
 from ..security.file_validator import FileValidator
 from ..skill.manager import SkillManager
+from ..skill.models import CatalogDiff
+from ..skill.usage import UsageHistory
+from ..skill.watcher import BaseWatcher, WatcherError, create_watcher
 from ..tools.file_editor import FileEditorTool
 from ..tools.file_reader import FileReaderTool
 from ..tools.file_writer import FileWriterTool
+from ..tools.pagination import ReadMoreTool, ResponsePager
+from ..tools.progress import ProgressReporter, current_progress
 from ..tools.resource_reader import ResourceReaderTool
 from ..tools.script_executor import ScriptExecutorTool
 from ..tools.skill_lister import SkillListerTool
 from ..tools.skill_loader import SkillLoaderTool
+from ..tools.skill_search import SkillSearchTool
+from ..tools.workspace import WorkspaceManager, current_workspace
 from ..utils.logging import get_logger, setup_logging
-from .exceptions import ToolNotFoundError
+from .exceptions import ConfigurationError, ToolBusyError, ToolNotFoundError
 from .registry import ToolRegistry
+from .scheduler import ToolScheduler
 
 logger = get_logger("core.server")
 
 
+class _SkillServer(Server):
+    """MCP server advertising tools/list_changed support on every transport.
+
+    The HTTP session manager creates initialization options without
+    arguments, so the notification options are defaulted here. With a
+    workspace manager, every session (one call of run()) gets its own
+    workspace.
+    """
+
+    workspaces: Optional[WorkspaceManager] = None
+
+    async def run(self, *args: Any, **kwargs: Any) -> None:
+        if self.workspaces is None:
+            await super().run(*args, **kwargs)
+            return
+        # Handler tasks started by run() inherit the workspace
+        workspace = self.workspaces.create()
+        token = current_workspace.set(workspace)
+        try:
+            await super().run(*args, **kwargs)
+        finally:
+            current_workspace.reset(token)
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(workspace.remove)
+
+    def create_initialization_options(
+        self,
+        notification_options: Optional[NotificationOptions] = None,
+        experimental_capabilities: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> InitializationOptions:
+        return super().create_initialization_options(
+            notification_options or NotificationOptions(tools_changed=True),
+            experimental_capabilities,
+        )
+
+
 class SkillMCPServer:
     """Skill MCP Server - exposes skills as MCP tools.
 
@@ -45,6 +98,17 @@ class SkillMCPServer:
         """
         self.settings = settings
 
+        # Connected sessions, used to push notifications outside of requests
+        self._sessions: weakref.WeakSet[ServerSession] = weakref.WeakSet()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        # Tool definitions last served to clients (event loop only)
+        self._listed_tools: Optional[list[Tool]] = None
+        self.watcher: Optional[BaseWatcher] = None
+        self.workspaces: Optional[WorkspaceManager] = (
+            WorkspaceManager(settings.workspace_dir) if settings.session_workspaces else None
+        )
+
         # Ensure directories exist
         self.settings.ensure_directories()
 
@@ -66,35 +130,78 @@ class SkillMCPServer:
     def _init_skill_manager(self) -> None:
         """Initialize the skill manager."""
         self.skill_manager = SkillManager(
-            skill_dirs=[self.settings.skills_dir],
+            skill_dirs=list(self.settings.skills_dirs),
             scan_patterns=self.settings.skill_scan_patterns,
             resource_dirs=self.settings.resource_dirs,
+            index_dir=self.settings.index_dir,
+            discovery_workers=self.settings.discovery_workers,
+            content_cache_size=self.settings.content_cache_size,
         )
+        self.skill_manager.add_listener(self._on_catalog_changed)
 
     def _init_tools(self) -> None:
         """Initialize and register all tools."""
-        self.registry = ToolRegistry()
+        self.scheduler = ToolScheduler(
+            tool_limits=self.settings.tool_concurrency,
+            skill_limit=self.settings.skill_concurrency,
+            skill_limits=self.settings.skill_limits,
+            queue_size=self.settings.tool_queue_size,
+            queue_timeout=self.settings.tool_queue_timeout,
+        )
+        self.registry = ToolRegistry(scheduler=self.scheduler)
+        self.executor_factory = ExecutorFactory(
+            timeout=self.settings.script_timeout,
+            python_pool=(
+                PythonWorkerPool(
+                    idle=self.settings.python_pool_idle,
+                    max_templates=self.settings.python_pool_templates,
+                    memory_limit=self.settings.python_pool_memory,
+                )
+                if self.settings.python_pool
+                else None
+            ),
+            transpile_cache=TranspileCache(self.settings.transpile_dir),
+            output_limit=self.settings.script_output_max,
+            spill_output=self.settings.script_output_spill,
+        )
+        self.pager = ResponsePager(
+            page_chars=self.settings.response_max_chars,
+            ttl=self.settings.response_buffer_ttl,
+            max_buffer_chars=self.settings.response_buffer_max_chars,
+        )
 
         # Create tool instances
         tools = [
-            SkillLoaderTool(skill_manager=self.skill_manager),
+            SkillLoaderTool(
+                skill_manager=self.skill_manager,
+                usage=UsageHistory(self.settings.usage_path),
+                pinned=self.settings.pinned_skills,
+                max_skills=self.settings.catalog_max_skills,
+                max_chars=self.settings.catalog_max_chars,
+                max_tokens=self.settings.catalog_max_tokens,
+            ),
             SkillListerTool(
                 skill_manager=self.skill_manager,
                 skills_dir=self.settings.skills_dir,
             ),
+            SkillSearchTool(skill_manager=self.skill_manager),
             ResourceReaderTool(
                 skill_manager=self.skill_manager,
                 file_validator=self.file_validator,
+                pager=self.pager,
             ),
             ScriptExecutorTool(
                 skill_manager=self.skill_manager,
                 file_validator=self.file_validator,
                 workspace_dir=self.settings.workspace_dir,
                 script_timeout=self.settings.script_timeout,
+                pager=self.pager,
+                executor_factory=self.executor_factory,
             ),
             FileReaderTool(
                 workspace_dir=self.settings.workspace_dir,
                 file_validator=self.file_validator,
+                pager=self.pager,
             ),
             FileWriterTool(
                 workspace_dir=self.settings.workspace_dir,
@@ -104,6 +211,7 @@ class SkillMCPServer:
                 workspace_dir=self.settings.workspace_dir,
                 file_validator=self.file_validator,
             ),
+            ReadMoreTool(pager=self.pager),
         ]
 
         self.registry.register_many(tools)
@@ -111,7 +219,8 @@ class SkillMCPServer:
 
     def _init_mcp_server(self) -> None:
         """Initialize the MCP server and handlers."""
-        self.server = Server("skill-mcp-server")
+        self.server = _SkillServer("skill-mcp-server")
+        self.server.workspaces = self.workspaces
         self._setup_handlers()
 
     def _setup_handlers(self) -> None:
@@ -120,47 +229,217 @@ class SkillMCPServer:
         @self.server.list_tools()
         async def list_tools():
             """Handle list_tools request."""
-            return self.registry.list_tools()
+            self._track_session()
+            self._listed_tools = self.registry.list_tools()
+            return self._listed_tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool invocation."""
+            self._track_session()
+            token = current_progress.set(self._progress_reporter())
             try:
-                tool = self.registry.get_or_raise(name)
-                result = tool.execute(**arguments)
+                result = await self.registry.call(name, arguments)
             except ToolNotFoundError:
                 result = f"Unknown tool: {name}"
+            except ToolBusyError as e:
+                result = f"Error: {e}"
             except Exception as e:
                 logger.exception(f"Tool {name} failed")
                 result = f"Error: {e}"
+            finally:
+                current_progress.reset(token)
 
             return [TextContent(type="text", text=result)]
 
+    def _track_session(self) -> None:
+        """Remember the session of the current request for notifications."""
+        with contextlib.suppress(LookupError):
+            self._sessions.add(self.server.request_context.session)
+
+    def _progress_reporter(self) -> Optional[ProgressReporter]:
+        """Create a progress reporter for the current request.
+
+        Returns:
+            ProgressReporter sending to the client, or None if the request
+            carries no progress token.
+        """
+        ctx = self.server.request_context
+        progress_token = ctx.meta.progressToken if ctx.meta else None
+        if progress_token is None:
+            return None
+
+        async def send(progress: float, message: str) -> None:
+            await ctx.session.send_progress_notification(
+                progress_token,
+                progress,
+                message=message,
+                related_request_id=str(ctx.request_id),
+            )
+
+        return ProgressReporter(
+            send,
+            interval=self.settings.progress_interval,
+            max_chars=self.settings.progress_max_chars,
+        )
+
+    def _on_catalog_changed(self, diff: CatalogDiff) -> None:
+        """Notify connected clients that the tool list changed.
+
+        Called by the skill manager from any thread; the notification is
+        sent from the server's event loop. Added and removed skills are
+        always announced. Edits to existing skills only are announced if
+        they changed the tool definitions, so editing a skill's body
+        does not make clients re-list the tools.
+
+        Args:
+            diff: Catalog changes.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._schedule_list_changed, bool(diff.added or diff.removed))
+
+    def _schedule_list_changed(self, always: bool = True) -> None:
+        """Send tools/list_changed to every known session (event loop only).
+
+        Args:
+            always: Send even if the tool definitions equal those last
+                listed by a client.
+        """
+        if (
+            not always
+            and self._listed_tools is not None
+            and self.registry.list_tools() == self._listed_tools
+        ):
+            return
+        for session in list(self._sessions):
+            task = asyncio.ensure_future(self._send_list_changed(session))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _send_list_changed(self, session: ServerSession) -> None:
+        """Send a tools/list_changed notification to one session.
+
+        Args:
+            session: Target session.
+        """
+        try:
+            await session.send_tool_list_changed()
+        except Exception as e:
+            # The session may have gone away; it will drop out of the WeakSet
+            logger.debug(f"Failed to send tools/list_changed: {e}")
+
+    def _start_watcher(self) -> None:
+        """Start the skill directory watcher if enabled."""
+        if not self.settings.watch:
+            return
+
+        try:
+            self.watcher = create_watcher(
+                self.skill_manager,
+                backend=self.settings.watch_backend,
+                debounce=self.settings.watch_debounce,
+                poll_interval=self.settings.watch_poll_interval,
+            )
+            self.watcher.start()
+        except WatcherError as e:
+            logger.warning(f"Cannot start {self.settings.watch_backend} watcher ({e}), polling")
+            self.watcher = create_watcher(
+                self.skill_manager,
+                backend="poll",
+                poll_interval=self.settings.watch_poll_interval,
+            )
+            self.watcher.start()
+
+    def _stop_watcher(self) -> None:
+        """Stop the skill directory watcher if running."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get runtime statistics.
+
+        Returns:
+            JSON-serializable statistics; "tools" holds the admission
+            lanes of tools and skills (see ToolScheduler.stats), "pager"
+            the buffered remainders of paged responses, "runtimes" the
+            script runtimes found at start, "transpile_cache" the
+            compiled TypeScript scripts' hit counters and, with the
+            Python worker pool, "python_pool" its preloading templates.
+        """
+        stats = {"tools": self.scheduler.stats(), "pager": self.pager.stats()}
+        if self.executor_factory.python_pool is not None:
+            stats["python_pool"] = self.executor_factory.python_pool.stats()
+        if self.executor_factory.runtimes:
+            stats["runtimes"] = {
+                info.command: {"path": info.path, "version": info.version}
+                for info in self.executor_factory.runtimes.values()
+            }
+        if self.executor_factory.transpile_cache is not None:
+            stats["transpile_cache"] = self.executor_factory.transpile_cache.stats()
+        return stats
+
     async def run(self) -> None:
         """Run the MCP server.
 
-        This starts the server and listens for MCP protocol
-        messages on stdin/stdout.
+        This starts the server and listens for MCP protocol messages on
+        stdin/stdout, or on HTTP when settings.transport is "http".
+
+        Raises:
+            ConfigurationError: If the transport is unknown.
         """
+        if self.settings.transport not in ("stdio", "http"):
+            raise ConfigurationError(f"Unknown transport: {self.settings.transport}")
+
         logger.info("Starting Skill MCP Server...")
 
         # Pre-load skills
         skills = self.skill_manager.all()
         logger.info(f"Loaded {len(skills)} skills: {[s.name for s in skills]}")
 
+        self._loop = asyncio.get_running_loop()
+        self._start_watcher()
+        self._start_python_pool()
+        await anyio.to_thread.run_sync(self.executor_factory.probe_runtimes)
+
         # Start the server
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            if self.settings.transport == "http":
+                # Imported here so stdio servers do not load uvicorn/starlette
+                from .http import serve_http
+
+                await serve_http(self.server, self.settings, self.stats)
+            else:
+                async with stdio_server() as (read_stream, write_stream):
+                    await self.server.run(
+                        read_stream,
+                        write_stream,
+                        self.server.create_initialization_options(),
+                    )
+        finally:
+            self._stop_watcher()
+            self.executor_factory.close()
+            self._loop = None
+
+    def _start_python_pool(self) -> None:
+        """Warm up the Python worker pool, if enabled, before the first call."""
+        pool = self.executor_factory.python_pool
+        if pool is None:
+            return
+        try:
+            pool.start()
+            logger.info(f"Python worker pool started ({pool.idle} idle interpreters)")
+        except PoolError as e:
+            logger.warning(f"Python worker pool unavailable, scripts start cold: {e}")
 
 
 def create_server(
     skills_dir: Optional[Path] = None,
     workspace_dir: Optional[Path] = None,
     verbose: bool = False,
+    **overrides: Any,
 ) -> SkillMCPServer:
     """Create a configured SkillMCPServer instance.
 
@@ -170,6 +449,7 @@ def create_server(
         skills_dir: Path to skills directory.
         workspace_dir: Path to workspace directory.
         verbose: Enable verbose logging.
+        **overrides: Other Settings fields (see Settings).
 
     Returns:
         Configured SkillMCPServer instance.
@@ -190,6 +470,7 @@ def create_server(
         skills_dir=skills_dir,
         workspace_dir=workspace_dir,
         verbose=verbose,
+        **overrides,
     )
 
     return SkillMCPServer(settings)
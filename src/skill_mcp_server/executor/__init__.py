@@ -4,10 +4,12 @@
 """Script execution module for Skill MCP Server."""
 
 from .base import BaseExecutor, ExecutionError, ExecutionResult
-from .factory import ExecutorFactory, get_executor
+from .factory import ExecutorFactory, RuntimeInfo, get_executor
 from .node import NodeExecutor, TypeScriptExecutor
+from .pool import PoolError, PythonWorkerPool
 from .python import PythonExecutor
 from .shell import ShellExecutor
+from .transpile import TranspileCache
 
 __all__ = [
     "BaseExecutor",
@@ -19,4 +21,8 @@ __all__ = [
     "TypeScriptExecutor",
     "ExecutorFactory",
     "get_executor",
+    "RuntimeInfo",
+    "PythonWorkerPool",
+    "PoolError",
+    "TranspileCache",
 ]
@@ -0,0 +1,287 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Fork server of the warm Python worker pool (see pool.PythonWorkerPool).
+
+Run as a script, not imported: `python _forkserver.py CONTROL_FD IDLE
+[MODULE ...]`. It imports the given modules once, keeps IDLE forked
+children waiting for work, and for every job received on the control
+socket hands the job to an idle child, which runs the script with runpy
+as `python script.py args...` would. Only the standard library is used,
+so scripts do not find the server's packages already imported.
+
+Protocol: each job is one message on the control socket (SOCK_SEQPACKET)
+holding a JSON object {"script", "args", "cwd"} and three file
+descriptors: the write ends of the stdout and stderr pipes and a status
+socket. The fork server writes the child's pid, then its exit code
+(negative for a signal), each on its own line, to the status socket.
+Closing the control socket stops the idle children; the fork server
+exits once the running ones have exited and been reported.
+"""
+
+import atexit
+import contextlib
+import gc
+import json
+import os
+import runpy
+import select
+import signal
+import socket
+import sys
+import threading
+import traceback
+from collections import deque
+
+# Maximum size of a job message
+MAX_MESSAGE = 1 << 20
+
+
+class _ForkServer:
+    """Keeps idle children and dispatches jobs to them."""
+
+    def __init__(self, control, idle):
+        self.control = control
+        self.idle_target = max(1, idle)
+        self.idle = deque()  # (pid, socket) of children waiting for a job
+        self.running = {}  # pid -> status socket
+        self.dispatching = []  # descriptors of the job being handed over
+
+        self.wake_r, wake_w = os.pipe()
+        os.set_blocking(self.wake_r, False)
+        os.set_blocking(wake_w, False)
+        signal.set_wakeup_fd(wake_w)
+        signal.signal(signal.SIGCHLD, lambda _signum, _frame: None)
+        self.wake_w = wake_w
+
+    def serve(self):
+        """Serve jobs until the control socket closes.
+
+        Returns:
+            None in the fork server; (job, fds) in a child given a job.
+        """
+        while True:
+            while len(self.idle) < self.idle_target:
+                job = self._fork_idle()
+                if job is not None:
+                    return job
+
+            readable, _, _ = select.select([self.control, self.wake_r], [], [])
+            if self.wake_r in readable:
+                self._reap()
+            if self.control in readable:
+                try:
+                    message, fds, _, _ = socket.recv_fds(self.control, MAX_MESSAGE, 3)
+                except InterruptedError:
+                    continue
+                if not message:
+                    self._drain()
+                    return None
+                job = self._dispatch(message, fds)
+                if job is not None:
+                    return job
+
+    def _drain(self):
+        """Stop idle children and wait for running ones to report them."""
+        for _, sock in self.idle:
+            sock.close()
+        while self.running:
+            select.select([self.wake_r], [], [])
+            self._reap()
+
+    def _fork_idle(self):
+        """Fork one idle child.
+
+        Returns:
+            None in the fork server; (job, fds) in the child once it got one.
+        """
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        pid = os.fork()
+        if pid:
+            theirs.close()
+            self.idle.append((pid, ours))
+            return None
+
+        # Child: drop the fork server's state, then wait for a job in a
+        # session of its own (so the pool can signal its process group)
+        os.setsid()
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.close(self.wake_r)
+        os.close(self.wake_w)
+        self.control.close()
+        ours.close()
+        for _, sock in self.idle:
+            sock.close()
+        for sock in self.running.values():
+            sock.close()
+        for fd in self.dispatching:
+            os.close(fd)
+
+        message, fds, _, _ = socket.recv_fds(theirs, MAX_MESSAGE, 3)
+        theirs.close()
+        if not message:
+            os._exit(0)
+        return json.loads(message), fds
+
+    def _dispatch(self, message, fds):
+        """Hand a job to an idle child.
+
+        Returns:
+            None in the fork server; (job, fds) in a child forked here.
+        """
+        if len(fds) != 3 or _abandoned(fds[2]):
+            for fd in fds:
+                os.close(fd)
+            return None
+
+        self.dispatching = fds
+        while True:
+            if not self.idle:
+                job = self._fork_idle()
+                if job is not None:
+                    return job
+            pid, sock = self.idle.popleft()
+            try:
+                socket.send_fds(sock, [message], fds)
+            except OSError:
+                # The idle child died; its exit is reaped later
+                sock.close()
+                continue
+            sock.close()
+            break
+        self.dispatching = []
+
+        os.close(fds[0])
+        os.close(fds[1])
+        status = socket.socket(fileno=fds[2])
+        self.running[pid] = status
+        self._report(status, pid, close=False)
+        return None
+
+    def _reap(self):
+        """Collect exited children and report the exit codes of jobs."""
+        try:
+            while os.read(self.wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        while True:
+            try:
+                pid, wait_status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            status = self.running.pop(pid, None)
+            if status is not None:
+                self._report(status, os.waitstatus_to_exitcode(wait_status), close=True)
+                continue
+            for item in self.idle:
+                if item[0] == pid:
+                    self.idle.remove(item)
+                    item[1].close()
+                    break
+
+    def _report(self, status, value, close):
+        """Write a line to a job's status socket."""
+        with contextlib.suppress(OSError):
+            status.sendall(f"{value}\n".encode())
+        if close:
+            status.close()
+
+
+def _abandoned(status_fd):
+    """Check if the pool closed a job's status socket, giving up on it."""
+    sock = socket.socket(fileno=os.dup(status_fd))
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b""
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+    finally:
+        sock.close()
+
+
+def _run(job, fds):
+    """Run a job's script in this (child) process; does not return."""
+    stdout_fd, stderr_fd, status_fd = fds
+    os.close(status_fd)
+
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    for fd in (devnull, stdout_fd, stderr_fd):
+        if fd > 2:
+            os.close(fd)
+
+    script = job["script"]
+    os.chdir(job["cwd"])
+    sys.argv = [script, *job["args"]]
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+    try:
+        runpy.run_path(script, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = _exit_code(e.code)
+    except BaseException as e:
+        # Print the traceback as the interpreter would, without our frames
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != script:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb or e.__traceback__)
+        code = 1
+    _exit(code)
+
+
+def _exit_code(code):
+    """Turn a SystemExit code into an exit status, as the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _exit(code):
+    """Exit like the interpreter, without tearing down every module.
+
+    Waits for non-daemon threads, runs atexit handlers, collects garbage
+    (closing files dropped in reference cycles) and flushes stdio. Full
+    interpreter finalization would take longer than most scripts, since
+    it touches every object inherited from the fork server.
+    """
+    shutdown = getattr(threading, "_shutdown", None)
+    if shutdown is not None:
+        shutdown()
+    atexit._run_exitfuncs()
+    gc.collect()
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(Exception):
+            stream.flush()
+    os._exit(code & 0xFF)
+
+
+def main():
+    control = socket.socket(fileno=int(sys.argv[1]))
+    idle = int(sys.argv[2])
+    for module in sys.argv[3:]:
+        try:
+            __import__(module)
+        except Exception as e:
+            print(f"forkserver: cannot preload {module}: {e}", file=sys.stderr)
+    # Keep inherited objects out of the children's garbage collections
+    gc.freeze()
+
+    job = _ForkServer(control, idle).serve()
+    if job is not None:
+        _run(*job)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import contextlib
+import os
+import signal
 import subprocess
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, TYPE_CHECKING, Callable, Optional, Union
 
-from ..config.defaults import SCRIPT_TIMEOUT
+import anyio
+
+from ..config.defaults import (
+    SCRIPT_KILL_GRACE,
+    SCRIPT_OUTPUT_DIR,
+    SCRIPT_OUTPUT_MAX,
+    SCRIPT_TIMEOUT,
+)
+from .capture import OutputCapture
+
+if TYPE_CHECKING:
+    from .pool import WorkerProcess
+
+# Receives script output as it is read: (stream name, text)
+OutputCallback = Callable[[str, str], None]
+
+# Bytes read from a script's pipe at a time
+READ_CHUNK_SIZE = 64 * 1024
 
 
 class ExecutionError(Exception):
@@ -29,12 +54,23 @@ class ExecutionResult:
         stdout: Standard output content.
         stderr: Standard error content.
         timed_out: Whether the execution timed out.
+        stdout_bytes: Bytes the script wrote to stdout.
+        stderr_bytes: Bytes the script wrote to stderr.
+        truncated: Whether stdout or stderr holds only the head and tail
+            of the output.
+        stdout_file: File holding the full stdout, if it was spilled.
+        stderr_file: File holding the full stderr, if it was spilled.
     """
 
     exit_code: int
     stdout: str
     stderr: str
     timed_out: bool = False
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    truncated: bool = False
+    stdout_file: Optional[Path] = None
+    stderr_file: Optional[Path] = None
 
     @property
     def success(self) -> bool:
@@ -45,6 +81,32 @@ class ExecutionResult:
         """
         return self.exit_code == 0 and not self.timed_out
 
+    def truncation_note(self, working_dir: Path) -> str:
+        """Describe output that was cut to its head and tail.
+
+        Args:
+            working_dir: Directory spill files are shown relative to.
+
+        Returns:
+            A status line, or "" if the output is complete.
+        """
+        if not self.truncated:
+            return ""
+        note = (
+            f"**Output**: Truncated (stdout: {self.stdout_bytes} bytes, "
+            f"stderr: {self.stderr_bytes} bytes)"
+        )
+        files = []
+        for path in (self.stdout_file, self.stderr_file):
+            if path is not None:
+                try:
+                    files.append(f"`{path.relative_to(working_dir)}`")
+                except ValueError:
+                    files.append(f"`{path}`")
+        if files:
+            note += f"; full output in {', '.join(files)}"
+        return note
+
     def format_output(self, script_name: str, working_dir: Path) -> str:
         """Format the execution result as a readable string.
 
@@ -84,6 +146,10 @@ class ExecutionResult:
                 ]
             )
 
+        note = self.truncation_note(working_dir)
+        if note:
+            parts.append(note)
+
         if self.timed_out:
             parts.append("**Status**: Execution timed out")
         elif self.success:
@@ -98,18 +164,43 @@ class BaseExecutor(ABC):
     """Abstract base class for script executors.
 
     Each executor handles a specific type of script (Python, Shell, etc.).
+    Scripts run in their own process group (session on POSIX). When a
+    script times out or its call is cancelled, the whole group gets
+    SIGTERM, then SIGKILL after kill_grace seconds, so processes the
+    script started do not outlive it.
+
+    Output is read incrementally into an OutputCapture per stream, which
+    keeps at most output_limit bytes of each (head and tail). With
+    spill_output, a stream that outgrows it is also written in full to
+    a file under SCRIPT_OUTPUT_DIR in the working directory.
     """
 
     # File extensions this executor handles
     extensions: tuple[str, ...] = ()
 
-    def __init__(self, timeout: int = SCRIPT_TIMEOUT) -> None:
+    # Name of the script language, as shown to agents
+    language: str = ""
+
+    # Seconds a script gets to exit after SIGTERM
+    kill_grace: float = SCRIPT_KILL_GRACE
+
+    def __init__(
+        self,
+        timeout: int = SCRIPT_TIMEOUT,
+        output_limit: int = SCRIPT_OUTPUT_MAX,
+        spill_output: bool = False,
+    ) -> None:
         """Initialize the executor.
 
         Args:
             timeout: Execution timeout in seconds.
+            output_limit: Bytes of each output stream kept (0 = all).
+            spill_output: Write output exceeding output_limit in full to
+                a file in the working directory.
         """
         self.timeout = timeout
+        self.output_limit = output_limit
+        self.spill_output = spill_output
 
     @abstractmethod
     def build_command(self, script_path: Path, args: list[str]) -> list[str]:
@@ -132,6 +223,11 @@ class BaseExecutor(ABC):
     ) -> ExecutionResult:
         """Execute a script.
 
+        The script has finished once it exited and its output pipes
+        closed; if that takes longer than the timeout (also when a
+        process it left in the background keeps the pipes open), its
+        process group is terminated and the result is marked timed out.
+
         Args:
             script_path: Path to the script file.
             working_dir: Working directory for execution.
@@ -147,32 +243,247 @@ class BaseExecutor(ABC):
         cmd = self.build_command(script_path, args)
 
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
                 cwd=str(working_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+        except Exception as e:
+            raise ExecutionError(f"Failed to execute script: {e}") from e
 
-            return ExecutionResult(
-                exit_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                timed_out=False,
-            )
+        stdout, stderr = self._captures(script_path, working_dir)
+        abandoned = threading.Event()
+        readers = [
+            threading.Thread(target=_pump, args=(process.stdout, stdout, abandoned), daemon=True),
+            threading.Thread(target=_pump, args=(process.stderr, stderr, abandoned), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
 
+        deadline = time.monotonic() + self.timeout
+        timed_out = False
+        try:
+            process.wait(self.timeout)
         except subprocess.TimeoutExpired:
-            return ExecutionResult(
-                exit_code=-1,
-                stdout="",
-                stderr=f"Execution timed out after {self.timeout} seconds",
-                timed_out=True,
-            )
+            timed_out = True
+            _terminate(process, self.kill_grace)
+        except BaseException:
+            _terminate(process, self.kill_grace)
+            raise
+        finally:
+            for reader in readers:
+                reader.join(max(0.0, deadline - time.monotonic()))
+            if any(reader.is_alive() for reader in readers):
+                # A process the script started in the background holds the
+                # pipes open: the script has not finished within the timeout
+                timed_out = True
+                _terminate(process, self.kill_grace)
+                # Pipes reach EOF once the group is gone, unless a process left it
+                deadline = time.monotonic() + self.kill_grace
+                for reader in readers:
+                    reader.join(max(0.0, deadline - time.monotonic()))
+                abandoned.set()
+            stdout.close()
+            stderr.close()
+
+        return self._result(process.returncode, stdout, stderr, timed_out)
+
+    async def aexecute(
+        self,
+        script_path: Path,
+        working_dir: Path,
+        args: Optional[list[str]] = None,
+        on_output: Optional[OutputCallback] = None,
+        preload: tuple[str, ...] = (),
+    ) -> ExecutionResult:
+        """Execute a script without blocking the event loop.
+
+        Same as execute(), but the process is started by spawn() (with
+        asyncio.create_subprocess_exec unless overridden) and its pipes
+        are read by the event loop, so a running script does not hold a
+        thread. If the calling task is cancelled (the client cancelled
+        the request or disconnected), the script's process group is
+        terminated before the cancellation propagates.
+
+        Output is read as it is produced; on_output, if given, is called
+        with each decoded chunk, so callers can stream it while the
+        script runs. The result holds the output kept by the executor's
+        output limit, also when the script timed out.
+
+        Args:
+            script_path: Path to the script file.
+            working_dir: Working directory for execution.
+            args: Optional command-line arguments.
+            on_output: Optional callback taking ("stdout" or "stderr",
+                text); it must not block.
+            preload: Modules the script is known to import (a hint that
+                executors may use to start it faster).
+
+        Returns:
+            ExecutionResult with output and status.
 
+        Raises:
+            ExecutionError: If execution fails unexpectedly.
+        """
+        try:
+            process = await self.spawn(script_path, working_dir, args or [], preload)
         except Exception as e:
             raise ExecutionError(f"Failed to execute script: {e}") from e
 
+        stdout, stderr = self._captures(script_path, working_dir)
+        readers = [
+            asyncio.ensure_future(_read_stream(process.stdout, "stdout", stdout, on_output)),
+            asyncio.ensure_future(_read_stream(process.stderr, "stderr", stderr, on_output)),
+        ]
+        tasks = [*readers, asyncio.ensure_future(process.wait())]
+        timed_out = False
+        try:
+            done, pending = await asyncio.wait(
+                tasks, timeout=self.timeout, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                task.result()
+            if pending:
+                timed_out = True
+                await _kill(process, self.kill_grace)
+                # Pipes reach EOF once the group is gone, unless a process left it
+                await asyncio.wait(readers, timeout=self.kill_grace)
+        except BaseException:
+            # Cancelled (or a reader failed): do not leave the script running
+            await _kill(process, self.kill_grace)
+            raise
+        finally:
+            await _cancel(tasks)
+            stdout.close()
+            stderr.close()
+
+        return self._result(process.returncode, stdout, stderr, timed_out)
+
+    async def spawn(
+        self,
+        script_path: Path,
+        working_dir: Path,
+        args: list[str],
+        _preload: tuple[str, ...] = (),
+    ) -> Union[asyncio.subprocess.Process, WorkerProcess]:
+        """Start a script for aexecute().
+
+        The script must run in a new session with stdin from /dev/null
+        and stdout/stderr piped.
+
+        Args:
+            script_path: Path to the script file.
+            working_dir: Working directory for execution.
+            args: Command-line arguments.
+            _preload: Modules the script is known to import (unused here).
+
+        Returns:
+            The started process.
+        """
+        return await self._create_process(self.build_command(script_path, args), working_dir)
+
+    async def _create_process(
+        self, cmd: list[str], working_dir: Path
+    ) -> asyncio.subprocess.Process:
+        """Start a command the way spawn() must start scripts.
+
+        Args:
+            cmd: Command as a list of strings.
+            working_dir: Working directory for execution.
+
+        Returns:
+            The started process.
+        """
+        _use_pidfd_child_watcher()
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(working_dir),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+
+    @property
+    def runtimes(self) -> tuple[str, ...]:
+        """Get the commands this executor starts scripts with.
+
+        ExecutorFactory.probe_runtimes() locates them; the executor is
+        only offered if all of them are found.
+
+        Returns:
+            Command names or paths.
+        """
+        return ()
+
+    # Deliberately not abstract: executors without runtimes have nothing to update
+    def use_runtimes(self, paths: dict[str, str]) -> None:  # noqa: B027
+        """Start scripts with located runtimes instead of bare command names.
+
+        Args:
+            paths: Absolute path of each command in runtimes.
+        """
+        pass
+
+    def _captures(
+        self, script_path: Path, working_dir: Path
+    ) -> tuple[OutputCapture, OutputCapture]:
+        """Create the captures of a script's stdout and stderr.
+
+        Args:
+            script_path: Path to the script file.
+            working_dir: Working directory for execution.
+
+        Returns:
+            Tuple of (stdout capture, stderr capture).
+        """
+        if not self.spill_output:
+            return OutputCapture(self.output_limit), OutputCapture(self.output_limit)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = working_dir / SCRIPT_OUTPUT_DIR / f"{script_path.stem}-{stamp}-{os.urandom(3).hex()}"
+        return (
+            OutputCapture(self.output_limit, Path(f"{base}.stdout.log")),
+            OutputCapture(self.output_limit, Path(f"{base}.stderr.log")),
+        )
+
+    def _result(
+        self,
+        exit_code: Optional[int],
+        stdout: OutputCapture,
+        stderr: OutputCapture,
+        timed_out: bool,
+    ) -> ExecutionResult:
+        """Build the result of a finished script.
+
+        Args:
+            exit_code: Exit code of the process.
+            stdout: Capture of its stdout.
+            stderr: Capture of its stderr.
+            timed_out: Whether the script was killed for running too long.
+
+        Returns:
+            ExecutionResult with the captured output.
+        """
+        error = stderr.text()
+        if timed_out:
+            if error.strip():
+                error = error.rstrip() + "\n"
+            error += f"Execution timed out after {self.timeout} seconds"
+        return ExecutionResult(
+            exit_code=-1 if timed_out or exit_code is None else exit_code,
+            stdout=stdout.text(),
+            stderr=error,
+            timed_out=timed_out,
+            stdout_bytes=stdout.total,
+            stderr_bytes=stderr.total,
+            truncated=stdout.truncated or stderr.truncated,
+            stdout_file=stdout.spilled,
+            stderr_file=stderr.spilled,
+        )
+
     def can_execute(self, path: Path) -> bool:
         """Check if this executor can handle the given file.
 
@@ -183,3 +494,153 @@ class BaseExecutor(ABC):
             True if this executor handles the file's extension.
         """
         return path.suffix.lower() in self.extensions
+
+
+async def _read_stream(
+    stream: Optional[asyncio.StreamReader],
+    name: str,
+    capture: OutputCapture,
+    on_output: Optional[OutputCallback],
+) -> None:
+    """Read a pipe until EOF, passing decoded chunks to a callback.
+
+    Args:
+        stream: Pipe of the process.
+        name: Stream name passed to the callback.
+        capture: Receives the raw output.
+        on_output: Optional callback taking (name, text).
+    """
+    if stream is None:
+        return
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await stream.read(READ_CHUNK_SIZE)
+        if on_output is not None:
+            text = decoder.decode(chunk, final=not chunk)
+            if text:
+                on_output(name, text)
+        if not chunk:
+            return
+        capture.write(chunk)
+
+
+def _pump(pipe: Optional[IO[bytes]], capture: OutputCapture, abandoned: threading.Event) -> None:
+    """Read a pipe until EOF in a thread (for the synchronous execute()).
+
+    Args:
+        pipe: Pipe of the process; closed at EOF.
+        capture: Receives the raw output.
+        abandoned: Set once execute() stopped waiting for the pipe;
+            output read afterwards is discarded.
+    """
+    if pipe is None:
+        return
+    with pipe:
+        while chunk := pipe.read1(READ_CHUNK_SIZE):
+            if abandoned.is_set():
+                continue
+            capture.write(chunk)
+
+
+async def _cancel(tasks: list[asyncio.Future]) -> None:
+    """Cancel a script's reader tasks and collect their outcomes.
+
+    Collecting them keeps asyncio from reporting exceptions of tasks
+    that were left behind as never retrieved.
+
+    Args:
+        tasks: Tasks started by aexecute(), finished or not.
+    """
+    for task in tasks:
+        task.cancel()
+    with anyio.CancelScope(shield=True):
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _signal_group(
+    process: Union[subprocess.Popen, asyncio.subprocess.Process, WorkerProcess], sig: int
+) -> None:
+    """Send a signal to a script's process group.
+
+    Where process groups are not available (Windows), only the script
+    itself is signalled.
+
+    Args:
+        process: Process started with start_new_session=True.
+        sig: Signal number.
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, sig)
+        elif process.returncode is None:
+            process.send_signal(sig)
+    except (ProcessLookupError, PermissionError):
+        # The group is gone, or its id was reused by another user's process
+        pass
+
+
+def _terminate(process: subprocess.Popen, grace: float) -> None:
+    """Terminate a script's process group, escalating to SIGKILL.
+
+    Args:
+        process: Process started with start_new_session=True.
+        grace: Seconds to wait for the script to exit after SIGTERM.
+    """
+    if process.poll() is None:
+        _signal_group(process, signal.SIGTERM)
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(grace)
+    # Also reaches children that ignored SIGTERM or outlived the script
+    _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+    process.wait()
+
+
+async def _kill(process: Union[asyncio.subprocess.Process, WorkerProcess], grace: float) -> None:
+    """Terminate a script's process group, escalating to SIGKILL, and reap it.
+
+    Runs to completion even if the calling task is being cancelled.
+
+    Args:
+        process: Process started by BaseExecutor.spawn().
+        grace: Seconds to wait for the script to exit after SIGTERM.
+    """
+    with anyio.CancelScope(shield=True):
+        if process.returncode is None:
+            _signal_group(process, signal.SIGTERM)
+            with anyio.move_on_after(grace):
+                await process.wait()
+        # Also reaches children that ignored SIGTERM or outlived the script
+        _signal_group(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+        await process.wait()
+
+
+_child_watcher_checked = False
+
+
+def _use_pidfd_child_watcher() -> None:
+    """Wait for subprocesses with pidfds instead of one thread each.
+
+    Before Python 3.12, asyncio's default child watcher starts a thread
+    per subprocess to wait for it. Where pidfds are available, switch to
+    PidfdChildWatcher, which the event loop polls instead (3.12 and later
+    do this by themselves).
+    """
+    global _child_watcher_checked
+    if _child_watcher_checked:
+        return
+    _child_watcher_checked = True
+
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+
+    try:
+        # Probe support: pidfd_open needs Linux 5.3+ and may be blocked by seccomp
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return
+
+    policy = asyncio.get_event_loop_policy()
+    if isinstance(policy.get_child_watcher(), asyncio.ThreadedChildWatcher):
+        watcher = asyncio.PidfdChildWatcher()
+        watcher.attach_loop(asyncio.get_running_loop())
+        policy.set_child_watcher(watcher)
@@ -0,0 +1,149 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Bounded capture of script output.
+
+A script may print far more than an agent can read or the server should
+hold. OutputCapture keeps the first and last bytes of a stream and only
+counts what lies between, so memory stays bounded however much a script
+prints. With a spill path, a stream that outgrows the limit is also
+written in full to a file the agent can read afterwards.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from ..config.defaults import SCRIPT_OUTPUT_MAX
+from ..utils.logging import get_logger
+
+logger = get_logger("executor.capture")
+
+
+class OutputCapture:
+    """Head and tail of one output stream of a script.
+
+    The first half of the limit holds the start of the stream, the second
+    half a sliding window over its end. The spill file is only created
+    once the stream outgrows the limit; until then nothing has been
+    dropped, so it still receives the complete stream.
+
+    Attributes:
+        limit: Maximum bytes kept (0 = keep everything).
+        total: Bytes written so far.
+        spill_path: File to write the full stream to if it is truncated.
+        spilled: spill_path once it has been written to, else None.
+    """
+
+    def __init__(self, limit: int = SCRIPT_OUTPUT_MAX, spill_path: Optional[Path] = None) -> None:
+        """Initialize the capture.
+
+        Args:
+            limit: Maximum bytes kept (0 = keep everything).
+            spill_path: Optional file to write the full stream to if it
+                outgrows the limit; its directory is created as needed.
+        """
+        self.limit = limit
+        self.total = 0
+        self.spill_path = spill_path
+        self.spilled: Optional[Path] = None
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._head_max = limit // 2
+        self._tail_max = limit - self._head_max
+        self._spill: Optional[BinaryIO] = None
+
+    @property
+    def truncated(self) -> bool:
+        """Check if part of the stream was dropped.
+
+        Returns:
+            True if the kept bytes are fewer than the bytes written.
+        """
+        return self.total > len(self._head) + len(self._tail)
+
+    def write(self, chunk: bytes) -> None:
+        """Add output read from the stream.
+
+        Args:
+            chunk: Raw bytes.
+        """
+        if not chunk:
+            return
+        self.total += len(chunk)
+        if not self.limit:
+            self._head += chunk
+            return
+
+        if self.total > self.limit and self._spill is None and self.spill_path is not None:
+            self._open_spill()
+        if self._spill is not None:
+            self._write_spill(chunk)
+
+        room = self._head_max - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self._tail += chunk
+            # Deleting from the front of a bytearray does not copy the rest
+            excess = len(self._tail) - self._tail_max
+            if excess > 0:
+                del self._tail[:excess]
+
+    def text(self) -> str:
+        """Decode the kept output.
+
+        Returns:
+            The whole stream, or its head and tail around a marker
+            giving the number of bytes left out.
+        """
+        if not self.truncated:
+            return (self._head + self._tail).decode("utf-8", errors="replace")
+        omitted = self.total - len(self._head) - len(self._tail)
+        return (
+            self._head.decode("utf-8", errors="replace")
+            + f"\n[... {omitted} bytes omitted ...]\n"
+            + self._tail.decode("utf-8", errors="replace")
+        )
+
+    def close(self) -> None:
+        """Close the spill file, if one was opened."""
+        if self._spill is not None:
+            try:
+                self._spill.close()
+            except OSError as e:
+                logger.warning(f"Failed to write {self.spill_path}: {e}")
+            self._spill = None
+
+    def _open_spill(self) -> None:
+        """Create the spill file and write the output kept so far to it."""
+        assert self.spill_path is not None
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # Not a with block: the file stays open across write() calls
+            # and close() closes it
+            self._spill = open(self.spill_path, "wb")  # noqa: SIM115
+        except OSError as e:
+            logger.warning(f"Cannot spill script output to {self.spill_path}: {e}")
+            self.spill_path = None
+            return
+        self.spilled = self.spill_path
+        self._write_spill(bytes(self._head + self._tail))
+
+    def _write_spill(self, data: bytes) -> None:
+        """Append to the spill file, giving up on it if that fails.
+
+        Args:
+            data: Raw bytes.
+        """
+        assert self._spill is not None
+        try:
+            self._spill.write(data)
+        except OSError as e:
+            logger.warning(f"Stopped spilling script output to {self.spill_path}: {e}")
+            self._spill.close()
+            self._spill = None
+            self.spill_path = None
+            self.spilled = None
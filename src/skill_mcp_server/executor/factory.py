@@ -5,39 +5,107 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from ..config.defaults import SCRIPT_TIMEOUT
+from ..config.defaults import SCRIPT_OUTPUT_MAX, SCRIPT_TIMEOUT
+from ..utils.logging import get_logger
 from .base import BaseExecutor, ExecutionError
 from .node import NodeExecutor, TypeScriptExecutor
+from .pool import PythonWorkerPool
 from .python import PythonExecutor
 from .shell import ShellExecutor
+from .transpile import TranspileCache
+
+logger = get_logger("executor.factory")
+
+# Seconds a runtime gets to print its version
+RUNTIME_PROBE_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class RuntimeInfo:
+    """A script runtime located by ExecutorFactory.probe_runtimes().
+
+    Attributes:
+        command: Command name (or path) executors asked for.
+        path: Absolute path it resolved to, or None if not found.
+        version: First line of its --version output ("" if unknown).
+    """
+
+    command: str
+    path: Optional[str] = None
+    version: str = ""
+
+    @property
+    def available(self) -> bool:
+        """Check if the runtime was found.
+
+        Returns:
+            True if it can be started.
+        """
+        return self.path is not None
 
 
 class ExecutorFactory:
     """Factory for creating script executors.
 
     Maintains a registry of executors and selects the appropriate
-    one based on file extension.
+    one based on file extension. After probe_runtimes(), executors run
+    their runtimes by absolute path, and executors whose runtime is
+    missing are no longer offered.
     """
 
-    def __init__(self, timeout: int = SCRIPT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        timeout: int = SCRIPT_TIMEOUT,
+        python_pool: Optional[PythonWorkerPool] = None,
+        transpile_cache: Optional[TranspileCache] = None,
+        output_limit: int = SCRIPT_OUTPUT_MAX,
+        spill_output: bool = False,
+    ) -> None:
         """Initialize the factory.
 
         Args:
             timeout: Default timeout for executors.
+            python_pool: Optional warm pool for the Python executor.
+            transpile_cache: Optional cache of compiled TypeScript
+                scripts for the TypeScript executor.
+            output_limit: Bytes of each script output stream kept by
+                executors (0 = all).
+            spill_output: Have executors write output exceeding
+                output_limit to a file in the working directory.
         """
         self.timeout = timeout
+        self.output_limit = output_limit
+        self.spill_output = spill_output
+        self.python_pool = python_pool
+        self.transpile_cache = transpile_cache
+        self.runtimes: dict[str, RuntimeInfo] = {}
+        # Incremented whenever the set of available executors changes
+        self.generation = 0
         self._executors: list[BaseExecutor] = []
+        self._missing: dict[BaseExecutor, tuple[str, ...]] = {}
         self._register_defaults()
 
     def _register_defaults(self) -> None:
         """Register the default set of executors."""
-        self.register(PythonExecutor(timeout=self.timeout))
-        self.register(ShellExecutor(timeout=self.timeout))
-        self.register(NodeExecutor(timeout=self.timeout))
-        self.register(TypeScriptExecutor(timeout=self.timeout))
+        options = {
+            "timeout": self.timeout,
+            "output_limit": self.output_limit,
+            "spill_output": self.spill_output,
+        }
+        self.register(PythonExecutor(pool=self.python_pool, **options))
+        self.register(ShellExecutor(**options))
+        node = NodeExecutor(**options)
+        self.register(node)
+        self.register(
+            TypeScriptExecutor(node_cmd=node.node_cmd, cache=self.transpile_cache, **options)
+        )
 
     def register(self, executor: BaseExecutor) -> None:
         """Register an executor.
@@ -47,6 +115,49 @@ class ExecutorFactory:
         """
         self._executors.append(executor)
 
+    def probe_runtimes(self) -> dict[str, RuntimeInfo]:
+        """Locate the executors' runtimes on PATH and ask their versions.
+
+        Runtimes are probed concurrently, in threads. Executors whose
+        runtimes were all found switch to their absolute paths, so
+        starting a script no longer searches PATH; the others are left
+        out of get_executor() and get_supported_extensions().
+
+        Returns:
+            RuntimeInfo for each command, also kept in self.runtimes.
+        """
+        commands = list(dict.fromkeys(c for e in self._executors for c in e.runtimes))
+        if commands:
+            with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+                self.runtimes = dict(zip(commands, pool.map(_probe_runtime, commands), strict=True))
+
+        self._missing = {}
+        for executor in self._executors:
+            infos = [self.runtimes[command] for command in executor.runtimes]
+            missing = tuple(info.command for info in infos if not info.available)
+            if missing:
+                self._missing[executor] = missing
+                logger.warning(
+                    f"{', '.join(missing)} not found, "
+                    f"{'/'.join(executor.extensions)} scripts are disabled"
+                )
+            else:
+                executor.use_runtimes({info.command: info.path for info in infos})
+        for info in self.runtimes.values():
+            if info.available:
+                logger.info(f"Found {info.command} at {info.path} ({info.version or '?'})")
+        self.generation += 1
+        return self.runtimes
+
+    def available_executors(self) -> list[BaseExecutor]:
+        """Get the executors whose runtimes are available.
+
+        Returns:
+            Registered executors, minus those probe_runtimes() found
+            unusable.
+        """
+        return [e for e in self._executors if e not in self._missing]
+
     def get_executor(self, path: Path) -> Optional[BaseExecutor]:
         """Get an executor that can handle the given file.
 
@@ -56,11 +167,26 @@ class ExecutorFactory:
         Returns:
             Appropriate executor, or None if no executor found.
         """
-        for executor in self._executors:
+        for executor in self.available_executors():
             if executor.can_execute(path):
                 return executor
         return None
 
+    def missing_runtimes(self, path: Path) -> tuple[str, ...]:
+        """Get the runtimes missing to run a file, if that is why it can't be.
+
+        Args:
+            path: Path to the script file.
+
+        Returns:
+            Commands not found for the executor handling the file, or an
+            empty tuple.
+        """
+        for executor, missing in self._missing.items():
+            if executor.can_execute(path):
+                return missing
+        return ()
+
     def can_execute(self, path: Path) -> bool:
         """Check if any executor can handle the file.
 
@@ -79,10 +205,15 @@ class ExecutorFactory:
             Set of supported extensions.
         """
         extensions: set[str] = set()
-        for executor in self._executors:
+        for executor in self.available_executors():
             extensions.update(executor.extensions)
         return extensions
 
+    def close(self) -> None:
+        """Release the executors' resources (the Python worker pool)."""
+        if self.python_pool is not None:
+            self.python_pool.close()
+
 
 # Global factory instance
 _factory: Optional[ExecutorFactory] = None
@@ -103,12 +234,15 @@ def get_executor_factory(timeout: int = SCRIPT_TIMEOUT) -> ExecutorFactory:
     return _factory
 
 
-def get_executor(path: Path, timeout: int = SCRIPT_TIMEOUT) -> BaseExecutor:
+def get_executor(
+    path: Path, timeout: int = SCRIPT_TIMEOUT, factory: Optional[ExecutorFactory] = None
+) -> BaseExecutor:
     """Get an executor for the given file path.
 
     Args:
         path: Path to the script file.
         timeout: Execution timeout.
+        factory: Factory to ask (default: the global one).
 
     Returns:
         Appropriate executor.
@@ -116,11 +250,45 @@ def get_executor(path: Path, timeout: int = SCRIPT_TIMEOUT) -> BaseExecutor:
     Raises:
         ExecutionError: If no executor found for the file type.
     """
-    factory = get_executor_factory(timeout=timeout)
+    factory = factory or get_executor_factory(timeout=timeout)
     executor = factory.get_executor(path)
 
     if executor is None:
+        missing = factory.missing_runtimes(path)
+        if missing:
+            raise ExecutionError(
+                f"Cannot run '{path.suffix}' scripts: {', '.join(missing)} not found on the server"
+            )
         supported = ", ".join(sorted(factory.get_supported_extensions()))
         raise ExecutionError(f"No executor found for '{path.suffix}'. Supported types: {supported}")
 
     return executor
+
+
+def _probe_runtime(command: str) -> RuntimeInfo:
+    """Locate a runtime and ask its version.
+
+    Args:
+        command: Command name or path.
+
+    Returns:
+        RuntimeInfo for the command; without a path if it is not on
+        PATH or cannot be started.
+    """
+    path = shutil.which(command)
+    if path is None:
+        return RuntimeInfo(command)
+    try:
+        proc = subprocess.run(
+            [path, "--version"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=RUNTIME_PROBE_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return RuntimeInfo(command, path)
+    except OSError:
+        return RuntimeInfo(command)
+    lines = (proc.stdout or proc.stderr).strip().splitlines()
+    return RuntimeInfo(command, path, lines[0].strip() if lines else "")
@@ -5,15 +5,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
 from pathlib import Path
+from typing import Optional
 
-from .base import BaseExecutor
+import anyio
+
+from .base import BaseExecutor, ExecutionError
+from .transpile import TranspileCache
 
 
 class NodeExecutor(BaseExecutor):
     """Executor for JavaScript files (.js)."""
 
     extensions = (".js",)
+    language = "JavaScript"
 
     def __init__(self, node_cmd: str = "node", **kwargs) -> None:
         """Initialize the Node executor.
@@ -25,6 +32,13 @@ class NodeExecutor(BaseExecutor):
         super().__init__(**kwargs)
         self.node_cmd = node_cmd
 
+    @property
+    def runtimes(self) -> tuple[str, ...]:
+        return (self.node_cmd,)
+
+    def use_runtimes(self, paths: dict[str, str]) -> None:
+        self.node_cmd = paths.get(self.node_cmd, self.node_cmd)
+
     def build_command(self, script_path: Path, args: list[str]) -> list[str]:
         """Build command to execute a JavaScript file.
 
@@ -42,24 +56,55 @@ class NodeExecutor(BaseExecutor):
 
 
 class TypeScriptExecutor(BaseExecutor):
-    """Executor for TypeScript files (.ts)."""
+    """Executor for TypeScript files (.ts).
 
-    extensions = (".ts",)
+    With a TranspileCache and tsc installed, scripts are compiled once
+    and run with node; otherwise every run goes through ts-node. With a
+    cache, only node is required at start-up: ts-node is looked for when
+    a script finds no tsc.
+    """
 
-    def __init__(self, use_npx: bool = True, **kwargs) -> None:
+    extensions = (".ts",)
+    language = "TypeScript"
+
+    def __init__(
+        self,
+        use_npx: bool = True,
+        node_cmd: str = "node",
+        cache: Optional[TranspileCache] = None,
+        **kwargs,
+    ) -> None:
         """Initialize the TypeScript executor.
 
         Args:
             use_npx: Whether to use npx ts-node (default: True).
+            node_cmd: Node.js command running compiled scripts
+                (default: node).
+            cache: Optional cache of compiled scripts.
             **kwargs: Additional arguments for BaseExecutor.
         """
         super().__init__(**kwargs)
         self.use_npx = use_npx
+        self.launcher = "npx" if use_npx else "ts-node"
+        self.node_cmd = node_cmd
+        self.cache = cache
+
+    @property
+    def runtimes(self) -> tuple[str, ...]:
+        if self.cache is not None:
+            return (self.node_cmd,)
+        return (self.node_cmd, self.launcher)
+
+    def use_runtimes(self, paths: dict[str, str]) -> None:
+        self.node_cmd = paths.get(self.node_cmd, self.node_cmd)
+        self.launcher = paths.get(self.launcher, self.launcher)
 
     def build_command(self, script_path: Path, args: list[str]) -> list[str]:
         """Build command to execute a TypeScript file.
 
-        Uses npx ts-node by default for compatibility.
+        Runs the cached compiled script with node if possible, compiling
+        it first when needed (which blocks). Otherwise uses npx ts-node
+        by default for compatibility.
 
         Args:
             script_path: Path to the TypeScript file.
@@ -67,12 +112,48 @@ class TypeScriptExecutor(BaseExecutor):
 
         Returns:
             Command as a list of strings.
+
+        Raises:
+            ExecutionError: If the script does not compile, or neither
+                tsc nor ts-node is installed.
         """
-        if self.use_npx:
-            cmd = ["npx", "ts-node", str(script_path)]
+        hook = None
+        if self.cache is not None:
+            hook = self.cache.register_hook(script_path)
+            # The launcher was not probed at start-up
+            if hook is None and shutil.which(self.launcher) is None:
+                raise ExecutionError(
+                    f"Cannot run {script_path.name}: neither tsc nor {self.launcher} was found"
+                )
+
+        if hook is not None:
+            cmd = [self.node_cmd, "--require", str(hook), str(script_path)]
+        elif self.use_npx:
+            cmd = [self.launcher, "ts-node", str(script_path)]
         else:
-            cmd = ["ts-node", str(script_path)]
+            cmd = [self.launcher, str(script_path)]
 
         if args:
             cmd.extend(args)
         return cmd
+
+    async def spawn(
+        self,
+        script_path: Path,
+        working_dir: Path,
+        args: list[str],
+        _preload: tuple[str, ...] = (),
+    ) -> asyncio.subprocess.Process:
+        """Start a script, compiling it in a worker thread if needed.
+
+        Args:
+            script_path: Path to the TypeScript file.
+            working_dir: Working directory for execution.
+            args: Command-line arguments.
+            _preload: Unused.
+
+        Returns:
+            The started process.
+        """
+        cmd = await anyio.to_thread.run_sync(self.build_command, script_path, args)
+        return await self._create_process(cmd, working_dir)
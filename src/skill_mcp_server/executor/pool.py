@@ -0,0 +1,490 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Warm pool of pre-forked Python interpreters.
+
+Starting an interpreter and importing what a script needs takes tens to
+hundreds of milliseconds, often more than the script itself. With the
+pool, a fork server (see _forkserver.py) is started once and keeps a few
+idle children forked from it. Each script runs in one of them through
+runpy, with the same argv, working directory, stdin (/dev/null),
+stdout/stderr pipes, process group and exit code as `python script.py`.
+A child runs a single script and exits, so scripts share no state.
+
+The pool needs fork() and descriptor passing (POSIX). PythonExecutor
+starts a fresh interpreter when the pool cannot be used.
+
+Skills whose scripts import heavy libraries can list them as `preload`
+in SKILL.md; frequently used lists get a template fork server that has
+imported them already (see PythonWorkerPool).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import anyio
+
+from ..config.defaults import PYTHON_POOL_IDLE, PYTHON_POOL_MEMORY, PYTHON_POOL_TEMPLATES
+from ..utils.logging import get_logger
+from .base import ExecutionError
+
+logger = get_logger("executor.pool")
+
+# Fork server script, run by path so it does not import this package
+FORKSERVER_SCRIPT = Path(__file__).with_name("_forkserver.py")
+
+# Seconds to wait for a fork server to start a script (including its imports)
+DISPATCH_TIMEOUT = 30.0
+
+# Calls asking for a preload list before it gets a template
+TEMPLATE_MIN_USES = 2
+
+# Preload lists whose use is counted before the oldest are forgotten
+MAX_TRACKED_PRELOADS = 256
+
+# Seconds between checks of the templates' memory when no template is added
+MEMORY_CHECK_INTERVAL = 5.0
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class PoolError(Exception):
+    """Raised when the pool cannot run a script."""
+
+    pass
+
+
+class WorkerProcess:
+    """A script running in a pool child.
+
+    Provides the parts of asyncio.subprocess.Process that executors use:
+    pid, returncode, stdout, stderr, wait() and send_signal(). The child
+    leads its own process group, like a process started with
+    start_new_session=True.
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        status: asyncio.StreamReader,
+        status_writer: asyncio.StreamWriter,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+    ) -> None:
+        self.pid = pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+        self._status = status
+        self._status_writer = status_writer
+        self._waiter: Optional[asyncio.Future[int]] = None
+
+    async def wait(self) -> int:
+        """Wait for the script to exit.
+
+        Returns:
+            Exit code, negative if killed by a signal (-1 if the fork
+            server went away first).
+        """
+        if self._waiter is None:
+            self._waiter = asyncio.ensure_future(self._read_status())
+        return await asyncio.shield(self._waiter)
+
+    def send_signal(self, sig: int) -> None:
+        """Send a signal to the script."""
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    async def _read_status(self) -> int:
+        """Read the exit code the fork server reports."""
+        line = await self._status.readline()
+        try:
+            self.returncode = int(line)
+        except ValueError:
+            self.returncode = -1
+        self._status_writer.close()
+        return self.returncode
+
+
+class _Template:
+    """A fork server together with the modules it preloaded."""
+
+    def __init__(self, python: str, idle: int, preload: tuple[str, ...]) -> None:
+        self.python = python
+        self.idle = idle
+        self.preload = preload
+        self.process: Optional[subprocess.Popen] = None
+        self.control: Optional[socket.socket] = None
+
+    def ensure_started(self) -> socket.socket:
+        """Start the fork server unless it is running.
+
+        Returns:
+            Control socket of the fork server.
+        """
+        if self.control is not None and self.process is not None:
+            if self.process.poll() is None:
+                return self.control
+            logger.warning(f"Python fork server exited with code {self.process.returncode}")
+            self.stop()
+
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.process = subprocess.Popen(
+                [
+                    self.python,
+                    str(FORKSERVER_SCRIPT),
+                    str(theirs.fileno()),
+                    str(self.idle),
+                    *self.preload,
+                ],
+                pass_fds=[theirs.fileno()],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError as e:
+            ours.close()
+            raise PoolError(f"Cannot start the Python fork server: {e}") from e
+        finally:
+            theirs.close()
+
+        # Jobs are small; a full queue means the fork server is stuck
+        ours.settimeout(DISPATCH_TIMEOUT)
+        self.control = ours
+        logger.debug(
+            f"Started Python fork server (pid {self.process.pid}, {self.idle} idle, "
+            f"preloading {', '.join(self.preload) or 'nothing'})"
+        )
+        return ours
+
+    def stop(self, control: Optional[socket.socket] = None) -> Optional[subprocess.Popen]:
+        """Stop the fork server, unless it was replaced since `control`.
+
+        Closing the control socket makes the fork server stop its idle
+        children and exit once its running scripts have exited.
+
+        Returns:
+            The fork server process, still to be reaped, or None.
+        """
+        if self.control is None or (control is not None and control is not self.control):
+            return None
+        self.control.close()
+        self.control = None
+        process, self.process = self.process, None
+        return process
+
+    def rss(self) -> int:
+        """Get the resident memory of the fork server in bytes (0 if unknown)."""
+        if self.process is None:
+            return 0
+        try:
+            with open(f"/proc/{self.process.pid}/statm") as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            return 0
+
+
+class PythonWorkerPool:
+    """Runs Python scripts in children of warm fork servers.
+
+    Scripts normally run in children of the base fork server, which
+    imports nothing beyond what the pool itself needs. Skills can list
+    modules their scripts import (`preload` in SKILL.md); once a preload
+    list has been asked for TEMPLATE_MIN_USES times, a template fork
+    server that imported those modules is started for it, and its
+    children skip the import time. Templates are kept in LRU order: the
+    least recently used are stopped when there are more than
+    max_templates or their resident memory exceeds memory_limit (where
+    /proc is available; checked when a template is added, otherwise at
+    most every MEMORY_CHECK_INTERVAL seconds). Until then, and after
+    eviction, such scripts run in the base fork server and import their
+    modules themselves.
+
+    Fork servers are started on first use (or by start()) and again if
+    they die. Thread-safe, except that spawn() must run on an event loop.
+    """
+
+    def __init__(
+        self,
+        idle: int = PYTHON_POOL_IDLE,
+        max_templates: int = PYTHON_POOL_TEMPLATES,
+        memory_limit: int = PYTHON_POOL_MEMORY,
+        python: str = sys.executable,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            idle: Children each fork server keeps forked and waiting.
+            max_templates: Maximum template fork servers with preloaded
+                modules (0 = never preload).
+            memory_limit: Maximum resident bytes of all templates
+                (0 = no limit).
+            python: Interpreter to run the fork servers with.
+        """
+        self.idle = max(1, idle)
+        self.max_templates = max(0, max_templates)
+        self.memory_limit = max(0, memory_limit)
+        self.python = python
+        self._base = _Template(python, self.idle, ())
+        self._templates: OrderedDict[tuple[str, ...], _Template] = OrderedDict()
+        # Times each preload list without a template was asked for
+        self._uses: OrderedDict[tuple[str, ...], int] = OrderedDict()
+        # Stopped fork servers still waiting for their scripts to exit
+        self._retired: list[subprocess.Popen] = []
+        self._memory_checked = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supported() -> bool:
+        """Check that the platform supports the pool."""
+        return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+    def start(self) -> None:
+        """Start the base fork server unless it is running.
+
+        Raises:
+            PoolError: If the platform lacks support or the fork server
+                cannot be started.
+        """
+        if not self.supported():
+            raise PoolError("Python worker pool needs fork() and descriptor passing")
+        with self._lock:
+            self._base.ensure_started()
+
+    async def spawn(
+        self,
+        script_path: Path,
+        args: list[str],
+        working_dir: Path,
+        preload: tuple[str, ...] = (),
+    ) -> WorkerProcess:
+        """Start a script in a pool child.
+
+        The job is handed to the fork server in a worker thread, since a
+        busy fork server can keep the control socket full for a while.
+        Once it has been handed over, the script may run, so this does
+        not return early when cancelled: it waits for the pid, so that
+        the caller gets a process it can kill.
+
+        Args:
+            script_path: Path to the Python script.
+            args: Command-line arguments.
+            working_dir: Working directory for the script.
+            preload: Modules the script imports, from its skill.
+
+        Returns:
+            WorkerProcess of the running script.
+
+        Raises:
+            PoolError: If the script could not be handed to the pool (it
+                can be started another way).
+            ExecutionError: If the fork server took the script but did
+                not report starting it.
+        """
+        if not self.supported():
+            raise PoolError("Python worker pool needs fork() and descriptor passing")
+
+        message = json.dumps(
+            {"script": str(script_path), "args": args, "cwd": str(working_dir)}
+        ).encode()
+        stdout_r, stdout_w = os.pipe()
+        stderr_r, stderr_w = os.pipe()
+        ours, theirs = socket.socketpair()
+        try:
+            with anyio.CancelScope(shield=True):
+                template, control = await anyio.to_thread.run_sync(
+                    self._send, preload, message, [stdout_w, stderr_w, theirs.fileno()]
+                )
+        except BaseException:
+            os.close(stdout_r)
+            os.close(stderr_r)
+            ours.close()
+            raise
+        finally:
+            os.close(stdout_w)
+            os.close(stderr_w)
+            theirs.close()
+
+        # The script may be running from here on: get its pid even if the
+        # caller is cancelled meanwhile, so that it can be killed
+        pipes = [stdout_r, stderr_r]
+        transports: list[asyncio.BaseTransport] = []
+        status_writer: Optional[asyncio.StreamWriter] = None
+        with anyio.CancelScope(shield=True):
+            try:
+                loop = asyncio.get_running_loop()
+                stdout = await _pipe_reader(loop, pipes.pop(0), transports)
+                stderr = await _pipe_reader(loop, pipes.pop(0), transports)
+                status, status_writer = await asyncio.open_unix_connection(sock=ours)
+                with anyio.fail_after(DISPATCH_TIMEOUT):
+                    pid = int(await status.readline())
+            except BaseException as e:
+                # Closing the status socket tells the fork server to drop
+                # the job if it has not dispatched it yet
+                if status_writer is not None:
+                    status_writer.close()
+                else:
+                    ours.close()
+                for transport in transports:
+                    transport.close()
+                for fd in pipes:
+                    os.close(fd)
+                with self._lock:
+                    self._retire(template.stop(control))
+                if isinstance(e, (TimeoutError, ValueError)):
+                    raise ExecutionError("Python fork server did not start the script") from e
+                raise
+
+        return WorkerProcess(pid, status, status_writer, stdout, stderr)
+
+    def _send(
+        self, preload: tuple[str, ...], message: bytes, fds: list[int]
+    ) -> tuple[_Template, socket.socket]:
+        """Hand a job to the fork server for its preload list (blocks).
+
+        Args:
+            preload: Modules the script imports.
+            message: Encoded job.
+            fds: stdout, stderr and status descriptors for the script.
+
+        Returns:
+            The template and the control socket the job was sent on.
+
+        Raises:
+            PoolError: If the fork server could not be started or did
+                not take the job.
+        """
+        with self._lock:
+            template = self._template(preload)
+            control = template.ensure_started()
+        try:
+            socket.send_fds(control, [message], fds)
+        except OSError as e:
+            with self._lock:
+                self._retire(template.stop(control))
+            raise PoolError(f"Fork server not responding: {e}") from e
+        return template, control
+
+    def stats(self) -> dict[str, Any]:
+        """Get the running templates and their memory use."""
+        with self._lock:
+            templates = [
+                {"preload": list(key), "rss": template.rss()}
+                for key, template in self._templates.items()
+            ]
+        return {
+            "templates": templates,
+            "max_templates": self.max_templates,
+            "memory_limit": self.memory_limit,
+        }
+
+    def close(self) -> None:
+        """Stop all fork servers and their idle children.
+
+        Scripts already running are not affected.
+        """
+        with self._lock:
+            self._retire(self._base.stop())
+            while self._templates:
+                self._retire(self._templates.popitem()[1].stop())
+
+    def _template(self, preload: tuple[str, ...]) -> _Template:
+        """Pick the fork server for a script (the caller holds the lock)."""
+        self._retired = [p for p in self._retired if p.poll() is None]
+
+        key = tuple(dict.fromkeys(preload))
+        if not key or not self.max_templates:
+            return self._base
+
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            # Reading /proc for every template is too slow for each call;
+            # templates mostly grow while they import their modules
+            if time.monotonic() - self._memory_checked >= MEMORY_CHECK_INTERVAL:
+                self._check_memory()
+            return template
+
+        uses = self._uses.pop(key, 0) + 1
+        if uses < TEMPLATE_MIN_USES:
+            self._uses[key] = uses
+            if len(self._uses) > MAX_TRACKED_PRELOADS:
+                self._uses.popitem(last=False)
+            return self._base
+
+        template = self._templates[key] = _Template(self.python, self.idle, key)
+        self._evict()
+        return template
+
+    def _evict(self) -> None:
+        """Stop least recently used templates beyond the limits."""
+        while len(self._templates) > self.max_templates:
+            self._drop_oldest("too many templates")
+        self._check_memory()
+
+    def _check_memory(self) -> None:
+        """Stop least recently used templates beyond the memory limit."""
+        if not self.memory_limit:
+            return
+        self._memory_checked = time.monotonic()
+        total = sum(template.rss() for template in self._templates.values())
+        # The most recently used template is always kept
+        while total > self.memory_limit and len(self._templates) > 1:
+            total -= self._drop_oldest("memory limit reached")
+
+    def _drop_oldest(self, reason: str) -> int:
+        """Stop the least recently used template.
+
+        Returns:
+            Resident bytes it used.
+        """
+        key, template = self._templates.popitem(last=False)
+        rss = template.rss()
+        self._retire(template.stop())
+        logger.debug(f"Evicted Python template {', '.join(key)} ({reason})")
+        return rss
+
+    def _retire(self, process: Optional[subprocess.Popen]) -> None:
+        """Keep a stopped fork server until it has exited, to reap it."""
+        if process is not None and process.poll() is None:
+            self._retired.append(process)
+
+
+async def _pipe_reader(
+    loop: asyncio.AbstractEventLoop, fd: int, transports: list[asyncio.BaseTransport]
+) -> asyncio.StreamReader:
+    """Read the end of a pipe through the event loop.
+
+    Args:
+        loop: Running event loop.
+        fd: Read end of the pipe; owned by the reader from now on (closed
+            here if the reader cannot be set up).
+        transports: List to append the pipe's transport to, so that the
+            caller can close it if the script does not start.
+
+    Returns:
+        StreamReader of the pipe.
+    """
+    reader = asyncio.StreamReader()
+    pipe = os.fdopen(fd, "rb", buffering=0)
+    try:
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+    except BaseException:
+        pipe.close()
+        raise
+    transports.append(transport)
+    return reader
@@ -5,16 +5,47 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
+from typing import Optional, Union
 
+from ..config.defaults import SCRIPT_TIMEOUT
+from ..utils.logging import get_logger
 from .base import BaseExecutor
+from .pool import PoolError, PythonWorkerPool, WorkerProcess
+
+logger = get_logger("executor.python")
 
 
 class PythonExecutor(BaseExecutor):
-    """Executor for Python scripts (.py files)."""
+    """Executor for Python scripts (.py files).
+
+    With a PythonWorkerPool, aexecute() runs scripts in pre-forked warm
+    interpreters instead of starting a new one per script, falling back
+    to a new interpreter if the pool fails. execute() always starts a
+    new interpreter.
+    """
 
     extensions = (".py",)
+    language = "Python"
+
+    def __init__(
+        self, timeout: int = SCRIPT_TIMEOUT, pool: Optional[PythonWorkerPool] = None, **kwargs
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            timeout: Execution timeout in seconds.
+            pool: Optional warm worker pool to run scripts in.
+            **kwargs: Additional arguments for BaseExecutor.
+        """
+        super().__init__(timeout, **kwargs)
+        self.pool = pool
+
+    @property
+    def runtimes(self) -> tuple[str, ...]:
+        return (sys.executable,)
 
     def build_command(self, script_path: Path, args: list[str]) -> list[str]:
         """Build command to execute a Python script.
@@ -32,3 +63,30 @@ class PythonExecutor(BaseExecutor):
         if args:
             cmd.extend(args)
         return cmd
+
+    async def spawn(
+        self,
+        script_path: Path,
+        working_dir: Path,
+        args: list[str],
+        preload: tuple[str, ...] = (),
+    ) -> Union[asyncio.subprocess.Process, WorkerProcess]:
+        """Start a script, in the worker pool if there is one.
+
+        Args:
+            script_path: Path to the Python script.
+            working_dir: Working directory for execution.
+            args: Command-line arguments.
+            preload: Modules the script imports; the pool runs it in a
+                template that imported them, once there is one.
+
+        Returns:
+            The started process.
+        """
+        if self.pool is not None:
+            try:
+                return await self.pool.spawn(script_path, args, working_dir, preload)
+            except PoolError as e:
+                # The pool never got the script, so it cannot run twice
+                logger.warning(f"Worker pool failed, starting a new interpreter: {e}")
+        return await super().spawn(script_path, working_dir, args, preload)
@@ -14,6 +14,7 @@ class ShellExecutor(BaseExecutor):
     """Executor for shell scripts (.sh, .bash files)."""
 
     extensions = (".sh", ".bash")
+    language = "Shell"
 
     def __init__(self, shell: str = "bash", **kwargs) -> None:
         """Initialize the shell executor.
@@ -25,6 +26,13 @@ class ShellExecutor(BaseExecutor):
         super().__init__(**kwargs)
         self.shell = shell
 
+    @property
+    def runtimes(self) -> tuple[str, ...]:
+        return (self.shell,)
+
+    def use_runtimes(self, paths: dict[str, str]) -> None:
+        self.shell = paths.get(self.shell, self.shell)
+
     def build_command(self, script_path: Path, args: list[str]) -> list[str]:
         """Build command to execute a shell script.
 
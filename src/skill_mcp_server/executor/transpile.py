@@ -0,0 +1,348 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Content-addressed cache of TypeScript scripts compiled to JavaScript.
+
+`npx ts-node script.ts` resolves ts-node and type-checks the script on
+every run, which takes seconds before the script starts. With the cache,
+a script is compiled once with tsc (the skill's own, found in a
+node_modules/.bin above it, or the one on PATH) and later runs start
+node directly on the compiled output.
+
+An entry is keyed by the script's path and a hash of its source, the
+tsconfig.json that applies to it and the compiler version. It records
+every source file the compilation read (imported modules and
+declaration files), so editing any of them recompiles the script; a new
+entry for a script replaces the older ones.
+
+The script is run as `node -r <entry>/register.js script.ts`. The
+register hook loads each compiled .ts module from the entry instead of
+the source, so __filename, __dirname, process.argv and module resolution
+are the same as under ts-node.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils.logging import get_logger
+from .base import ExecutionError
+
+logger = get_logger("executor.transpile")
+
+# Bump whenever the layout of an entry or the compiler options change
+CACHE_VERSION = 1
+
+# Seconds tsc gets to compile a script
+COMPILE_TIMEOUT = 300.0
+
+# Options every compilation needs: CommonJS output the register hook
+# can load, written to the entry rather than next to the sources
+_FORCED_OPTIONS: dict[str, Any] = {
+    "module": "commonjs",
+    "moduleResolution": "node",
+    "verbatimModuleSyntax": False,
+    "noEmit": False,
+    "emitDeclarationOnly": False,
+    "declaration": False,
+    "composite": False,
+    "incremental": False,
+    "sourceMap": False,
+    "inlineSourceMap": False,
+}
+
+# ts-node's defaults, used for scripts without a tsconfig.json
+_DEFAULT_OPTIONS: dict[str, Any] = {
+    "target": "es2020",
+    "esModuleInterop": True,
+    "skipLibCheck": True,
+}
+
+_REGISTER_HOOK = """\
+// Generated by skill-mcp-server: loads TypeScript modules from their compiled output
+"use strict";
+const fs = require("fs");
+const compiled = %s;
+require.extensions[".ts"] = function (module, filename) {
+  const output = compiled[filename];
+  if (output === undefined) {
+    throw new Error(filename + " was not part of the compiled script; run the script again");
+  }
+  module._compile(fs.readFileSync(output, "utf8"), filename);
+};
+"""
+
+
+class TranspileCache:
+    """Compiles TypeScript scripts once and reuses the output.
+
+    Entries live under cache_dir, one directory per script and source
+    hash. Compilation happens in the calling thread; concurrent calls
+    for the same script wait for a single compilation.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to keep compiled scripts in.
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._versions: dict[str, str] = {}
+        self._hits = 0
+        self._compiles = 0
+
+    def register_hook(self, script_path: Path) -> Optional[Path]:
+        """Get the register hook running a script's compiled output.
+
+        Compiles the script if it has no valid entry yet.
+
+        Args:
+            script_path: Absolute path to the TypeScript script.
+
+        Returns:
+            Path to the entry's register.js, or None if no tsc is
+            installed.
+
+        Raises:
+            ExecutionError: If the script does not compile.
+        """
+        tsc = find_compiler(script_path)
+        if tsc is None:
+            return None
+        tsconfig = find_tsconfig(script_path)
+
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}\0{self._version(tsc)}\0".encode())
+        if tsconfig is not None:
+            digest.update(f"{tsconfig}\0".encode())
+            digest.update(tsconfig.read_bytes())
+        digest.update(b"\0")
+        digest.update(script_path.read_bytes())
+        entry = self.cache_dir / f"{_path_hash(script_path)}-{digest.hexdigest()[:32]}"
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(entry.name, threading.Lock())
+        with key_lock:
+            if _is_fresh(entry):
+                with self._lock:
+                    self._hits += 1
+                return entry / "register.js"
+            self._compile(tsc, tsconfig, script_path, entry)
+            with self._lock:
+                self._compiles += 1
+        return entry / "register.js"
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dict with the number of runs served from the cache (hits)
+            and compilations.
+        """
+        with self._lock:
+            return {"hits": self._hits, "compiles": self._compiles}
+
+    def _compile(self, tsc: Path, tsconfig: Optional[Path], script_path: Path, entry: Path) -> None:
+        """Compile a script into a cache entry, replacing older entries.
+
+        Args:
+            tsc: Compiler to run.
+            tsconfig: tsconfig.json the script's options extend, if any.
+            script_path: Absolute path to the TypeScript script.
+            entry: Entry directory to create.
+
+        Raises:
+            ExecutionError: If the script does not compile.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        build = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".build-"))
+        try:
+            anchor = script_path.anchor
+            config: dict[str, Any] = {
+                "compilerOptions": {
+                    **(_DEFAULT_OPTIONS if tsconfig is None else {}),
+                    **_FORCED_OPTIONS,
+                    "rootDir": anchor,
+                    "outDir": str(build / "out"),
+                },
+                "files": [str(script_path)],
+                "include": [],
+            }
+            if tsconfig is not None:
+                config["extends"] = str(tsconfig)
+            (build / "tsconfig.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+
+            logger.info(f"Compiling {script_path}")
+            try:
+                proc = subprocess.run(
+                    [str(tsc), "--project", str(build / "tsconfig.json"), "--listFiles"]
+                    + ["--pretty", "false"],
+                    cwd=str(script_path.parent),
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=COMPILE_TIMEOUT,
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                raise ExecutionError(f"Failed to compile {script_path.name}: {e}") from e
+
+            listed = [line.strip() for line in proc.stdout.splitlines()]
+            sources = [Path(line) for line in listed if line and Path(line).is_file()]
+            if proc.returncode != 0:
+                diagnostics = [line for line in listed if line and not Path(line).is_file()]
+                message = "\n".join(diagnostics) or proc.stderr.strip()
+                raise ExecutionError(f"TypeScript compilation failed:\n{message}")
+
+            # Every file tsc read invalidates the entry; only the .ts
+            # modules among them are loaded from the output
+            deps = {str(path): _fingerprint(path) for path in sources}
+            if tsconfig is not None:
+                deps[str(tsconfig)] = _fingerprint(tsconfig)
+            compiled: dict[str, str] = {}
+            for path in sources:
+                if path.suffix != ".ts" or path.name.endswith(".d.ts"):
+                    continue
+                output = entry / "out" / path.relative_to(anchor).with_suffix(".js")
+                if (build / output.relative_to(entry)).is_file():
+                    compiled[os.path.realpath(path)] = str(output)
+
+            (build / "register.js").write_text(
+                _REGISTER_HOOK % json.dumps(compiled, indent=2), encoding="utf-8"
+            )
+            (build / "manifest.json").write_text(json.dumps({"files": deps}), encoding="utf-8")
+
+            # Stale entries of this script (older sources, or the same
+            # source with changed dependencies) are replaced
+            for old in self.cache_dir.glob(f"{_path_hash(script_path)}-*"):
+                shutil.rmtree(old, ignore_errors=True)
+            try:
+                os.replace(build, entry)
+            except OSError:
+                # Another server compiled the same entry meanwhile
+                if not _is_fresh(entry):
+                    raise
+        finally:
+            shutil.rmtree(build, ignore_errors=True)
+
+    def _version(self, tsc: Path) -> str:
+        """Get a compiler's version, asking it once per process.
+
+        Args:
+            tsc: Compiler path.
+
+        Returns:
+            The `tsc --version` output, or "" if it could not be run.
+        """
+        key = str(tsc)
+        if key not in self._versions:
+            try:
+                proc = subprocess.run(
+                    [key, "--version"],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=COMPILE_TIMEOUT,
+                )
+                self._versions[key] = proc.stdout.strip()
+            except (OSError, subprocess.TimeoutExpired):
+                self._versions[key] = ""
+        return self._versions[key]
+
+
+def find_compiler(script_path: Path) -> Optional[Path]:
+    """Find the tsc a script should be compiled with.
+
+    Args:
+        script_path: Path to the TypeScript script.
+
+    Returns:
+        The nearest node_modules/.bin/tsc above the script, else tsc on
+        PATH, or None.
+    """
+    name = "tsc.cmd" if os.name == "nt" else "tsc"
+    for parent in script_path.parents:
+        candidate = parent / "node_modules" / ".bin" / name
+        if candidate.is_file():
+            return candidate
+    found = shutil.which("tsc")
+    return Path(found) if found else None
+
+
+def find_tsconfig(script_path: Path) -> Optional[Path]:
+    """Find the tsconfig.json that applies to a script, as tsc would.
+
+    Args:
+        script_path: Path to the TypeScript script.
+
+    Returns:
+        The nearest tsconfig.json above the script, or None.
+    """
+    for parent in script_path.parents:
+        candidate = parent / "tsconfig.json"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _path_hash(script_path: Path) -> str:
+    """Get the prefix naming all entries of one script.
+
+    Args:
+        script_path: Path to the TypeScript script.
+
+    Returns:
+        Short hex digest of the path.
+    """
+    return hashlib.sha256(str(script_path).encode()).hexdigest()[:16]
+
+
+def _fingerprint(path: Path) -> list[Any]:
+    """Get the fingerprint a dependency is checked against.
+
+    Args:
+        path: Source file.
+
+    Returns:
+        [mtime_ns, size, sha256 of the content].
+    """
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size, hashlib.sha256(path.read_bytes()).hexdigest()]
+
+
+def _is_fresh(entry: Path) -> bool:
+    """Check that an entry exists and none of its sources changed.
+
+    Files whose mtime or size changed are re-hashed, so touching a file
+    without editing it keeps the entry.
+
+    Args:
+        entry: Entry directory.
+
+    Returns:
+        True if the entry can be run.
+    """
+    try:
+        deps = json.loads((entry / "manifest.json").read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        return False
+    for name, (mtime_ns, size, sha) in deps.items():
+        try:
+            st = os.stat(name)
+            if st.st_mtime_ns == mtime_ns and st.st_size == size:
+                continue
+            if hashlib.sha256(Path(name).read_bytes()).hexdigest() != sha:
+                return False
+        except OSError:
+            return False
+    return True
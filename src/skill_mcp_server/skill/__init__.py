@@ -3,14 +3,24 @@
 
 """Skill management module for Skill MCP Server."""
 
+from .index import SkillIndex
 from .manager import SkillManager
-from .models import SkillInfo
+from .manifest import SkillManifest
+from .models import CatalogDiff, SkillInfo
 from .parser import SkillParser
 from .scanner import SkillScanner
+from .search import SearchResult, SkillSearchIndex
+from .usage import UsageHistory
 
 __all__ = [
     "SkillInfo",
     "SkillParser",
     "SkillScanner",
     "SkillManager",
+    "SkillIndex",
+    "CatalogDiff",
+    "SkillManifest",
+    "SkillSearchIndex",
+    "SearchResult",
+    "UsageHistory",
 ]
@@ -0,0 +1,121 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Byte-bounded LRU cache for skill bodies."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger("skill.cache")
+
+
+class ContentCache:
+    """LRU cache of file contents bounded by their total size.
+
+    Entries are keyed by path and validated against the file's mtime and
+    size on every lookup, so an edited file is re-read automatically.
+    Sizes are counted as the UTF-8 length of the cached text.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached contents. 0 disables caching.
+        """
+        self.max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[str, tuple[int, int, str, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, load: Callable[[Path], str]) -> str:
+        """Get the contents of a file, loading them on a miss.
+
+        Args:
+            path: File path.
+            load: Callable reading the contents of the file.
+
+        Returns:
+            File contents as returned by load.
+
+        Raises:
+            Whatever load raises.
+        """
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            # Let load() report the problem
+            self.invalidate(path)
+            return load(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        text = load(path)
+        self._put(key, st, text)
+        return text
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached contents of a file.
+
+        Args:
+            path: File path.
+        """
+        with self._lock:
+            entry = self._entries.pop(str(path), None)
+            if entry is not None:
+                self._size -= entry[3]
+
+    def clear(self) -> None:
+        """Drop all cached contents."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Get the total size of cached contents in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        """Get the number of cached files."""
+        return len(self._entries)
+
+    def _put(self, key: str, st: os.stat_result, text: str) -> None:
+        """Insert contents and evict least recently used entries over budget.
+
+        Args:
+            key: String path.
+            st: Stat result the contents were read at.
+            text: File contents.
+        """
+        nbytes = len(text.encode("utf-8"))
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            old: Optional[tuple[int, int, str, int]] = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[3]
+
+            self._entries[key] = (st.st_mtime_ns, st.st_size, text, nbytes)
+            self._size += nbytes
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted[3]
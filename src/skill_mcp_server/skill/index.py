@@ -0,0 +1,318 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Persistent skill catalog index.
+
+The index remembers, for every SKILL.md found under a skills root, the
+file's fingerprint (mtime and size) together with the parsed SkillInfo
+header. Skill bodies are not stored; they are read on demand. On the
+next start only files whose fingerprint changed are re-parsed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils.logging import get_logger
+from .models import SkillInfo
+
+logger = get_logger("skill.index")
+
+# Bump whenever the on-disk layout or the parsed fields change
+INDEX_VERSION = 4
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """A cached skill together with the fingerprint it was parsed from.
+
+    Attributes:
+        mtime_ns: Modification time of SKILL.md in nanoseconds.
+        size: Size of SKILL.md in bytes.
+        skill: The parsed skill.
+    """
+
+    mtime_ns: int
+    size: int
+    skill: SkillInfo
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Check if the entry is still valid for the given file stat.
+
+        Args:
+            st: Current stat result of the SKILL.md file.
+
+        Returns:
+            True if mtime and size are unchanged.
+        """
+        return self.mtime_ns == st.st_mtime_ns and self.size == st.st_size
+
+
+class SkillIndex:
+    """Fingerprint-keyed cache of parsed skills for one skills root.
+
+    The index always lives in memory; when a path is given it is also
+    loaded from and saved to a JSON file so that warm starts can skip
+    parsing unchanged skills.
+
+    Besides parsed skills, the in-memory index tracks files that failed
+    to parse and the mtimes of the directories a new SKILL.md could
+    appear in, which lets SkillManager.refresh() skip rescanning an
+    unchanged tree.
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None) -> None:
+        """Initialize the index.
+
+        Args:
+            root: Skills root directory this index belongs to.
+            path: Optional file to persist the index to.
+        """
+        self.root = root
+        self.path = path
+        self._entries: dict[str, IndexEntry] = {}
+        self._failed: dict[str, tuple[int, int]] = {}
+        self._dirs: dict[str, int] = {}
+        self._dirty = False
+
+    @classmethod
+    def for_root(cls, root: Path, index_dir: Optional[Path]) -> SkillIndex:
+        """Create an index for a skills root, loading it from disk if possible.
+
+        Args:
+            root: Skills root directory.
+            index_dir: Directory holding index files, or None for memory only.
+
+        Returns:
+            SkillIndex instance.
+        """
+        if index_dir is None:
+            return cls(root)
+
+        digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+        index = cls(root, index_dir / f"index-{digest}.json")
+        index.load()
+        return index
+
+    def lookup(self, path: Path, st: os.stat_result) -> Optional[SkillInfo]:
+        """Get the cached skill for a file if its fingerprint is unchanged.
+
+        Args:
+            path: Path to the SKILL.md file.
+            st: Current stat result of the file.
+
+        Returns:
+            Cached SkillInfo, or None if missing or stale.
+        """
+        entry = self._entries.get(str(path))
+        if entry is not None and entry.matches(st):
+            return entry.skill
+        return None
+
+    def store(self, skill: SkillInfo, st: os.stat_result) -> None:
+        """Record a freshly parsed skill.
+
+        Args:
+            skill: Parsed skill.
+            st: Stat result of the file the skill was parsed from.
+        """
+        self._entries[skill.path] = IndexEntry(
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            skill=skill,
+        )
+        self._failed.pop(skill.path, None)
+        self._dirty = True
+
+    def mark_failed(self, path: Path, st: os.stat_result) -> bool:
+        """Remember that a file failed to parse at its current fingerprint.
+
+        Failures are kept in memory only, so they are reported again on
+        the next start.
+
+        Args:
+            path: Path to the SKILL.md file.
+            st: Stat result of the file.
+
+        Returns:
+            True if a previously indexed skill was dropped.
+        """
+        self._failed[str(path)] = (st.st_mtime_ns, st.st_size)
+        if self._entries.pop(str(path), None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def is_failed(self, path: Path, st: os.stat_result) -> bool:
+        """Check if a file already failed to parse at its current fingerprint.
+
+        Args:
+            path: Path to the SKILL.md file.
+            st: Current stat result of the file.
+
+        Returns:
+            True if the file is unchanged since it failed to parse.
+        """
+        return self._failed.get(str(path)) == (st.st_mtime_ns, st.st_size)
+
+    def retain(self, paths: set[str]) -> int:
+        """Drop entries for files that no longer exist.
+
+        Args:
+            paths: String paths of all SKILL.md files still present.
+
+        Returns:
+            Number of indexed skills dropped.
+        """
+        stale = [key for key in self._entries if key not in paths]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+        for key in [key for key in self._failed if key not in paths]:
+            del self._failed[key]
+
+        return len(stale)
+
+    def paths(self) -> list[str]:
+        """Get the paths of all known SKILL.md files, parsed or failed.
+
+        Returns:
+            List of string paths.
+        """
+        return [*self._entries, *self._failed]
+
+    def skills(self) -> list[SkillInfo]:
+        """Get all indexed skills, ordered by path.
+
+        Returns:
+            List of SkillInfo objects.
+        """
+        return [self._entries[key].skill for key in sorted(self._entries)]
+
+    def set_dirs(self, dirs: dict[str, int]) -> None:
+        """Record the directories that were scanned and their mtimes.
+
+        Args:
+            dirs: Mapping of directory path to st_mtime_ns.
+        """
+        self._dirs = dirs
+
+    def dirs(self) -> list[str]:
+        """Get the directories recorded by the last scan.
+
+        Returns:
+            List of directory paths.
+        """
+        return list(self._dirs)
+
+    def dirs_changed(self) -> bool:
+        """Check if any scanned directory was modified, created or removed.
+
+        Returns:
+            True if a rescan is needed to find added or removed skills.
+        """
+        if not self._dirs:
+            return True
+
+        for path, mtime_ns in self._dirs.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+
+        return False
+
+    def load(self) -> None:
+        """Load the index from disk, ignoring missing or incompatible files."""
+        if self.path is None or not self.path.is_file():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable skill index {self.path}: {e}")
+            return
+
+        if data.get("version") != INDEX_VERSION or data.get("root") != str(self.root):
+            logger.debug(f"Ignoring incompatible skill index {self.path}")
+            return
+
+        for key, raw in data.get("entries", {}).items():
+            try:
+                self._entries[key] = _entry_from_dict(key, raw)
+            except (KeyError, TypeError) as e:
+                logger.debug(f"Skipping malformed index entry {key}: {e}")
+
+        logger.debug(f"Loaded {len(self._entries)} entries from {self.path}")
+
+    def save(self) -> None:
+        """Write the index to disk if it changed since the last load/save."""
+        if self.path is None or not self._dirty:
+            return
+
+        data = {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "entries": {key: _entry_to_dict(entry) for key, entry in self._entries.items()},
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so a crash never leaves a truncated index behind
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save skill index {self.path}: {e}")
+            return
+
+        self._dirty = False
+        logger.debug(f"Saved {len(self._entries)} entries to {self.path}")
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+
+def _entry_to_dict(entry: IndexEntry) -> dict[str, Any]:
+    """Serialize an index entry (the path is stored as the mapping key)."""
+    skill = entry.skill
+    return {
+        "mtime_ns": entry.mtime_ns,
+        "size": entry.size,
+        "name": skill.name,
+        "description": skill.description,
+        "category": skill.category,
+        "tags": list(skill.tags),
+        "preload": list(skill.preload),
+    }
+
+
+def _entry_from_dict(key: str, raw: dict[str, Any]) -> IndexEntry:
+    """Deserialize an index entry stored under the given path key."""
+    return IndexEntry(
+        mtime_ns=raw["mtime_ns"],
+        size=raw["size"],
+        skill=SkillInfo(
+            name=raw["name"],
+            description=raw["description"],
+            location=key,
+            category=raw.get("category"),
+            tags=raw.get("tags", ()),
+            preload=raw.get("preload", ()),
+        ),
+    )
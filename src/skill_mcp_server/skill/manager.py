@@ -5,12 +5,24 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-from ..config.defaults import RESOURCE_DIRS, SKILL_SCAN_PATTERNS
+from typing import Callable, Iterator, Optional, Union
+
+from ..config.defaults import (
+    ALLOWED_SCRIPT_EXTENSIONS,
+    CONTENT_CACHE_SIZE,
+    RESOURCE_DIRS,
+    SKILL_SCAN_PATTERNS,
+)
 from ..utils.logging import get_logger
-from .models import SkillInfo
+from .cache import ContentCache
+from .index import SkillIndex
+from .manifest import SkillManifest, build_manifest
+from .models import CatalogDiff, SkillInfo
 from .parser import SkillParseError, SkillParser
 from .scanner import SkillScanner
 
@@ -30,6 +42,9 @@ class SkillManager:
         skill_dirs: Optional[list[Path]] = None,
         scan_patterns: Optional[tuple[str, ...]] = None,
         resource_dirs: tuple[str, ...] = RESOURCE_DIRS,
+        index_dir: Optional[Path] = None,
+        discovery_workers: int = 1,
+        content_cache_size: int = CONTENT_CACHE_SIZE,
     ) -> None:
         """Initialize the skill manager.
 
@@ -37,16 +52,29 @@ class SkillManager:
             skill_dirs: List of directories to scan for skills.
             scan_patterns: Custom glob patterns for scanning.
             resource_dirs: Subdirectories to consider as resource dirs.
+            index_dir: Directory for persistent catalog indexes. When None,
+                parsed skills are only cached in memory.
+            discovery_workers: Number of threads parsing SKILL.md files
+                during discovery (1 parses sequentially).
+            content_cache_size: Maximum bytes of skill bodies kept in memory.
         """
         self.skill_dirs = skill_dirs or []
         self.resource_dirs = resource_dirs
+        self.index_dir = index_dir
+        self.discovery_workers = max(1, discovery_workers)
 
         patterns = scan_patterns or SKILL_SCAN_PATTERNS
         self._scanner = SkillScanner(patterns=patterns)
         self._parser = SkillParser()
+        self._content_cache = ContentCache(content_cache_size)
+        self._manifests: dict[str, SkillManifest] = {}
 
         self._skills: dict[str, SkillInfo] = {}
+        self._indexes: dict[Path, SkillIndex] = {}
+        self._listeners: list[Callable[[CatalogDiff], None]] = []
+        self._lock = threading.RLock()
         self._loaded = False
+        self._generation = 0
 
     def add_skill_dir(self, path: Path) -> None:
         """Add a directory to scan for skills.
@@ -59,47 +87,309 @@ class SkillManager:
             self.skill_dirs.append(resolved)
             self._loaded = False  # Invalidate cache
 
+    def add_listener(self, listener: Callable[[CatalogDiff], None]) -> None:
+        """Register a callback invoked whenever the catalog changes.
+
+        Listeners are called with the CatalogDiff, from whichever thread
+        performed the discovery or refresh.
+
+        Args:
+            listener: Callable taking a CatalogDiff.
+        """
+        self._listeners.append(listener)
+
     def discover(self) -> dict[str, SkillInfo]:
         """Discover and load all skills from configured directories.
 
         Returns:
             Dictionary mapping skill names to SkillInfo objects.
         """
-        if self._loaded:
+        with self._lock:
+            if self._loaded:
+                return self._skills
+
+            previous = self._skills
+            self._sync_roots(self.skill_dirs, rescan=True)
+
+            self._skills = self._build_catalog()
+            self._loaded = True
+            logger.info(f"Loaded {len(self._skills)} skills")
+
+            self._notify(_diff_catalogs(previous, self._skills))
             return self._skills
 
-        self._skills = {}
+    def refresh(self, roots: Optional[list[Path]] = None) -> CatalogDiff:
+        """Incrementally bring the catalog up to date with the filesystem.
 
-        for skill_dir in self.skill_dirs:
-            self._discover_in_directory(skill_dir)
+        Only the known SKILL.md files and the directories new skills could
+        appear in are stat()ed; the tree is rescanned only when one of those
+        directories changed, and only added or modified files are re-parsed.
+
+        Args:
+            roots: Skills roots to refresh (default: all). Each root has its
+                own index, so a change in a small root never touches a large
+                one.
 
-        self._loaded = True
-        logger.info(f"Loaded {len(self._skills)} skills")
+        Returns:
+            CatalogDiff describing added, changed and removed skills.
+        """
+        with self._lock:
+            if not self._loaded:
+                return CatalogDiff(added=list(self.discover()))
+
+            if roots is None:
+                roots = self.skill_dirs
+            else:
+                roots = [root for root in self.skill_dirs if root in roots]
+
+            previous = self._skills
+            if not any(self._sync_roots(roots, rescan=False)):
+                return CatalogDiff()
+
+            self._skills = self._build_catalog()
+            diff = _diff_catalogs(previous, self._skills)
+            if diff:
+                logger.info(
+                    f"Skills refreshed: {len(diff.added)} added, "
+                    f"{len(diff.changed)} changed, {len(diff.removed)} removed"
+                )
+            self._notify(diff)
+            return diff
+
+    def watched_dirs(self) -> dict[str, Path]:
+        """Get the directories whose changes can affect the catalog.
+
+        These are the directories visited by the last scan of each skills
+        directory (see SkillScanner.walk).
 
-        return self._skills
+        Returns:
+            Mapping of directory path to the skills root it belongs to.
+        """
+        with self._lock:
+            if not self._loaded:
+                self.discover()
+            watched: dict[str, Path] = {}
+            for skill_dir in self.skill_dirs:
+                for path in self._get_index(skill_dir).dirs():
+                    watched.setdefault(path, skill_dir)
+            return watched
+
+    @property
+    def generation(self) -> int:
+        """Get the catalog generation.
+
+        The generation starts at 0 and is incremented every time the
+        catalog changes, so anything derived from the catalog can be
+        cached until it moves.
+        """
+        return self._generation
 
-    def _discover_in_directory(self, skill_dir: Path) -> None:
-        """Discover skills in a single directory.
+    def _notify(self, diff: CatalogDiff) -> None:
+        """Bump the generation and call the listeners if the catalog changed.
 
         Args:
-            skill_dir: Directory to scan.
+            diff: Changes to report.
         """
-        for skill_path in self._scanner.scan(skill_dir):
+        if not diff:
+            return
+
+        self._generation += 1
+
+        for listener in self._listeners:
             try:
-                skill = self._parser.parse(skill_path, base_dir=skill_dir)
+                listener(diff)
+            except Exception:
+                logger.exception("Skill catalog listener failed")
+
+    def _sync_roots(self, roots: list[Path], rescan: bool) -> list[bool]:
+        """Bring the catalog indexes of several roots up to date.
+
+        Roots are independent (each has its own index and scan), so with
+        more than one root they are synced concurrently.
+
+        Args:
+            roots: Skills roots to sync.
+            rescan: Always rescan the trees, even if no directory changed.
+
+        Returns:
+            For each root, True if its index changed.
+        """
+        if len(roots) < 2:
+            return [self._sync_directory(root, rescan) for root in roots]
+
+        # Create indexes up front so workers never mutate self._indexes
+        for root in roots:
+            self._get_index(root)
+
+        with ThreadPoolExecutor(
+            max_workers=len(roots),
+            thread_name_prefix="skill-root",
+        ) as pool:
+            return list(pool.map(lambda root: self._sync_directory(root, rescan), roots))
+
+    def _sync_directory(self, skill_dir: Path, rescan: bool) -> bool:
+        """Bring the catalog index of a single directory up to date.
+
+        Skills whose SKILL.md fingerprint matches the catalog index are
+        taken from the index; everything else is parsed and indexed.
+
+        Args:
+            skill_dir: Directory to scan.
+            rescan: Always rescan the tree, even if no directory changed.
+
+        Returns:
+            True if the index changed.
+        """
+        index = self._get_index(skill_dir)
+
+        if rescan or index.dirs_changed():
+            scan = self._scanner.walk(skill_dir)
+            index.set_dirs(scan.dirs)
+            candidates = [(str(path), st) for path, st in scan.files.items()]
+        else:
+            candidates = [(key, None) for key in index.paths()]
+
+        present: set[str] = set()
+        pending: list[tuple[Path, os.stat_result]] = []
+        parsed = dropped = 0
+
+        for key, st in candidates:
+            skill_path = Path(key)
+            if st is None:
+                try:
+                    st = skill_path.stat()
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    logger.error(f"Failed to stat skill: {skill_path}: {e}")
+                    continue
+
+            present.add(key)
+
+            if index.lookup(skill_path, st) is None and not index.is_failed(skill_path, st):
+                pending.append((skill_path, st))
+
+        for (skill_path, st), outcome in zip(
+            pending, self._parse_many(pending, skill_dir), strict=True
+        ):
+            if isinstance(outcome, SkillParseError):
+                logger.error(f"Failed to parse skill: {outcome}")
+                dropped += index.mark_failed(skill_path, st)
+                continue
+
+            index.store(outcome, st)
+            parsed += 1
+
+        dropped += index.retain(present)
+        index.save()
+
+        logger.debug(f"Indexed {len(present)} skill files in {skill_dir} ({parsed} parsed)")
+        return bool(parsed or dropped)
+
+    def _parse_many(
+        self,
+        items: list[tuple[Path, os.stat_result]],
+        skill_dir: Path,
+    ) -> Iterator[Union[SkillInfo, SkillParseError]]:
+        """Parse skill files, in parallel when discovery_workers > 1.
+
+        Results are yielded in input order, so the outcome of discovery
+        does not depend on which worker finishes first. At most a few
+        files per worker are in flight at any time.
+
+        Args:
+            items: (path, stat) pairs of files to parse.
+            skill_dir: Skills root the files belong to.
+
+        Yields:
+            Parsed SkillInfo, or the SkillParseError raised for the file.
+        """
+        if self.discovery_workers == 1 or len(items) < 2:
+            for path, _ in items:
+                yield self._parse_one(path, skill_dir)
+            return
+
+        window = self.discovery_workers * 4
+        with ThreadPoolExecutor(
+            max_workers=self.discovery_workers,
+            thread_name_prefix="skill-parser",
+        ) as pool:
+            in_flight: deque[Future] = deque()
+            for path, _ in items:
+                in_flight.append(pool.submit(self._parse_one, path, skill_dir))
+                if len(in_flight) >= window:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def _parse_one(self, path: Path, skill_dir: Path) -> Union[SkillInfo, SkillParseError]:
+        """Parse a single skill file, returning the error instead of raising.
 
-                if skill.name in self._skills:
-                    existing = self._skills[skill.name]
+        Args:
+            path: Path to the SKILL.md file.
+            skill_dir: Skills root the file belongs to.
+
+        Returns:
+            Parsed SkillInfo or the SkillParseError.
+        """
+        try:
+            return self._parser.parse_header(path, base_dir=skill_dir)
+        except SkillParseError as e:
+            return e
+
+    def _build_catalog(self) -> dict[str, SkillInfo]:
+        """Build the name-to-skill mapping from the directory indexes.
+
+        Directories are visited in priority (configuration) order and skill
+        files in path order; the first skill with a given name wins. A skill
+        in a higher-priority root overriding a lower-priority one is an
+        expected overlay; duplicates within one root are reported.
+
+        Returns:
+            Dictionary mapping skill names to SkillInfo objects.
+        """
+        skills: dict[str, SkillInfo] = {}
+
+        for skill_dir in self.skill_dirs:
+            from_root: set[str] = set()
+            for skill in self._get_index(skill_dir).skills():
+                existing = skills.get(skill.name)
+                if existing is None:
+                    skills[skill.name] = skill
+                elif skill.name in from_root:
                     logger.warning(
                         f"Duplicate skill name '{skill.name}': "
                         f"keeping {existing.location}, ignoring {skill.location}"
                     )
                 else:
-                    self._skills[skill.name] = skill
-                    logger.debug(f"Loaded skill: {skill.name}")
+                    logger.debug(
+                        f"Skill '{skill.name}' at {existing.location} overrides {skill.location}"
+                    )
+                from_root.add(skill.name)
+
+        # Forget file manifests of skills that are gone; tools may add
+        # manifests from worker threads meanwhile, so iterate over a copy
+        live = {skill.base_path for skill in skills.values()}
+        for base_path in list(self._manifests):
+            if base_path not in live:
+                self._manifests.pop(base_path, None)
 
-            except SkillParseError as e:
-                logger.error(f"Failed to parse skill: {e}")
+        return skills
+
+    def _get_index(self, skill_dir: Path) -> SkillIndex:
+        """Get (or load) the catalog index for a skills directory.
+
+        Args:
+            skill_dir: Skills root directory.
+
+        Returns:
+            SkillIndex for the directory.
+        """
+        index = self._indexes.get(skill_dir)
+        if index is None:
+            index = SkillIndex.for_root(skill_dir, self.index_dir)
+            self._indexes[skill_dir] = index
+        return index
 
     def get(self, name: str) -> Optional[SkillInfo]:
         """Get a skill by name.
@@ -114,6 +404,26 @@ class SkillManager:
             self.discover()
         return self._skills.get(name)
 
+    def get_content(self, skill: SkillInfo) -> str:
+        """Get the markdown body of a skill.
+
+        Discovery only parses skill headers; bodies are read on first use
+        and kept in a size-bounded LRU cache that is invalidated when the
+        SKILL.md file changes.
+
+        Args:
+            skill: The skill to load.
+
+        Returns:
+            The markdown content (body without frontmatter).
+
+        Raises:
+            SkillParseError: If the file cannot be read.
+        """
+        if skill.content is not None:
+            return skill.content
+        return self._content_cache.get(skill.location, self._parser.load_content)
+
     def all(self) -> list[SkillInfo]:
         """Get all loaded skills.
 
@@ -156,12 +466,15 @@ class SkillManager:
     def reload(self) -> dict[str, SkillInfo]:
         """Force reload all skills.
 
+        Rescans every directory. Unchanged skill files are still served
+        from the catalog index; use refresh() for cheap periodic updates.
+
         Returns:
             Dictionary mapping skill names to SkillInfo objects.
         """
-        self._loaded = False
-        self._skills = {}
-        return self.discover()
+        with self._lock:
+            self._loaded = False
+            return self.discover()
 
     def count(self) -> int:
         """Get the number of loaded skills.
@@ -173,6 +486,25 @@ class SkillManager:
             self.discover()
         return len(self._skills)
 
+    def get_manifest(self, skill: SkillInfo) -> SkillManifest:
+        """Get the file manifest of a skill, rebuilding it if stale.
+
+        Manifests are cached per skill directory and rebuilt only when one
+        of the directories they cover has been modified.
+
+        Args:
+            skill: The skill to get the manifest for.
+
+        Returns:
+            SkillManifest listing the skill's resources and scripts.
+        """
+        base_path = skill.base_path
+        manifest = self._manifests.get(base_path)
+        if manifest is None or not manifest.is_valid():
+            manifest = build_manifest(base_path, self.resource_dirs, ALLOWED_SCRIPT_EXTENSIONS)
+            self._manifests[base_path] = manifest
+        return manifest
+
     def list_skill_files(self, skill: SkillInfo) -> tuple[list[str], list[str]]:
         """List resource files and scripts for a skill.
 
@@ -182,31 +514,26 @@ class SkillManager:
         Returns:
             Tuple of (resource_paths, script_paths).
         """
-        resources: list[str] = []
-        scripts: list[str] = []
-
-        base_dir = skill.base_dir
-
-        # Scan resource directories
-        for dir_name in self.resource_dirs:
-            resource_dir = base_dir / dir_name
-            if resource_dir.exists() and resource_dir.is_dir():
-                for file_path in resource_dir.rglob("*"):
-                    if file_path.is_file() and not file_path.name.startswith("."):
-                        rel_path = file_path.relative_to(base_dir)
-                        resources.append(str(rel_path))
-
-        # Scan scripts directory
-        scripts_dir = base_dir / "scripts"
-        if scripts_dir.exists() and scripts_dir.is_dir():
-            from ..config.defaults import ALLOWED_SCRIPT_EXTENSIONS
-
-            for file_path in scripts_dir.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith("."):
-                    rel_path = file_path.relative_to(base_dir)
-                    if file_path.suffix.lower() in ALLOWED_SCRIPT_EXTENSIONS:
-                        scripts.append(str(rel_path))
-                    else:
-                        resources.append(str(rel_path))
-
-        return sorted(resources), sorted(scripts)
+        manifest = self.get_manifest(skill)
+        return manifest.resources, manifest.scripts
+
+
+def _diff_catalogs(old: dict[str, SkillInfo], new: dict[str, SkillInfo]) -> CatalogDiff:
+    """Compute the difference between two name-to-skill mappings.
+
+    The index keeps SkillInfo objects of unchanged files, so a skill is
+    "changed" whenever its SKILL.md was re-parsed, even if only the body
+    was edited.
+
+    Args:
+        old: Previous catalog.
+        new: Current catalog.
+
+    Returns:
+        CatalogDiff between the two.
+    """
+    return CatalogDiff(
+        added=[name for name in new if name not in old],
+        changed=[name for name, skill in new.items() if name in old and old[name] is not skill],
+        removed=[name for name in old if name not in new],
+    )
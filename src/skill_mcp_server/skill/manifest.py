@@ -0,0 +1,190 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Per-skill file manifests.
+
+A manifest lists the resource files and scripts bundled with a skill,
+with their sizes and mtimes. It is built with a single os.scandir walk
+and stays valid until one of the directories it covers is modified, so
+loading a skill or checking that a resource exists does not walk the
+skill's tree again.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger("skill.manifest")
+
+
+class ManifestEntry(NamedTuple):
+    """A file bundled with a skill.
+
+    Attributes:
+        path: Path relative to the skill's base directory ("/"-separated).
+        size: Size in bytes when the manifest was built.
+        mtime_ns: Modification time when the manifest was built.
+        is_script: True for files under scripts/ with a script extension.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    is_script: bool
+
+
+@dataclass
+class SkillManifest:
+    """Files bundled with one skill.
+
+    Attributes:
+        base_dir: The skill's base directory.
+        files: Entries keyed by relative path.
+        dirs: Directories the manifest covers, mapped to their st_mtime_ns.
+            The base directory is always included, so creating a resource
+            directory invalidates the manifest too.
+    """
+
+    base_dir: str
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+    dirs: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def resources(self) -> list[str]:
+        """Get the relative paths of all resource files, sorted."""
+        return sorted(path for path, entry in self.files.items() if not entry.is_script)
+
+    @property
+    def scripts(self) -> list[str]:
+        """Get the relative paths of all scripts, sorted."""
+        return sorted(path for path, entry in self.files.items() if entry.is_script)
+
+    def get(self, relative_path: str) -> Optional[ManifestEntry]:
+        """Look up a file by its path relative to the base directory.
+
+        Args:
+            relative_path: Path as given by a client (e.g. "assets/a.md").
+
+        Returns:
+            ManifestEntry, or None if the file is not in the manifest.
+        """
+        # ".." may cross a symlink, so leave such paths to PathValidator
+        if os.path.isabs(relative_path) or ".." in relative_path.replace("\\", "/").split("/"):
+            return None
+        normalized = os.path.normpath(relative_path).replace(os.sep, "/")
+        return self.files.get(normalized)
+
+    def is_valid(self) -> bool:
+        """Check that no covered directory was modified, created or removed.
+
+        Returns:
+            True if the manifest still reflects the directory tree.
+        """
+        for path, mtime_ns in self.dirs.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+def build_manifest(
+    base_dir: str,
+    resource_dirs: tuple[str, ...],
+    script_extensions: frozenset[str],
+) -> SkillManifest:
+    """Walk a skill's resource and script directories.
+
+    Hidden files are skipped. Symlinked directories are not followed,
+    and symlinked files are only listed if they resolve inside the
+    skill's base directory.
+
+    Args:
+        base_dir: The skill's base directory.
+        resource_dirs: Subdirectories holding resources.
+        script_extensions: Extensions (lowercase, with dot) of scripts.
+
+    Returns:
+        SkillManifest for the skill.
+    """
+    manifest = SkillManifest(base_dir=base_dir)
+    real_base = os.path.realpath(base_dir)
+
+    try:
+        manifest.dirs[base_dir] = os.stat(base_dir).st_mtime_ns
+    except OSError as e:
+        logger.debug(f"Cannot stat skill directory {base_dir}: {e}")
+        return manifest
+
+    for dir_name in (*resource_dirs, "scripts"):
+        _walk(
+            manifest,
+            os.path.join(base_dir, dir_name),
+            dir_name,
+            real_base,
+            script_extensions if dir_name == "scripts" else None,
+        )
+
+    return manifest
+
+
+def _walk(
+    manifest: SkillManifest,
+    path: str,
+    rel_path: str,
+    real_base: str,
+    script_extensions: Optional[frozenset[str]],
+) -> None:
+    """Add the files under one directory to a manifest.
+
+    Args:
+        manifest: Manifest to fill in.
+        path: Absolute directory path.
+        rel_path: Directory path relative to the skill's base directory.
+        real_base: Resolved base directory, for checking symlinked files.
+        script_extensions: Script extensions, or None for resource directories.
+    """
+    try:
+        dir_stat = os.stat(path)
+        it = os.scandir(path)
+    except OSError:
+        return
+
+    manifest.dirs[path] = dir_stat.st_mtime_ns
+    with it:
+        for entry in it:
+            child_rel = f"{rel_path}/{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _walk(manifest, entry.path, child_rel, real_base, script_extensions)
+                    continue
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                if entry.is_symlink() and not _is_within(entry.path, real_base):
+                    logger.debug(f"Skipping symlink outside skill: {entry.path}")
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+
+            is_script = (
+                script_extensions is not None
+                and os.path.splitext(entry.name)[1].lower() in script_extensions
+            )
+            manifest.files[child_rel] = ManifestEntry(
+                path=child_rel,
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+                is_script=is_script,
+            )
+
+
+def _is_within(path: str, real_base: str) -> bool:
+    """Check if a path resolves inside a (resolved) directory."""
+    real = os.path.realpath(path)
+    return real == real_base or real.startswith(real_base + os.sep)
@@ -5,29 +5,160 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import re
+import sys
+from dataclasses import FrozenInstanceError, dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional, Union
 
 
-@dataclass(frozen=True)
 class SkillInfo:
-    """Immutable data class representing a skill.
+    """Immutable, compact representation of a skill.
+
+    Large catalogs hold one SkillInfo per skill, so instances use slots
+    and keep the location as interned strings: the parent directory
+    (shared by every skill in the same category), the skill directory
+    name and the file name. Path objects are only built on access.
 
     Attributes:
         name: Unique identifier for the skill.
         description: Human-readable description of what the skill does.
         location: Path to the SKILL.md file.
-        content: The markdown content (body without frontmatter).
+        content: The markdown content (body without frontmatter), or None
+            when only the header was parsed (see SkillManager.get_content).
         category: Optional category (inferred from directory structure).
+        tags: Tags from the frontmatter.
+        preload: Modules the skill's Python scripts import, from the
+            frontmatter; the warm worker pool may import them ahead.
         base_dir: The skill's root directory (parent of SKILL.md).
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "content",
+        "category",
+        "tags",
+        "preload",
+        "_parent",
+        "_dirname",
+        "_filename",
+    )
+
     name: str
     description: str
-    location: Path
-    content: str
-    category: Optional[str] = None
+    content: Optional[str]
+    category: Optional[str]
+    tags: tuple[str, ...]
+    preload: tuple[str, ...]
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        location: Union[Path, str],
+        content: Optional[str] = None,
+        category: Optional[str] = None,
+        tags: Iterable[str] = (),
+        preload: Iterable[str] = (),
+    ) -> None:
+        """Initialize the skill.
+
+        Args:
+            name: Unique identifier for the skill.
+            description: Human-readable description.
+            location: Path to the SKILL.md file.
+            content: Optional markdown body.
+            category: Optional category.
+            tags: Optional tags.
+            preload: Optional modules to preload for the skill's scripts.
+        """
+        base_dir, filename = os.path.split(os.fspath(location))
+        parent, dirname = os.path.split(base_dir)
+
+        _set = object.__setattr__
+        _set(self, "name", sys.intern(name))
+        _set(self, "description", description)
+        _set(self, "content", content)
+        _set(self, "category", sys.intern(category) if category is not None else None)
+        _set(self, "tags", tuple(sys.intern(tag) for tag in tags))
+        _set(self, "preload", tuple(sys.intern(module) for module in preload))
+        _set(self, "_parent", sys.intern(parent))
+        _set(self, "_dirname", sys.intern(dirname))
+        _set(self, "_filename", sys.intern(filename))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def _key(self) -> tuple:
+        return (
+            self.name,
+            self.description,
+            self.path,
+            self.content,
+            self.category,
+            self.tags,
+            self.preload,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SkillInfo):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"SkillInfo(name={self.name!r}, description={self.description!r}, "
+            f"location={self.location!r}, category={self.category!r})"
+        )
+
+    def __reduce__(self) -> tuple:
+        return (
+            SkillInfo,
+            (
+                self.name,
+                self.description,
+                self.path,
+                self.content,
+                self.category,
+                self.tags,
+                self.preload,
+            ),
+        )
+
+    @property
+    def path(self) -> str:
+        """Get the path to the SKILL.md file as a string.
+
+        Returns:
+            String path, without building a Path object.
+        """
+        return os.path.join(self.base_path, self._filename)
+
+    @property
+    def base_path(self) -> str:
+        """Get the skill's base directory as a string.
+
+        Returns:
+            String path of the directory containing SKILL.md.
+        """
+        return os.path.join(self._parent, self._dirname)
+
+    @property
+    def location(self) -> Path:
+        """Get the path to the SKILL.md file.
+
+        Returns:
+            Path to SKILL.md.
+        """
+        return Path(self.path)
 
     @property
     def base_dir(self) -> Path:
@@ -36,7 +167,7 @@ class SkillInfo:
         Returns:
             Path to the directory containing SKILL.md.
         """
-        return self.location.parent
+        return Path(self.base_path)
 
     def has_scripts(self) -> bool:
         """Check if the skill has a scripts directory.
@@ -44,7 +175,7 @@ class SkillInfo:
         Returns:
             True if scripts/ directory exists.
         """
-        return (self.base_dir / "scripts").is_dir()
+        return os.path.isdir(os.path.join(self.base_path, "scripts"))
 
     def has_references(self) -> bool:
         """Check if the skill has a references directory.
@@ -52,7 +183,7 @@ class SkillInfo:
         Returns:
             True if references/ directory exists.
         """
-        return (self.base_dir / "references").is_dir()
+        return os.path.isdir(os.path.join(self.base_path, "references"))
 
     def has_assets(self) -> bool:
         """Check if the skill has an assets directory.
@@ -60,7 +191,7 @@ class SkillInfo:
         Returns:
             True if assets/ directory exists.
         """
-        return (self.base_dir / "assets").is_dir()
+        return os.path.isdir(os.path.join(self.base_path, "assets"))
 
     def get_scripts_dir(self) -> Optional[Path]:
         """Get the scripts directory if it exists.
@@ -90,6 +221,25 @@ class SkillInfo:
         return assets_dir if assets_dir.is_dir() else None
 
 
+@dataclass
+class CatalogDiff:
+    """Changes to the skill catalog produced by a refresh.
+
+    Attributes:
+        added: Names of skills that appeared.
+        changed: Names of skills whose SKILL.md (or winning root) changed.
+        removed: Names of skills that disappeared.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Check if the diff contains any change."""
+        return bool(self.added or self.changed or self.removed)
+
+
 @dataclass
 class SkillMetadata:
     """Metadata extracted from SKILL.md frontmatter.
@@ -101,6 +251,8 @@ class SkillMetadata:
         version: Skill version.
         author: Skill author.
         tags: List of tags/keywords.
+        preload: Modules imported by the skill's Python scripts, which the
+            warm worker pool may import ahead of time.
     """
 
     name: Optional[str] = None
@@ -109,6 +261,7 @@ class SkillMetadata:
     version: Optional[str] = None
     author: Optional[str] = None
     tags: list[str] = field(default_factory=list)
+    preload: list[str] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: dict) -> SkillMetadata:
@@ -120,9 +273,9 @@ class SkillMetadata:
         Returns:
             SkillMetadata instance.
         """
-        tags = data.get("tags", [])
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",")]
+        tags = _as_list(data.get("tags", []))
+        # Module names only: they are passed to the worker pool
+        preload = [m for m in _as_list(data.get("preload", [])) if _MODULE_NAME.match(m)]
 
         return cls(
             name=data.get("name"),
@@ -131,4 +284,28 @@ class SkillMetadata:
             version=data.get("version"),
             author=data.get("author"),
             tags=tags,
+            preload=preload,
         )
+
+
+# A dotted Python module name
+_MODULE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+
+def _as_list(value: Any) -> list[str]:
+    """Read a frontmatter list given as a list or a comma-separated string.
+
+    Args:
+        value: Parsed frontmatter value.
+
+    Returns:
+        List of non-empty strings.
+    """
+    if isinstance(value, str):
+        # Accept both "a, b" and the YAML flow style "[a, b]"
+        if value.startswith("[") and value.endswith("]"):
+            value = value[1:-1]
+        value = [v.strip().strip("'\"") for v in value.split(",")]
+    if not isinstance(value, list):
+        return []
+    return [str(v) for v in value if v]
@@ -5,16 +5,20 @@
 
 from __future__ import annotations
 
+import codecs
 from pathlib import Path
 from typing import Optional
 
-from ..utils.frontmatter import parse_frontmatter
+from ..utils.frontmatter import FRONTMATTER_DELIMITER, parse_frontmatter
 from ..utils.logging import get_logger
-from ..utils.markdown import extract_description
+from ..utils.markdown import NO_DESCRIPTION, extract_description
 from .models import SkillInfo, SkillMetadata
 
 logger = get_logger("skill.parser")
 
+# Bytes read at a time when only the header of a SKILL.md is needed
+HEADER_CHUNK_SIZE = 4096
+
 
 class SkillParseError(Exception):
     """Raised when skill parsing fails."""
@@ -78,8 +82,147 @@ class SkillParser:
             location=path,
             content=markdown if markdown else content,
             category=category,
+            tags=metadata.tags,
+            preload=metadata.preload,
         )
 
+    def parse_header(
+        self,
+        path: Path,
+        base_dir: Optional[Path] = None,
+    ) -> SkillInfo:
+        """Parse only what is needed to list a skill.
+
+        Reads the frontmatter and, if it has no description, the first
+        paragraph of the body; the rest of the file is not read. The
+        returned SkillInfo has no content; use load_content() for that.
+
+        Args:
+            path: Path to the SKILL.md file.
+            base_dir: Base directory for inferring category.
+
+        Returns:
+            Parsed SkillInfo object without content.
+
+        Raises:
+            SkillParseError: If parsing fails.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            # Unbuffered, so that only the chunks actually needed are read
+            with path.open("rb", buffering=0) as f:
+                text = ""
+                while True:
+                    chunk = f.read(HEADER_CHUNK_SIZE)
+                    eof = not chunk
+                    text += decoder.decode(chunk, final=eof)
+                    # Only look at complete lines until the end of the file
+                    complete = text if eof else text[: text.rfind("\n") + 1]
+                    header = self._try_header(complete, eof)
+                    if header is not None:
+                        break
+        except Exception as e:
+            raise SkillParseError(f"Failed to read {path}: {e}") from e
+
+        metadata, description = header
+
+        return SkillInfo(
+            name=self._resolve_name(metadata, path),
+            description=description,
+            location=path,
+            content=None,
+            category=self._resolve_category(path, base_dir),
+            tags=metadata.tags,
+            preload=metadata.preload,
+        )
+
+    def load_content(self, path: Path) -> str:
+        """Read the markdown body of a SKILL.md file.
+
+        Args:
+            path: Path to the SKILL.md file.
+
+        Returns:
+            The body without frontmatter (the whole file if the body is empty).
+
+        Raises:
+            SkillParseError: If the file cannot be read.
+        """
+        try:
+            content = path.read_text(encoding="utf-8")
+        except Exception as e:
+            raise SkillParseError(f"Failed to read {path}: {e}") from e
+
+        _, markdown = parse_frontmatter(content)
+        return markdown if markdown else content
+
+    def read_headings(self, path: Path) -> list[str]:
+        """Read the markdown headings of a SKILL.md file.
+
+        The file is streamed line by line, so the body is never held in
+        memory. Frontmatter and fenced code blocks are skipped.
+
+        Args:
+            path: Path to the SKILL.md file.
+
+        Returns:
+            Heading texts without the leading "#" characters.
+
+        Raises:
+            SkillParseError: If the file cannot be read.
+        """
+        headings: list[str] = []
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                in_frontmatter = False
+                in_fence = False
+                for number, line in enumerate(f):
+                    stripped = line.strip()
+                    if number == 0 and stripped == FRONTMATTER_DELIMITER:
+                        in_frontmatter = True
+                    elif in_frontmatter:
+                        in_frontmatter = stripped != FRONTMATTER_DELIMITER
+                    elif stripped.startswith(("```", "~~~")):
+                        in_fence = not in_fence
+                    elif not in_fence and stripped.startswith("#"):
+                        heading = stripped.lstrip("#").strip()
+                        if heading:
+                            headings.append(heading)
+        except Exception as e:
+            raise SkillParseError(f"Failed to read {path}: {e}") from e
+
+        return headings
+
+    def _try_header(
+        self,
+        text: str,
+        eof: bool,
+    ) -> Optional[tuple[SkillMetadata, str]]:
+        """Try to resolve metadata and description from the start of a file.
+
+        Args:
+            text: Complete lines read so far.
+            eof: Whether text is the whole file.
+
+        Returns:
+            (metadata, description), or None if more of the file is needed.
+        """
+        if not eof and FRONTMATTER_DELIMITER.startswith(text[:3]):
+            # Frontmatter may follow: wait until its closing delimiter is read
+            frontmatter, markdown = parse_frontmatter(text)
+            if not frontmatter and markdown is text:
+                return None
+        else:
+            frontmatter, markdown = parse_frontmatter(text)
+
+        metadata = SkillMetadata.from_dict(frontmatter)
+        description = self._resolve_description(metadata, markdown)
+        if description == NO_DESCRIPTION and not eof:
+            # No paragraph yet; it may be further down the file
+            return None
+
+        return metadata, description
+
     def _resolve_name(self, metadata: SkillMetadata, path: Path) -> str:
         """Resolve the skill name.
 
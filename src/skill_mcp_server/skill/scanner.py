@@ -5,6 +5,10 @@
 
 from __future__ import annotations
 
+import os
+import stat
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Iterator
 
@@ -13,12 +17,35 @@ from ..utils.logging import get_logger
 
 logger = get_logger("skill.scanner")
 
+# A position in a compiled pattern: (pattern index, segment index)
+_State = tuple[int, int]
+
+
+@dataclass
+class ScanResult:
+    """Result of a single scanner pass over a skills directory.
+
+    Attributes:
+        files: Discovered skill files mapped to their stat results, in
+            deterministic (sorted, depth-first) order.
+        dirs: Every directory that was visited, mapped to its st_mtime_ns.
+            Creating or deleting a skill file changes one of these mtimes.
+    """
+
+    files: dict[Path, os.stat_result] = field(default_factory=dict)
+    dirs: dict[str, int] = field(default_factory=dict)
+
 
 class SkillScanner:
     """Scans directories to discover SKILL.md files.
 
     This class handles the discovery of skill files without
     parsing them - that's the parser's job.
+
+    The scanner walks the tree once with os.scandir, matching all scan
+    patterns at the same time. Excluded and hidden directories, and
+    directories too deep to match any pattern, are pruned before they
+    are entered.
     """
 
     # Directories to exclude from scanning
@@ -43,8 +70,13 @@ class SkillScanner:
 
         Args:
             patterns: Glob patterns to use for discovering skills.
+                Segments may use fnmatch wildcards; ``**`` matches any
+                number of directories.
         """
         self.patterns = patterns
+        self._segments: list[tuple[str, ...]] = [
+            tuple(part for part in pattern.split("/") if part) for pattern in patterns
+        ]
 
     def scan(self, directory: Path) -> Iterator[Path]:
         """Scan a directory for skill files.
@@ -55,30 +87,54 @@ class SkillScanner:
         Yields:
             Paths to discovered SKILL.md files.
         """
+        yield from self.walk(directory).files
+
+    def walk(self, directory: Path) -> ScanResult:
+        """Scan a directory in a single pass.
+
+        Skill files are deduplicated by (st_dev, st_ino), so a skill
+        reachable through several symlinks is reported once.
+
+        Args:
+            directory: Directory to scan.
+
+        Returns:
+            ScanResult with the skill files and the directories visited.
+        """
+        result = ScanResult()
+
         if not directory.exists():
             logger.warning(f"Skills directory does not exist: {directory}")
-            return
+            return result
 
         if not directory.is_dir():
             logger.warning(f"Not a directory: {directory}")
-            return
+            return result
 
-        seen: set[Path] = set()
+        start = self._closure({(i, 0) for i in range(len(self._segments))})
+        seen_dirs: set[tuple[int, int]] = set()
+        seen_files: set[tuple[int, int]] = set()
 
-        for pattern in self.patterns:
-            for path in directory.glob(pattern):
-                # Skip excluded directories
-                if self._is_excluded(path):
-                    continue
+        root = os.path.abspath(directory)
+        try:
+            root_stat = os.stat(root)
+        except OSError as e:
+            logger.warning(f"Cannot scan {root}: {e}")
+            return result
 
-                # Resolve to absolute and deduplicate
-                abs_path = path.resolve()
-                if abs_path in seen:
-                    continue
+        self._walk_dir(root, root_stat, start, result, seen_dirs, seen_files)
+        return result
+
+    def scan_dirs(self, directory: Path) -> dict[str, int]:
+        """Get the directories in which a new skill file could appear.
 
-                seen.add(abs_path)
-                logger.debug(f"Found skill file: {abs_path}")
-                yield abs_path
+        Args:
+            directory: Directory to scan.
+
+        Returns:
+            Mapping of directory path to st_mtime_ns.
+        """
+        return self.walk(directory).dirs
 
     def scan_multiple(self, directories: list[Path]) -> Iterator[Path]:
         """Scan multiple directories for skill files.
@@ -89,36 +145,166 @@ class SkillScanner:
         Yields:
             Paths to discovered SKILL.md files (deduplicated).
         """
-        seen: set[Path] = set()
+        seen: set[tuple[int, int]] = set()
 
         for directory in directories:
-            for path in self.scan(directory):
-                if path not in seen:
-                    seen.add(path)
+            for path, st in self.walk(directory).files.items():
+                key = (st.st_dev, st.st_ino)
+                if key not in seen:
+                    seen.add(key)
                     yield path
 
-    def _is_excluded(self, path: Path) -> bool:
-        """Check if a path should be excluded.
+    def _walk_dir(
+        self,
+        path: str,
+        dir_stat: os.stat_result,
+        states: frozenset[_State],
+        result: ScanResult,
+        seen_dirs: set[tuple[int, int]],
+        seen_files: set[tuple[int, int]],
+    ) -> None:
+        """Recursively scan one directory.
+
+        Args:
+            path: Directory path.
+            dir_stat: Stat result of the directory (taken before listing).
+            states: Pattern positions reached at this directory.
+            result: Result to fill in.
+            seen_dirs: (dev, ino) of directories already visited (cycle guard).
+            seen_files: (dev, ino) of skill files already reported.
+        """
+        dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+        if dir_key in seen_dirs:
+            return
+        seen_dirs.add(dir_key)
+        result.dirs[path] = dir_stat.st_mtime_ns
+
+        # When every next segment is a literal, probe it directly instead of
+        # listing the whole directory (e.g. "<skill>/SKILL.md")
+        literals = self._literal_names(states)
+        if literals is not None:
+            children = [(name, None) for name in sorted(literals)]
+        else:
+            try:
+                with os.scandir(path) as it:
+                    children = sorted(((entry.name, entry) for entry in it), key=lambda c: c[0])
+            except OSError as e:
+                logger.debug(f"Cannot list {path}: {e}")
+                return
+
+        for name, entry in children:
+            next_states = self._advance(states, name)
+            if not next_states:
+                continue
+
+            child = os.path.join(path, name)
+            try:
+                # d_type from readdir lets us skip entries without a stat()
+                if entry is not None:
+                    if entry.is_dir():
+                        if self._is_excluded_name(name) or not self._can_descend(next_states):
+                            continue
+                    elif not (entry.is_file() and self._is_complete(next_states)):
+                        continue
+                st = os.stat(child)
+            except OSError:
+                continue
+
+            if stat.S_ISDIR(st.st_mode):
+                if self._is_excluded_name(name) or not self._can_descend(next_states):
+                    continue
+                self._walk_dir(child, st, next_states, result, seen_dirs, seen_files)
+            elif stat.S_ISREG(st.st_mode) and self._is_complete(next_states):
+                file_key = (st.st_dev, st.st_ino)
+                if file_key in seen_files:
+                    continue
+                seen_files.add(file_key)
+                logger.debug(f"Found skill file: {child}")
+                result.files[Path(child)] = st
+
+    def _closure(self, states: set[_State]) -> frozenset[_State]:
+        """Expand states past ``**`` segments, which may match nothing.
 
         Args:
-            path: Path to check.
+            states: Pattern positions.
 
         Returns:
-            True if the path should be excluded.
+            Closed set of pattern positions.
         """
-        path_str = str(path)
+        closed = set(states)
+        pending = list(states)
+        while pending:
+            pattern, index = pending.pop()
+            segments = self._segments[pattern]
+            if index < len(segments) and segments[index] == "**":
+                nxt = (pattern, index + 1)
+                if nxt not in closed:
+                    closed.add(nxt)
+                    pending.append(nxt)
+        return frozenset(closed)
+
+    def _advance(self, states: frozenset[_State], name: str) -> frozenset[_State]:
+        """Consume one path segment.
 
-        # Check for excluded directories in path
-        for excluded in self.EXCLUDED_DIRS:
-            if f"/{excluded}/" in path_str or path_str.endswith(f"/{excluded}"):
-                return True
+        Args:
+            states: Pattern positions before the segment.
+            name: Directory entry name.
 
-        # Skip hidden files/directories
-        for part in path.parts:
-            if part.startswith(".") and part not in (".", ".."):
-                return True
+        Returns:
+            Pattern positions after the segment (empty if nothing matches).
+        """
+        nxt: set[_State] = set()
+        for pattern, index in states:
+            segments = self._segments[pattern]
+            if index >= len(segments):
+                continue
+            segment = segments[index]
+            if segment == "**":
+                # "**" never matches hidden entries, like glob()
+                if not name.startswith("."):
+                    nxt.add((pattern, index))
+            elif fnmatchcase(name, segment):
+                nxt.add((pattern, index + 1))
+        return self._closure(nxt) if nxt else frozenset()
+
+    def _can_descend(self, states: frozenset[_State]) -> bool:
+        """Check if any pattern still needs more path segments."""
+        return any(index < len(self._segments[pattern]) for pattern, index in states)
+
+    def _is_complete(self, states: frozenset[_State]) -> bool:
+        """Check if any pattern has been fully matched."""
+        return any(index == len(self._segments[pattern]) for pattern, index in states)
+
+    def _literal_names(self, states: frozenset[_State]) -> set[str] | None:
+        """Get the exact names to probe if all next segments are literals.
+
+        Args:
+            states: Pattern positions at a directory.
 
-        return False
+        Returns:
+            Set of literal names, or None if the directory must be listed.
+        """
+        names: set[str] = set()
+        for pattern, index in states:
+            segments = self._segments[pattern]
+            if index >= len(segments):
+                continue
+            segment = segments[index]
+            if segment == "**" or any(c in segment for c in "*?["):
+                return None
+            names.add(segment)
+        return names
+
+    def _is_excluded_name(self, name: str) -> bool:
+        """Check if a directory should be pruned.
+
+        Args:
+            name: Directory name.
+
+        Returns:
+            True for excluded and hidden directories.
+        """
+        return name in self.EXCLUDED_DIRS or name.startswith(".")
 
     def count_skills(self, directory: Path) -> int:
         """Count the number of skills in a directory.
@@ -129,4 +315,4 @@ class SkillScanner:
         Returns:
             Number of skill files found.
         """
-        return sum(1 for _ in self.scan(directory))
+        return len(self.walk(directory).files)
@@ -0,0 +1,454 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Full-text skill search.
+
+SkillSearchIndex keeps an in-memory inverted index over each skill's
+name, description, tags, category and body headings, and ranks matches
+with BM25. Fields are weighted by multiplying term frequencies, so a
+match in the name counts more than one in a heading.
+
+The index is built on the first query and then kept up to date from the
+SkillManager's catalog diffs, re-indexing only changed skills.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Container, Iterable, Optional
+
+from ..utils.logging import get_logger
+from .manager import SkillManager
+from .models import CatalogDiff, SkillInfo
+from .parser import SkillParseError, SkillParser
+
+logger = get_logger("skill.search")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Weight of a term occurrence in each field
+FIELD_WEIGHTS: dict[str, float] = {
+    "name": 3.0,
+    "tags": 2.0,
+    "category": 1.5,
+    "description": 1.0,
+    "headings": 0.5,
+}
+
+# Multi-term queries are intersected first when their rarest term occurs in
+# at most this many skills; otherwise the threshold algorithm is used
+MATCH_ALL_LIMIT = 2000
+
+# Words too common to say anything about a skill; ignored in queries and skills
+STOPWORDS: frozenset[str] = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "how",
+        "i", "in", "into", "is", "it", "of", "on", "or", "that", "the", "this", "to",
+        "use", "using", "when", "with", "you", "your",
+    }
+)  # fmt: skip
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List of terms, in order.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _terms(text: str) -> list[str]:
+    """Tokenize text for indexing, dropping stopwords."""
+    return [term for term in tokenize(text) if term not in STOPWORDS]
+
+
+@dataclass
+class SearchResult:
+    """A skill matching a search query.
+
+    Attributes:
+        skill: The matching skill.
+        score: BM25 score (0.0 when listing by filter only).
+    """
+
+    skill: SkillInfo
+    score: float
+
+
+@dataclass
+class _Document:
+    """Indexed data of one skill."""
+
+    skill: SkillInfo
+    length: float
+    terms: tuple[str, ...]
+    tags: frozenset[str]
+
+
+class SkillSearchIndex:
+    """BM25 inverted index over the skill catalog.
+
+    Besides the postings (term -> skill -> weighted term frequency), the
+    index keeps, per queried term, the postings sorted by BM25 impact.
+    Multi-word queries with a rare enough term first score the skills
+    matching every word. Otherwise queries walk the sorted lists in
+    parallel and stop as soon as no unseen skill can enter the top
+    results (Fagin's threshold algorithm), so a query rarely looks at
+    more than a handful of postings per term. The sorted lists are
+    rebuilt lazily after the catalog changes.
+    """
+
+    def __init__(self, skill_manager: SkillManager) -> None:
+        """Initialize the index and subscribe to catalog changes.
+
+        Args:
+            skill_manager: SkillManager whose catalog to index.
+        """
+        self.skill_manager = skill_manager
+        self._parser = SkillParser()
+        self._postings: dict[str, dict[str, float]] = {}
+        self._docs: dict[str, _Document] = {}
+        self._by_category: dict[str, set[str]] = {}
+        self._by_tag: dict[str, set[str]] = {}
+        self._impacts: dict[str, list[tuple[float, str]]] = {}
+        self._total_length = 0.0
+        self._built = False
+        self._lock = threading.Lock()
+
+        skill_manager.add_listener(self._on_catalog_changed)
+
+    def search(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 10,
+    ) -> list[SearchResult]:
+        """Find the skills best matching a query.
+
+        Args:
+            query: Free-text query. When empty, all skills passing the
+                filters are returned alphabetically.
+            category: Only return skills in this category or its subcategories.
+            tag: Only return skills with this tag (case-insensitive).
+            limit: Maximum number of results.
+
+        Returns:
+            Results ordered by descending score.
+        """
+        self._ensure_built()
+
+        with self._lock:
+            allowed = self._filter(category, tag)
+            terms = [term for term in dict.fromkeys(tokenize(query)) if term not in STOPWORDS]
+
+            if not terms:
+                names = sorted(self._docs if allowed is None else allowed)
+                return [SearchResult(self._docs[name].skill, 0.0) for name in names[:limit]]
+
+            terms = [term for term in terms if term in self._postings]
+            if not terms or limit <= 0:
+                return []
+
+            score = self._scorer(terms)
+            best: Optional[list[tuple[float, str]]] = None
+
+            if (
+                len(terms) > 1
+                and min(len(self._postings[term]) for term in terms) <= MATCH_ALL_LIMIT
+            ):
+                # Skills matching every term rank first, as long as the
+                # intersection is small enough to score exhaustively
+                candidates = self._match_all(terms, allowed)
+                if len(candidates) >= limit:
+                    best = heapq.nlargest(limit, ((score(name), name) for name in candidates))
+
+            if best is None:
+                lists = [self._impact_list(term) for term in terms]
+                if allowed is not None and len(allowed) <= sum(map(len, lists)):
+                    # Few skills pass the filters: score them all
+                    scored = ((score(name), name) for name in allowed)
+                    best = heapq.nlargest(limit, (item for item in scored if item[0] > 0))
+                else:
+                    best = self._top_k(lists, score, allowed, limit)
+
+            return [SearchResult(self._docs[name].skill, value) for value, name in best]
+
+    def count(self) -> int:
+        """Get the number of indexed skills."""
+        self._ensure_built()
+        return len(self._docs)
+
+    def _match_all(self, terms: list[str], allowed: Optional[set[str]]) -> list[str]:
+        """Get the skills containing every query term.
+
+        Args:
+            terms: Query terms present in the index.
+            allowed: Skills passing the filters, or None for all.
+
+        Returns:
+            Names of matching skills.
+        """
+        postings = sorted((self._postings[term] for term in terms), key=len)
+        if allowed is not None and len(allowed) < len(postings[0]):
+            first: Iterable[str] = allowed
+            rest: list[Container[str]] = list(postings)
+        else:
+            first, rest = postings[0], list(postings[1:])
+            if allowed is not None:
+                rest.append(allowed)
+
+        return [name for name in first if all(name in other for other in rest)]
+
+    def _top_k(
+        self,
+        lists: list[list[tuple[float, str]]],
+        score: Callable[[str], float],
+        allowed: Optional[set[str]],
+        limit: int,
+    ) -> list[tuple[float, str]]:
+        """Find the best-scoring skills with the threshold algorithm.
+
+        Args:
+            lists: Impact-sorted postings of each query term.
+            score: Function computing the full score of a skill.
+            allowed: Skills passing the filters, or None for all.
+            limit: Number of results.
+
+        Returns:
+            (score, name) pairs, best first.
+        """
+        heap: list[tuple[float, str]] = []
+        seen: set[str] = set()
+        depth = 0
+
+        while True:
+            threshold = 0.0
+            exhausted = True
+            for impacts in lists:
+                if depth >= len(impacts):
+                    continue
+                exhausted = False
+                impact, name = impacts[depth]
+                threshold += impact
+                if name in seen:
+                    continue
+                seen.add(name)
+                if allowed is not None and name not in allowed:
+                    continue
+                item = (score(name), name)
+                if len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+            # No skill further down any list can beat the current top results
+            if exhausted or (len(heap) == limit and heap[0][0] >= threshold):
+                break
+            depth += 1
+
+        return sorted(heap, reverse=True)
+
+    def _scorer(self, terms: list[str]) -> Callable[[str], float]:
+        """Build a function computing the BM25 score of a skill for a query.
+
+        Args:
+            terms: Query terms present in the index.
+
+        Returns:
+            Function mapping a skill name to its score (0.0 if no term matches).
+        """
+        docs = self._docs
+        avg_length = self._total_length / len(docs)
+        weighted = [(self._postings[term], self._idf(term) * (BM25_K1 + 1.0)) for term in terms]
+
+        def score(name: str) -> float:
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * docs[name].length / avg_length)
+            total = 0.0
+            for postings, weight in weighted:
+                tf = postings.get(name)
+                if tf is not None:
+                    total += weight * tf / (tf + norm)
+            return total
+
+        return score
+
+    def _idf(self, term: str) -> float:
+        """Compute the BM25 inverse document frequency of an indexed term."""
+        n_docs, df = len(self._docs), len(self._postings[term])
+        return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def _impact_list(self, term: str) -> list[tuple[float, str]]:
+        """Get a term's postings sorted by BM25 impact, best first.
+
+        Lists are cached until the index changes.
+
+        Args:
+            term: Indexed term.
+
+        Returns:
+            [(impact, name), ...].
+        """
+        impacts = self._impacts.get(term)
+        if impacts is None:
+            score = self._scorer([term])
+            impacts = sorted(((score(name), name) for name in self._postings[term]), reverse=True)
+            self._impacts[term] = impacts
+        return impacts
+
+    def _filter(self, category: Optional[str], tag: Optional[str]) -> Optional[set[str]]:
+        """Get the skills passing the category and tag filters.
+
+        Args:
+            category: Category; subcategories match too.
+            tag: Tag (case-insensitive).
+
+        Returns:
+            Set of skill names, or None if no filter is given.
+        """
+        allowed: Optional[set[str]] = None
+
+        if category:
+            allowed = set()
+            for name, members in self._by_category.items():
+                if name == category or name.startswith(category + "/"):
+                    allowed |= members
+
+        if tag:
+            tagged = self._by_tag.get(tag.lower(), set())
+            allowed = set(tagged) if allowed is None else allowed & tagged
+
+        return allowed
+
+    def _ensure_built(self) -> None:
+        """Index the whole catalog on first use."""
+        if self._built:
+            return
+
+        while True:
+            # Take the snapshot before locking: all() may run discovery, which
+            # calls back into _on_catalog_changed. Diffs reported before the
+            # index is built are dropped, so a snapshot the catalog moved
+            # past is retaken.
+            generation = self.skill_manager.generation
+            skills = self.skill_manager.all()
+
+            with self._lock:
+                if self._built:
+                    return
+                if self.skill_manager.generation != generation:
+                    continue
+                for skill in skills:
+                    self._add(skill)
+                self._built = True
+                break
+
+        logger.debug(f"Indexed {len(self._docs)} skills for search")
+
+    def _on_catalog_changed(self, diff: CatalogDiff) -> None:
+        """Re-index the skills a catalog refresh added, changed or removed.
+
+        Args:
+            diff: Catalog changes.
+        """
+        # Checked under the lock: once the generation check in _ensure_built
+        # passed, the index must see this diff
+        with self._lock:
+            if not self._built:
+                return
+
+        updated = {name: self.skill_manager.get(name) for name in [*diff.added, *diff.changed]}
+        with self._lock:
+            for name in [*diff.removed, *updated]:
+                self._remove(name)
+            for skill in updated.values():
+                if skill is not None:
+                    self._add(skill)
+
+    def _add(self, skill: SkillInfo) -> None:
+        """Index one skill (the caller holds the lock).
+
+        Args:
+            skill: Skill to index.
+        """
+        try:
+            headings = self._parser.read_headings(skill.location)
+        except SkillParseError as e:
+            logger.debug(f"Indexing {skill.name} without headings: {e}")
+            headings = []
+
+        fields = {
+            "name": _terms(skill.name),
+            "tags": [term for tag in skill.tags for term in _terms(tag)],
+            "category": _terms(skill.category or ""),
+            "description": _terms(skill.description),
+            "headings": [term for heading in headings for term in _terms(heading)],
+        }
+
+        frequencies: dict[str, float] = {}
+        length = 0.0
+        for field_name, terms in fields.items():
+            weight = FIELD_WEIGHTS[field_name]
+            length += weight * len(terms)
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        for term, tf in frequencies.items():
+            self._postings.setdefault(term, {})[skill.name] = tf
+
+        doc = _Document(
+            skill=skill,
+            length=length,
+            terms=tuple(frequencies),
+            tags=frozenset(tag.lower() for tag in skill.tags),
+        )
+        self._docs[skill.name] = doc
+        self._by_category.setdefault(skill.category or "uncategorized", set()).add(skill.name)
+        for tag in doc.tags:
+            self._by_tag.setdefault(tag, set()).add(skill.name)
+        self._total_length += length
+        self._impacts.clear()
+
+    def _remove(self, name: str) -> None:
+        """Drop one skill from the index (the caller holds the lock).
+
+        Args:
+            name: Skill name.
+        """
+        doc = self._docs.pop(name, None)
+        if doc is None:
+            return
+
+        for term in doc.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(name, None)
+                if not postings:
+                    del self._postings[term]
+
+        _discard(self._by_category, doc.skill.category or "uncategorized", name)
+        for tag in doc.tags:
+            _discard(self._by_tag, tag, name)
+        self._total_length -= doc.length
+        self._impacts.clear()
+
+
+def _discard(mapping: dict[str, set[str]], key: str, name: str) -> None:
+    """Remove a name from a set-valued mapping, dropping empty sets."""
+    members = mapping.get(key)
+    if members is not None:
+        members.discard(name)
+        if not members:
+            del mapping[key]
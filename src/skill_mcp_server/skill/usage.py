@@ -0,0 +1,118 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Persistent skill usage history.
+
+Counts how often each skill has been loaded, so the most-used skills
+can be listed first when the catalog has to be trimmed. Counts are kept
+in a small JSON file in the cache directory and survive restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger("skill.usage")
+
+# Bump whenever the on-disk layout changes
+USAGE_VERSION = 1
+
+
+class UsageHistory:
+    """Per-skill load counts, optionally persisted to a JSON file."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Initialize the history and load it from disk.
+
+        Args:
+            path: Optional file to persist the counts to.
+        """
+        self.path = path
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def record(self, name: str) -> None:
+        """Count one use of a skill and save the history.
+
+        Args:
+            name: Skill name.
+        """
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+            self._save()
+
+    def count(self, name: str) -> int:
+        """Get the number of recorded uses of a skill.
+
+        Args:
+            name: Skill name.
+
+        Returns:
+            Use count (0 if never used).
+        """
+        return self._counts.get(name, 0)
+
+    def most_used(self) -> list[str]:
+        """Get the names of all used skills, most used first.
+
+        Returns:
+            Skill names ordered by descending count, then by name.
+        """
+        with self._lock:
+            items = list(self._counts.items())
+        return [name for name, _ in sorted(items, key=lambda item: (-item[1], item[0]))]
+
+    def load(self) -> None:
+        """Load the counts from disk, ignoring missing or invalid files."""
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable usage history {self.path}: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != USAGE_VERSION:
+            logger.debug(f"Ignoring incompatible usage history {self.path}")
+            return
+
+        counts = data.get("counts", {})
+        with self._lock:
+            self._counts = {
+                name: count
+                for name, count in counts.items()
+                if isinstance(name, str) and isinstance(count, int) and count > 0
+            }
+
+    def _save(self) -> None:
+        """Write the counts to disk (the caller holds the lock)."""
+        if self.path is None:
+            return
+
+        data = {"version": USAGE_VERSION, "counts": self._counts}
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save usage history {self.path}: {e}")
+
+    def __len__(self) -> int:
+        """Get the number of skills with recorded uses."""
+        return len(self._counts)
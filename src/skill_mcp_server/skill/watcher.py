@@ -0,0 +1,400 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Filesystem watchers that keep the skill catalog live.
+
+Watchers run in a background thread and call SkillManager.refresh()
+after a burst of filesystem activity has settled. Catalog changes are
+reported through the manager's listeners.
+
+Two backends are available:
+- InotifyWatcher: Linux inotify via ctypes, no extra dependencies.
+- PollingWatcher: portable fallback that refreshes on a fixed interval.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+from ..config.defaults import WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+from ..utils.logging import get_logger
+from .manager import SkillManager
+
+logger = get_logger("skill.watcher")
+
+# inotify flags (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class WatcherError(Exception):
+    """Raised when a watcher backend cannot be started."""
+
+    pass
+
+
+class BaseWatcher(ABC):
+    """Abstract base class for catalog watchers.
+
+    Subclasses implement _run(), which blocks until the stop event is
+    set and calls _apply() whenever the catalog may have changed.
+    """
+
+    backend: str = ""
+
+    def __init__(self, skill_manager: SkillManager, debounce: float = WATCH_DEBOUNCE) -> None:
+        """Initialize the watcher.
+
+        Args:
+            skill_manager: SkillManager whose catalog to keep up to date.
+            debounce: Seconds of quiet to wait for after an event before refreshing.
+        """
+        self.skill_manager = skill_manager
+        self.debounce = debounce
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_safely,
+            name=f"skill-watcher-{self.backend}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(
+            f"Watching {len(self.skill_manager.skill_dirs)} skill directories ({self.backend})"
+        )
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop watching and wait for the background thread to exit.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run_safely(self) -> None:
+        """Run the watch loop, logging instead of dying silently."""
+        try:
+            self._run()
+        except Exception:
+            logger.exception(f"Skill watcher ({self.backend}) stopped unexpectedly")
+
+    def _apply(self, roots: Optional[set[Path]] = None) -> None:
+        """Refresh the catalog; listeners are notified by the manager.
+
+        Args:
+            roots: Skills roots to refresh, or None for all of them.
+        """
+        try:
+            self.skill_manager.refresh(roots=None if roots is None else list(roots))
+        except Exception:
+            logger.exception("Failed to refresh skills")
+
+    @abstractmethod
+    def _run(self) -> None:
+        """Watch loop; must return once the stop event is set."""
+        pass
+
+
+class PollingWatcher(BaseWatcher):
+    """Portable watcher that refreshes the catalog on a fixed interval.
+
+    Each poll is a SkillManager.refresh(), which only stats known files
+    and directories, so polling an unchanged tree is cheap.
+    """
+
+    backend = "poll"
+
+    def __init__(
+        self,
+        skill_manager: SkillManager,
+        interval: float = WATCH_POLL_INTERVAL,
+        **kwargs,
+    ) -> None:
+        """Initialize the polling watcher.
+
+        Args:
+            skill_manager: SkillManager whose catalog to keep up to date.
+            interval: Seconds between polls.
+            **kwargs: Additional arguments for BaseWatcher.
+        """
+        super().__init__(skill_manager, **kwargs)
+        self.interval = interval
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._apply()
+
+
+class InotifyWatcher(BaseWatcher):
+    """Linux watcher based on inotify, accessed through ctypes.
+
+    Watches the directories a SKILL.md can be created in or modified in
+    (as tracked by the catalog index), and re-syncs the watch set after
+    every refresh so new skill directories are picked up. Only the skills
+    roots that saw events are refreshed.
+    """
+
+    backend = "inotify"
+
+    def __init__(self, skill_manager: SkillManager, **kwargs) -> None:
+        """Initialize the inotify watcher.
+
+        Args:
+            skill_manager: SkillManager whose catalog to keep up to date.
+            **kwargs: Additional arguments for BaseWatcher.
+
+        Raises:
+            WatcherError: If inotify is not available on this system.
+        """
+        super().__init__(skill_manager, **kwargs)
+        self._libc = _load_libc()
+        self._fd = -1
+        self._wakeup_r, self._wakeup_w = -1, -1
+        self._watches: dict[str, int] = {}
+        self._roots: dict[int, Path] = {}
+        self._pending: set[Path] = set()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check if inotify can be used on this system.
+
+        Returns:
+            True if running on Linux with an inotify-capable libc.
+        """
+        try:
+            _load_libc()
+        except WatcherError:
+            return False
+        return True
+
+    def start(self) -> None:
+        """Create the inotify instance and start watching."""
+        if self._thread is not None:
+            return
+
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise WatcherError(f"inotify_init1 failed: {os.strerror(errno)}")
+
+        self._fd = fd
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._sync_watches()
+        super().start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop watching and release the inotify instance.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread.
+        """
+        self._stop.set()
+        if self._wakeup_w >= 0:
+            # Interrupt the blocking select() in the watch thread
+            os.write(self._wakeup_w, b"\0")
+
+        super().stop(timeout)
+        for fd in (self._fd, self._wakeup_r, self._wakeup_w):
+            if fd >= 0:
+                os.close(fd)
+        self._fd = self._wakeup_r = self._wakeup_w = -1
+        self._watches.clear()
+        self._roots.clear()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # Block until the first event of a burst arrives
+            if not self._wait(None):
+                continue
+
+            # Debounce: keep draining until the tree has been quiet for a while
+            while self._wait(self.debounce) and not self._stop.is_set():
+                pass
+
+            if self._stop.is_set():
+                return
+
+            roots, self._pending = self._pending, set()
+            # Events on a watch that was just dropped cannot be attributed
+            self._apply(roots or None)
+            added = self._sync_watches()
+            if added:
+                # A skill file may have been created in a new directory before
+                # its watch was added; the refresh catches it by directory mtime
+                self._apply(added)
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        """Wait for inotify events and drain them.
+
+        Args:
+            timeout: Seconds to wait, or None to block.
+
+        Returns:
+            True if any relevant event was read.
+        """
+        readable, _, _ = select.select([self._fd, self._wakeup_r], [], [], timeout)
+        if self._wakeup_r in readable:
+            os.read(self._wakeup_r, 64)
+        if self._fd not in readable:
+            return False
+        return self._drain()
+
+    def _drain(self) -> bool:
+        """Read all pending inotify events.
+
+        The skills roots the events belong to are added to the pending set.
+
+        Returns:
+            True if at least one event (other than watch removal) was read.
+        """
+        relevant = False
+
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size + length
+                if not mask & IN_IGNORED:
+                    relevant = True
+                    root = self._roots.get(wd)
+                    if root is not None:
+                        self._pending.add(root)
+
+        return relevant
+
+    def _sync_watches(self) -> set[Path]:
+        """Add watches for new directories and drop watches for removed ones.
+
+        Returns:
+            Skills roots for which a watch was added.
+        """
+        added: set[Path] = set()
+        wanted = self.skill_manager.watched_dirs()
+
+        for path in [p for p in self._watches if p not in wanted]:
+            # The kernel drops watches on deleted directories by itself
+            wd = self._watches.pop(path)
+            self._roots.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+        for path, root in wanted.items():
+            if path in self._watches:
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                logger.warning(f"Cannot watch {path}: {os.strerror(errno)}")
+                continue
+            self._watches[path] = wd
+            self._roots[wd] = root
+            added.add(root)
+
+        return added
+
+
+def _load_libc() -> ctypes.CDLL:
+    """Load libc with the inotify functions declared.
+
+    Returns:
+        ctypes handle to libc.
+
+    Raises:
+        WatcherError: If inotify is not available.
+    """
+    if not sys.platform.startswith("linux"):
+        raise WatcherError("inotify is only available on Linux")
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise WatcherError("libc does not provide inotify")
+
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+def create_watcher(
+    skill_manager: SkillManager,
+    backend: str = "auto",
+    debounce: float = WATCH_DEBOUNCE,
+    poll_interval: float = WATCH_POLL_INTERVAL,
+) -> BaseWatcher:
+    """Create a watcher for the given backend.
+
+    Args:
+        skill_manager: SkillManager whose catalog to keep up to date.
+        backend: "inotify", "poll", or "auto" (inotify when available).
+        debounce: Seconds of quiet to wait for before refreshing.
+        poll_interval: Seconds between polls for the polling backend.
+
+    Returns:
+        Watcher instance (not yet started).
+
+    Raises:
+        WatcherError: If the requested backend is unknown or unavailable.
+    """
+    if backend == "auto":
+        backend = "inotify" if InotifyWatcher.is_supported() else "poll"
+
+    if backend == "inotify":
+        return InotifyWatcher(skill_manager, debounce=debounce)
+    if backend == "poll":
+        return PollingWatcher(skill_manager, interval=poll_interval, debounce=debounce)
+
+    raise WatcherError(f"Unknown watcher backend: {backend}")
@@ -3,23 +3,36 @@
 
 """MCP Tools for Skill MCP Server."""
 
-from .base import BaseTool, ToolError
+from .base import BaseTool, ToolError, WorkspaceTool
 from .file_editor import FileEditorTool
 from .file_reader import FileReaderTool
 from .file_writer import FileWriterTool
+from .pagination import ReadMoreTool, ResponsePager
+from .progress import ProgressReporter, current_progress
 from .resource_reader import ResourceReaderTool
 from .script_executor import ScriptExecutorTool
 from .skill_lister import SkillListerTool
 from .skill_loader import SkillLoaderTool
+from .skill_search import SkillSearchTool
+from .workspace import Workspace, WorkspaceManager, current_workspace
 
 __all__ = [
     "BaseTool",
     "ToolError",
+    "WorkspaceTool",
+    "Workspace",
+    "WorkspaceManager",
+    "current_workspace",
+    "ProgressReporter",
+    "current_progress",
     "SkillLoaderTool",
     "SkillListerTool",
+    "SkillSearchTool",
     "ResourceReaderTool",
     "ScriptExecutorTool",
     "FileReaderTool",
     "FileWriterTool",
     "FileEditorTool",
+    "ReadMoreTool",
+    "ResponsePager",
 ]
@@ -5,11 +5,18 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
+import anyio
 from mcp.types import Tool
 
+from ..config.defaults import TOOL_CONCURRENCY
+from ..security.path_validator import PathValidator
+from .workspace import Workspace, current_workspace
+
 
 class ToolError(Exception):
     """Raised when a tool execution fails."""
@@ -24,8 +31,24 @@ class BaseTool(ABC):
     1. Define its name and description
     2. Define its input schema
     3. Implement the execute method
+
+    Tools that can wait without blocking may also override aexecute()
+    and set supports_async, so that calls run on the event loop.
+    Otherwise execute() runs in a worker thread, so it may block. Either
+    way, at most `concurrency` calls of the same tool run at once.
     """
 
+    # Maximum concurrent calls of this tool (overridable per tool name in Settings)
+    concurrency: int = TOOL_CONCURRENCY
+
+    # Argument naming the skill whose code a call runs; such calls are
+    # also limited per skill
+    skill_argument: Optional[str] = None
+
+    # Whether calls go through aexecute() on the event loop instead of
+    # execute() in a worker thread
+    supports_async: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -56,6 +79,19 @@ class BaseTool(ABC):
         """
         pass
 
+    @property
+    def revision(self) -> int:
+        """Get the revision of the tool definition.
+
+        Tools whose description or schema depends on mutable state return
+        a value that changes whenever the definition does; static tools
+        keep the default.
+
+        Returns:
+            Revision number.
+        """
+        return 0
+
     @abstractmethod
     def execute(self, **kwargs: Any) -> str:
         """Execute the tool with the given arguments.
@@ -71,6 +107,23 @@ class BaseTool(ABC):
         """
         pass
 
+    async def aexecute(self, **kwargs: Any) -> str:
+        """Execute the tool on the event loop.
+
+        The default runs execute() in a worker thread. Tools overriding
+        it (and setting supports_async) must not block.
+
+        Args:
+            **kwargs: Tool-specific arguments.
+
+        Returns:
+            Result string to return to the client.
+
+        Raises:
+            ToolError: If execution fails.
+        """
+        return await anyio.to_thread.run_sync(functools.partial(self.execute, **kwargs))
+
     def to_mcp_tool(self) -> Tool:
         """Convert to MCP Tool object.
 
@@ -82,3 +135,34 @@ class BaseTool(ABC):
             description=self.description,
             inputSchema=self.input_schema,
         )
+
+
+class WorkspaceTool(BaseTool):
+    """Base class for tools working in a workspace directory.
+
+    The workspace is the calling session's (see current_workspace) when
+    per-session workspaces are enabled, and the configured one otherwise.
+    """
+
+    def __init__(self, workspace_dir: Path) -> None:
+        """Initialize the tool.
+
+        Args:
+            workspace_dir: Default workspace directory.
+        """
+        self.default_workspace = Workspace(workspace_dir)
+
+    @property
+    def workspace(self) -> Workspace:
+        """Get the workspace of the current call."""
+        return current_workspace.get() or self.default_workspace
+
+    @property
+    def workspace_dir(self) -> Path:
+        """Get the workspace directory of the current call."""
+        return self.workspace.root
+
+    @property
+    def path_validator(self) -> PathValidator:
+        """Get the path validator of the current call's workspace."""
+        return self.workspace.path_validator
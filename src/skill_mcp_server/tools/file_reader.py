@@ -6,17 +6,18 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from ..security.file_validator import FileValidationError, FileValidator
-from ..security.path_validator import PathValidationError, PathValidator
+from ..security.path_validator import PathValidationError
 from ..utils.logging import get_logger
-from .base import BaseTool, ToolError
+from .base import ToolError, WorkspaceTool
+from .pagination import ResponsePager
 
 logger = get_logger("tools.file_reader")
 
 
-class FileReaderTool(BaseTool):
+class FileReaderTool(WorkspaceTool):
     """Tool for reading files from the workspace directory.
 
     This tool allows reading files that have been created by skills
@@ -27,16 +28,18 @@ class FileReaderTool(BaseTool):
         self,
         workspace_dir: Path,
         file_validator: FileValidator,
+        pager: Optional[ResponsePager] = None,
     ) -> None:
         """Initialize the tool.
 
         Args:
             workspace_dir: Path to the workspace directory.
             file_validator: FileValidator for checking file restrictions.
+            pager: Optional ResponsePager limiting the response size.
         """
-        self.workspace_dir = workspace_dir
-        self.path_validator = PathValidator(workspace_dir)
+        super().__init__(workspace_dir)
         self.file_validator = file_validator
+        self.pager = pager or ResponsePager(page_chars=0)
 
     @property
     def name(self) -> str:
@@ -98,7 +101,7 @@ class FileReaderTool(BaseTool):
 
         line_count = len(content.splitlines())
 
-        return (
+        return self.pager.paginate(
             f"## File: {file_path}\n"
             f"**Workspace**: {self.workspace_dir}\n"
             f"**Size**: {file_size} bytes ({line_count} lines)\n\n"
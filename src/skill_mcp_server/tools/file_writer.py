@@ -9,14 +9,14 @@ from pathlib import Path
 from typing import Any
 
 from ..security.file_validator import FileValidationError, FileValidator
-from ..security.path_validator import PathValidationError, PathValidator
+from ..security.path_validator import PathValidationError
 from ..utils.logging import get_logger
-from .base import BaseTool, ToolError
+from .base import ToolError, WorkspaceTool
 
 logger = get_logger("tools.file_writer")
 
 
-class FileWriterTool(BaseTool):
+class FileWriterTool(WorkspaceTool):
     """Tool for creating or overwriting files in the workspace.
 
     This tool allows skills to generate output files in the
@@ -34,8 +34,7 @@ class FileWriterTool(BaseTool):
             workspace_dir: Path to the workspace directory.
             file_validator: FileValidator for checking file restrictions.
         """
-        self.workspace_dir = workspace_dir
-        self.path_validator = PathValidator(workspace_dir)
+        super().__init__(workspace_dir)
         self.file_validator = file_validator
 
     @property
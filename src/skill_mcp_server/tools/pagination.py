@@ -0,0 +1,236 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Size-capped tool responses with continuation cursors.
+
+A response longer than the page size is cut (at a line break where
+possible) and ends with a marker giving a cursor. The rest of the text
+is kept in a short-lived in-memory buffer, from which the `read_more`
+tool returns it page by page, so a large file or script output is
+neither sent in one message nor produced twice.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from ..config.defaults import RESPONSE_BUFFER_MAX_CHARS, RESPONSE_BUFFER_TTL, RESPONSE_MAX_CHARS
+from ..utils.logging import get_logger
+from .base import BaseTool, ToolError
+
+logger = get_logger("tools.pagination")
+
+
+class _Remainder(NamedTuple):
+    """Unsent part of a response."""
+
+    text: str
+    start: int  # offset of text in the full response
+    total: int  # length of the full response
+    expires: float  # time.monotonic() deadline
+
+
+class ResponsePager:
+    """Splits long responses into pages and buffers the remainders.
+
+    Remainders expire after `ttl` seconds; when their total size exceeds
+    `max_buffer_chars`, the least recently read ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        page_chars: int = RESPONSE_MAX_CHARS,
+        ttl: float = RESPONSE_BUFFER_TTL,
+        max_buffer_chars: int = RESPONSE_BUFFER_MAX_CHARS,
+    ) -> None:
+        """Initialize the pager.
+
+        Args:
+            page_chars: Maximum characters per response (0 = no limit).
+            ttl: Seconds a remainder stays readable.
+            max_buffer_chars: Maximum total characters of buffered remainders.
+        """
+        self.page_chars = max(0, page_chars)
+        self.ttl = ttl
+        self.max_buffer_chars = max(0, max_buffer_chars)
+        self._remainders: OrderedDict[str, _Remainder] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def paginate(self, text: str) -> str:
+        """Get the first page of a response, buffering the rest.
+
+        Args:
+            text: Full response.
+
+        Returns:
+            The response itself if it fits in a page, otherwise its first
+            page followed by a continuation marker.
+        """
+        if not self.page_chars or len(text) <= self.page_chars:
+            return text
+        return self._page(text, 0, len(text))
+
+    def read(self, cursor: str) -> str:
+        """Get the page a cursor points to.
+
+        Args:
+            cursor: Cursor from a continuation marker.
+
+        Returns:
+            The page, followed by a continuation marker if more remains.
+
+        Raises:
+            ToolError: If the cursor is malformed, unknown or expired.
+        """
+        key, _, offset_str = cursor.strip().partition(".")
+        try:
+            offset = int(offset_str, 16)
+        except ValueError:
+            raise ToolError(f"Invalid cursor: {cursor!r}") from None
+
+        with self._lock:
+            self._expire()
+            remainder = self._remainders.get(key)
+            if remainder is not None:
+                self._remainders.move_to_end(key)
+
+        if remainder is None or not remainder.start <= offset <= remainder.start + len(
+            remainder.text
+        ):
+            raise ToolError(
+                "Cursor expired or unknown; repeat the original call to get the output again"
+            )
+
+        relative = offset - remainder.start
+        return self._page(remainder.text[relative:], offset, remainder.total, key)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the number and total size of buffered remainders."""
+        with self._lock:
+            return {"buffered": len(self._remainders), "buffered_chars": self._size}
+
+    def _page(self, text: str, start: int, total: int, key: Optional[str] = None) -> str:
+        """Cut one page off a text and describe where the rest is.
+
+        Args:
+            text: Text from the page's start to the end of the response.
+            start: Offset of text in the full response.
+            total: Length of the full response.
+            key: Buffer key of the remainder text belongs to, if any.
+
+        Returns:
+            Page text with a marker.
+        """
+        if self.page_chars and len(text) > self.page_chars:
+            cut = text.rfind("\n", self.page_chars // 2, self.page_chars)
+            cut = cut + 1 if cut != -1 else self.page_chars
+        else:
+            cut = len(text)
+
+        end = start + cut
+        if end >= total:
+            return f"{text}\n\n[Characters {start + 1}-{total} of {total}; end of output]"
+
+        if key is None:
+            key = self._store(text[cut:], end, total)
+            if key is None:
+                return (
+                    f"{text[:cut]}\n\n[Output truncated: characters 1-{end} of {total} shown; "
+                    "the rest is too large to keep]"
+                )
+        return (
+            f"{text[:cut]}\n\n[Output truncated: characters {start + 1}-{end} of {total} shown. "
+            f'Call read_more with cursor "{key}.{end:x}" for the next page.]'
+        )
+
+    def _store(self, text: str, start: int, total: int) -> Optional[str]:
+        """Buffer a remainder.
+
+        Args:
+            text: Remainder.
+            start: Offset of text in the full response.
+            total: Length of the full response.
+
+        Returns:
+            Buffer key, or None if the remainder is larger than the buffer.
+        """
+        if len(text) > self.max_buffer_chars:
+            return None
+
+        key = secrets.token_urlsafe(12)
+        with self._lock:
+            self._expire()
+            self._remainders[key] = _Remainder(text, start, total, time.monotonic() + self.ttl)
+            self._size += len(text)
+            while self._size > self.max_buffer_chars:
+                _, dropped = self._remainders.popitem(last=False)
+                self._size -= len(dropped.text)
+        return key
+
+    def _expire(self) -> None:
+        """Drop expired remainders (the caller holds the lock)."""
+        now = time.monotonic()
+        for key, remainder in list(self._remainders.items()):
+            if remainder.expires <= now:
+                del self._remainders[key]
+                self._size -= len(remainder.text)
+
+
+class ReadMoreTool(BaseTool):
+    """Tool returning further pages of a truncated response."""
+
+    def __init__(self, pager: ResponsePager) -> None:
+        """Initialize the tool.
+
+        Args:
+            pager: ResponsePager shared with the tools whose output it pages.
+        """
+        self.pager = pager
+
+    @property
+    def name(self) -> str:
+        return "read_more"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Get the next page of a truncated tool response. "
+            "When a response ends with '[Output truncated ... cursor \"...\"]', "
+            "call this tool with that cursor instead of repeating the original call. "
+            f"Cursors expire after {int(self.pager.ttl)} seconds."
+        )
+
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "cursor": {
+                    "type": "string",
+                    "description": "Cursor from the truncation marker of the previous page",
+                },
+            },
+            "required": ["cursor"],
+        }
+
+    def execute(self, cursor: str = "", **kwargs: Any) -> str:
+        """Get the page a cursor points to.
+
+        Args:
+            cursor: Continuation cursor.
+
+        Returns:
+            Page text.
+        """
+        if not cursor:
+            raise ToolError("cursor is required")
+
+        try:
+            return self.pager.read(cursor)
+        except ToolError as e:
+            return f"Error: {e}"
@@ -0,0 +1,168 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Progress notifications for long-running tool calls.
+
+When a client passes a progress token with a tool call, the server sets
+`current_progress` to a ProgressReporter for the duration of the call.
+Tools feed it output as it is produced; the reporter batches that output
+and sends it as MCP progress notifications, at most one per interval,
+so chatty scripts do not flood the transport.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+import anyio
+
+from ..config.defaults import PROGRESS_INTERVAL, PROGRESS_MAX_CHARS
+from ..utils.logging import get_logger
+
+logger = get_logger("tools.progress")
+
+# Sends one progress notification: (progress, message)
+ProgressSender = Callable[[float, str], Awaitable[None]]
+
+# Progress reporter of the current tool call (None = client did not ask)
+current_progress: ContextVar[Optional[ProgressReporter]] = ContextVar(
+    "current_progress", default=None
+)
+
+
+class ProgressReporter:
+    """Batches tool output into throttled progress notifications.
+
+    The progress value is the number of characters of output seen so
+    far, which only grows, as the protocol requires. Each notification's
+    message carries the output received since the previous one, stderr
+    lines prefixed with "[stderr] "; if that exceeds max_chars, only the
+    last max_chars are sent.
+    """
+
+    def __init__(
+        self,
+        send: ProgressSender,
+        interval: float = PROGRESS_INTERVAL,
+        max_chars: int = PROGRESS_MAX_CHARS,
+    ) -> None:
+        """Initialize the reporter.
+
+        Args:
+            send: Coroutine function sending one notification.
+            interval: Minimum seconds between notifications (0 = send
+                every chunk of output as it arrives).
+            max_chars: Maximum characters of output per notification.
+        """
+        self._send = send
+        self.interval = interval
+        self.max_chars = max_chars
+        self._pending: deque[str] = deque()
+        self._pending_chars = 0
+        self._skipped = 0
+        # Incomplete last line of each stream, and streams whose last
+        # line was sent before it was complete
+        self._partial: dict[str, str] = {}
+        self._split: set[str] = set()
+        self._progress = 0
+        self._wakeup = anyio.Event()
+        self._failed = False
+
+    def output(self, stream: str, text: str) -> None:
+        """Queue output for the next notification.
+
+        Does not block; safe to call from the event loop while output is
+        being read.
+
+        Args:
+            stream: "stdout" or "stderr".
+            text: Decoded chunk of output.
+        """
+        if not text:
+            return
+        self._progress += len(text)
+
+        lines = (self._partial.pop(stream, "") + text).split("\n")
+        if stream in self._split:
+            # The rest of a line already sent: skip its bare line end
+            self._split.discard(stream)
+            if len(lines) > 1 and not lines[0]:
+                del lines[0]
+        if lines[-1]:
+            self._partial[stream] = lines[-1]
+        for line in lines[:-1]:
+            self._queue(stream, line)
+        self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Send everything queued so far, including incomplete lines."""
+        for stream, line in self._partial.items():
+            self._queue(stream, line)
+            self._split.add(stream)
+        self._partial.clear()
+
+        if not self._pending or self._failed:
+            return
+
+        message = "\n".join(self._pending)
+        skipped = self._skipped
+        if len(message) > self.max_chars:
+            skipped += len(message) - self.max_chars
+            message = message[-self.max_chars :]
+        if skipped:
+            message = f"[... {skipped} characters skipped]\n{message}"
+        self._pending.clear()
+        self._pending_chars = 0
+        self._skipped = 0
+
+        try:
+            await self._send(float(self._progress), message)
+        except Exception as e:
+            # The client went away; the call itself carries on
+            logger.debug(f"Stopped sending progress: {e}")
+            self._failed = True
+
+    @contextlib.asynccontextmanager
+    async def streaming(self) -> AsyncIterator[ProgressReporter]:
+        """Send queued output in the background while the block runs.
+
+        The remaining output is flushed when the block exits normally.
+
+        Yields:
+            The reporter itself.
+        """
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(self._run)
+            try:
+                yield self
+            finally:
+                tg.cancel_scope.cancel()
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush queued output, at most once per interval."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup = anyio.Event()
+            started = time.monotonic()
+            await self.flush()
+            await anyio.sleep(self.interval - (time.monotonic() - started))
+
+    def _queue(self, stream: str, line: str) -> None:
+        """Add one line of output to the next notification."""
+        if stream != "stdout":
+            line = f"[{stream}] {line}"
+        self._pending.append(line)
+        self._pending_chars += len(line) + 1
+        # Drop the oldest lines once they can no longer be sent
+        while (
+            len(self._pending) > 1 and self._pending_chars - len(self._pending[0]) > self.max_chars
+        ):
+            dropped = len(self._pending.popleft()) + 1
+            self._pending_chars -= dropped
+            self._skipped += dropped
@@ -5,13 +5,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from ..security.file_validator import FileValidationError, FileValidator
 from ..security.path_validator import PathValidationError, PathValidator
 from ..skill.manager import SkillManager
 from ..utils.logging import get_logger
 from .base import BaseTool, ToolError
+from .pagination import ResponsePager
 
 logger = get_logger("tools.resource_reader")
 
@@ -27,15 +28,18 @@ class ResourceReaderTool(BaseTool):
         self,
         skill_manager: SkillManager,
         file_validator: FileValidator,
+        pager: Optional[ResponsePager] = None,
     ) -> None:
         """Initialize the tool.
 
         Args:
             skill_manager: SkillManager instance.
             file_validator: FileValidator for checking file restrictions.
+            pager: Optional ResponsePager limiting the response size.
         """
         self.skill_manager = skill_manager
         self.file_validator = file_validator
+        self.pager = pager or ResponsePager(page_chars=0)
 
     @property
     def name(self) -> str:
@@ -97,14 +101,19 @@ class ResourceReaderTool(BaseTool):
             available = ", ".join(self.skill_manager.names()) or "none"
             return f'Skill "{skill_name}" not found. Available skills: {available}'
 
-        # Validate path is within skill directory
+        # Files listed in the skill's manifest are known to exist inside the
+        # skill directory; anything else goes through full path validation
         base_dir = skill.base_dir
-        path_validator = PathValidator(base_dir)
+        entry = self.skill_manager.get_manifest(skill).get(resource_path)
+        if entry is not None:
+            target_path = base_dir / entry.path
+        else:
+            path_validator = PathValidator(base_dir)
 
-        try:
-            target_path = path_validator.validate_file(resource_path)
-        except PathValidationError as e:
-            return f"Error: {e}"
+            try:
+                target_path = path_validator.validate_file(resource_path)
+            except PathValidationError as e:
+                return f"Error: {e}"
 
         # Validate file type and size
         try:
@@ -140,7 +149,7 @@ class ResourceReaderTool(BaseTool):
         Returns:
             Formatted output.
         """
-        return (
+        return self.pager.paginate(
             f"## Resource: {resource_path}\n"
             f"**Skill**: {skill_name}\n"
             f"**Size**: {file_size} bytes\n\n"
@@ -5,33 +5,54 @@
 
 from __future__ import annotations
 
+import contextlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from ..executor.base import ExecutionError
-from ..executor.factory import get_executor
+import anyio
+
+from ..executor.base import BaseExecutor, ExecutionError
+from ..executor.factory import ExecutorFactory, get_executor, get_executor_factory
 from ..security.file_validator import FileValidationError, FileValidator
 from ..security.path_validator import PathValidationError, PathValidator
 from ..skill.manager import SkillManager
+from ..skill.models import SkillInfo
 from ..utils.logging import get_logger
-from .base import BaseTool, ToolError
+from .base import ToolError, WorkspaceTool
+from .pagination import ResponsePager
+from .progress import current_progress
 
 logger = get_logger("tools.script_executor")
 
 
-class ScriptExecutorTool(BaseTool):
+class _Rejected(Exception):
+    """A script request that is answered with a message instead of a run."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+        self.message = message
+
+
+class ScriptExecutorTool(WorkspaceTool):
     """Tool for executing scripts from a skill's directory.
 
     This tool executes Python, Shell, JavaScript, or TypeScript
     scripts that are bundled with a skill.
     """
 
+    # Scripts run as subprocesses awaited on the event loop, not in threads
+    concurrency = 16
+    skill_argument = "skill_name"
+    supports_async = True
+
     def __init__(
         self,
         skill_manager: SkillManager,
         file_validator: FileValidator,
         workspace_dir: Path,
         script_timeout: int = 120,
+        pager: Optional[ResponsePager] = None,
+        executor_factory: Optional[ExecutorFactory] = None,
     ) -> None:
         """Initialize the tool.
 
@@ -40,11 +61,16 @@ class ScriptExecutorTool(BaseTool):
             file_validator: FileValidator for checking file restrictions.
             workspace_dir: Working directory for script execution.
             script_timeout: Timeout in seconds.
+            pager: Optional ResponsePager limiting the response size.
+            executor_factory: Optional ExecutorFactory to pick executors
+                from (default: the global one).
         """
+        super().__init__(workspace_dir)
         self.skill_manager = skill_manager
         self.file_validator = file_validator
-        self.workspace_dir = workspace_dir
         self.script_timeout = script_timeout
+        self.pager = pager or ResponsePager(page_chars=0)
+        self.executor_factory = executor_factory
 
     @property
     def name(self) -> str:
@@ -52,13 +78,24 @@ class ScriptExecutorTool(BaseTool):
 
     @property
     def description(self) -> str:
+        kinds = [
+            f"{executor.language} ({'/'.join(executor.extensions)})"
+            for executor in self._factory().available_executors()
+        ]
+        if len(kinds) > 1:
+            kinds[-1] = f"or {kinds[-1]}"
         return (
             "Execute a script from a skill's scripts/ directory. "
-            "Use this tool to run Python (.py), Shell (.sh/.bash), "
-            "JavaScript (.js), or TypeScript (.ts) scripts bundled with a skill. "
+            f"Use this tool to run {(', ' if len(kinds) > 2 else ' ').join(kinds)} "
+            "scripts bundled with a skill. "
             "Scripts are executed in the workspace directory."
         )
 
+    @property
+    def revision(self) -> int:
+        """The description lists the available runtimes."""
+        return self._factory().generation
+
     @property
     def input_schema(self) -> dict[str, Any]:
         return {
@@ -98,6 +135,96 @@ class ScriptExecutorTool(BaseTool):
         Returns:
             Script execution output.
         """
+        try:
+            _, executor, target_path, arg_list = self._prepare(skill_name, script_path, args)
+        except _Rejected as e:
+            return e.message
+
+        try:
+            result = executor.execute(
+                script_path=target_path,
+                working_dir=self.workspace_dir,
+                args=arg_list,
+            )
+        except ExecutionError as e:
+            return f"Error executing script: {e}"
+
+        return self.pager.paginate(self._format_output(script_path, skill_name, result))
+
+    async def aexecute(
+        self,
+        skill_name: str = "",
+        script_path: str = "",
+        args: str = "",
+        **kwargs: Any,
+    ) -> str:
+        """Execute a script from a skill without holding a thread.
+
+        If the client asked for progress (see current_progress), the
+        script's output is streamed as progress notifications while it
+        runs.
+
+        Args:
+            skill_name: Name of the skill.
+            script_path: Relative path to the script.
+            args: Command-line arguments.
+
+        Returns:
+            Script execution output.
+        """
+        workspace = self.workspace
+
+        def prepare() -> tuple[SkillInfo, BaseExecutor, Path, list[str], Path]:
+            # Reads the skill's manifest and may create the workspace
+            return (*self._prepare(skill_name, script_path, args), workspace.root)
+
+        try:
+            skill, executor, target_path, arg_list, working_dir = await anyio.to_thread.run_sync(
+                prepare
+            )
+        except _Rejected as e:
+            return e.message
+
+        progress = current_progress.get()
+        try:
+            async with progress.streaming() if progress else contextlib.nullcontext():
+                result = await executor.aexecute(
+                    script_path=target_path,
+                    working_dir=working_dir,
+                    args=arg_list,
+                    on_output=progress.output if progress else None,
+                    preload=skill.preload,
+                )
+        except ExecutionError as e:
+            return f"Error executing script: {e}"
+
+        return self.pager.paginate(self._format_output(script_path, skill_name, result))
+
+    def _factory(self) -> ExecutorFactory:
+        """Get the factory scripts are run with.
+
+        Returns:
+            The tool's ExecutorFactory, or the global one.
+        """
+        return self.executor_factory or get_executor_factory(timeout=self.script_timeout)
+
+    def _prepare(
+        self, skill_name: str, script_path: str, args: str
+    ) -> tuple[SkillInfo, BaseExecutor, Path, list[str]]:
+        """Validate a script request and pick its executor.
+
+        Args:
+            skill_name: Name of the skill.
+            script_path: Relative path to the script.
+            args: Command-line arguments.
+
+        Returns:
+            Tuple of (skill, executor, absolute script path, argument list).
+
+        Raises:
+            ToolError: If a required argument is missing.
+            _Rejected: If the skill or script cannot be run.
+        """
         logger.info(f"Executing script: {skill_name}/{script_path} {args}")
 
         # Validate inputs
@@ -110,43 +237,40 @@ class ScriptExecutorTool(BaseTool):
         skill = self.skill_manager.get(skill_name)
         if not skill:
             available = ", ".join(self.skill_manager.names()) or "none"
-            return f'Skill "{skill_name}" not found. Available skills: {available}'
+            raise _Rejected(f'Skill "{skill_name}" not found. Available skills: {available}')
 
-        # Validate path is within skill directory
+        # Files listed in the skill's manifest are known to exist inside the
+        # skill directory; anything else goes through full path validation
         base_dir = skill.base_dir
-        path_validator = PathValidator(base_dir)
+        entry = self.skill_manager.get_manifest(skill).get(script_path)
+        if entry is not None:
+            target_path = base_dir / entry.path
+        else:
+            path_validator = PathValidator(base_dir)
 
-        try:
-            target_path = path_validator.validate_file(script_path)
-        except PathValidationError as e:
-            return f"Error: {e}"
+            try:
+                target_path = path_validator.validate_file(script_path)
+            except PathValidationError as e:
+                raise _Rejected(f"Error: {e}") from e
 
         # Validate script extension
         try:
             self.file_validator.validate_for_script(target_path)
         except FileValidationError as e:
-            return f"Error: {e}"
+            raise _Rejected(f"Error: {e}") from e
 
         # Get executor for this script type
         try:
-            executor = get_executor(target_path, timeout=self.script_timeout)
+            executor = get_executor(
+                target_path, timeout=self.script_timeout, factory=self.executor_factory
+            )
         except ExecutionError as e:
-            return f"Error: {e}"
+            raise _Rejected(f"Error: {e}") from e
 
         # Parse arguments
         arg_list = args.split() if args.strip() else []
 
-        # Execute the script
-        try:
-            result = executor.execute(
-                script_path=target_path,
-                working_dir=self.workspace_dir,
-                args=arg_list,
-            )
-        except ExecutionError as e:
-            return f"Error executing script: {e}"
-
-        return self._format_output(script_path, skill_name, result)
+        return skill, executor, target_path, arg_list
 
     def _format_output(self, script_path: str, skill_name: str, result) -> str:
         """Format the execution result.
@@ -189,6 +313,10 @@ class ScriptExecutorTool(BaseTool):
                 ]
             )
 
+        note = result.truncation_note(self.workspace_dir)
+        if note:
+            parts.append(note)
+
         if result.timed_out:
             parts.append(f"**Status**: Timed out after {self.script_timeout} seconds")
         elif result.success:
@@ -63,8 +63,8 @@ class SkillListerTool(BaseTool):
         """
         logger.info("Listing all skills")
 
-        # Force reload to get latest skills
-        self.skill_manager.reload()
+        # Pick up added, changed and removed skills
+        self.skill_manager.refresh()
         skills = self.skill_manager.all()
 
         if not skills:
@@ -96,10 +96,16 @@ class SkillListerTool(BaseTool):
         output = [
             f"## Available Skills ({len(skills)} total)",
             "",
-            f"**Skills directory**: {self.skills_dir}",
-            "",
         ]
 
+        skill_dirs = self.skill_manager.skill_dirs
+        if len(skill_dirs) > 1:
+            output.append("**Skills directories** (highest priority first):")
+            output.extend(f"  - {skill_dir}" for skill_dir in skill_dirs)
+        else:
+            output.append(f"**Skills directory**: {self.skills_dir}")
+        output.append("")
+
         # Group by category
         by_category = self.skill_manager.list_by_category()
 
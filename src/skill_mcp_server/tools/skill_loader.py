@@ -5,9 +5,20 @@
 
 from __future__ import annotations
 
-from typing import Any
-
+import heapq
+from typing import Any, Optional, Sequence
+
+from ..config.defaults import (
+    CATALOG_DESCRIPTION_CHARS,
+    CATALOG_MAX_CHARS,
+    CATALOG_MAX_SKILLS,
+    CATALOG_MAX_TOKENS,
+    CHARS_PER_TOKEN,
+)
 from ..skill.manager import SkillManager
+from ..skill.models import SkillInfo
+from ..skill.parser import SkillParseError
+from ..skill.usage import UsageHistory
 from ..utils.logging import get_logger
 from .base import BaseTool, ToolError
 
@@ -21,13 +32,31 @@ class SkillLoaderTool(BaseTool):
     including available scripts and resources.
     """
 
-    def __init__(self, skill_manager: SkillManager) -> None:
+    def __init__(
+        self,
+        skill_manager: SkillManager,
+        usage: Optional[UsageHistory] = None,
+        pinned: Sequence[str] = (),
+        max_skills: int = CATALOG_MAX_SKILLS,
+        max_chars: int = CATALOG_MAX_CHARS,
+        max_tokens: int = CATALOG_MAX_TOKENS,
+    ) -> None:
         """Initialize the tool.
 
         Args:
             skill_manager: SkillManager instance for accessing skills.
+            usage: Usage history, used to rank skills and updated on every load.
+            pinned: Skills always listed first in the description, in order.
+            max_skills: Maximum skills listed in the description (0 = no limit).
+            max_chars: Maximum characters of the skill list (0 = no limit).
+            max_tokens: Approximate maximum tokens of the skill list
+                (0 = no limit), counted as CHARS_PER_TOKEN characters each.
         """
         self.skill_manager = skill_manager
+        self.usage = usage if usage is not None else UsageHistory()
+        self.pinned = tuple(pinned)
+        self.max_skills = max_skills
+        self.max_chars = _char_budget(max_chars, max_tokens)
 
     @property
     def name(self) -> str:
@@ -35,7 +64,13 @@ class SkillLoaderTool(BaseTool):
 
     @property
     def description(self) -> str:
-        """Generate description with available skills list."""
+        """Generate description with available skills list.
+
+        The list is bounded by the catalog budget: pinned skills first,
+        then the most used, then the rest alphabetically. Skills that do
+        not fit are summarized with a pointer to list_skills and
+        search_skills.
+        """
         skills = self.skill_manager.all()
 
         if not skills:
@@ -44,15 +79,29 @@ class SkillLoaderTool(BaseTool):
                 "No skills are currently available."
             )
 
-        skill_list = "\n".join(
-            [
+        entries: list[str] = []
+        used = 0
+        for skill in self._rank(skills):
+            entry = (
                 f"  <skill>\n"
                 f"    <name>{skill.name}</name>\n"
-                f"    <description>{skill.description}</description>\n"
+                f"    <description>{_truncate(skill.description)}</description>\n"
                 f"  </skill>"
-                for skill in skills
-            ]
-        )
+            )
+            if self.max_chars and used + len(entry) + 1 > self.max_chars:
+                break
+            entries.append(entry)
+            used += len(entry) + 1
+
+        skill_list = "\n".join(entries)
+        omitted = len(skills) - len(entries)
+        if omitted:
+            skill_list += (
+                f'\n  <more_skills count="{omitted}">'
+                f"{omitted} more skills are not listed here. "
+                "Use search_skills to find skills by keyword or list_skills to see all of them."
+                "</more_skills>"
+            )
 
         return (
             "Load a skill to get detailed instructions for a specific task. "
@@ -61,6 +110,11 @@ class SkillLoaderTool(BaseTool):
             f"<available_skills>\n{skill_list}\n</available_skills>"
         )
 
+    @property
+    def revision(self) -> int:
+        """The description lists the catalog, so it follows its generation."""
+        return self.skill_manager.generation
+
     @property
     def input_schema(self) -> dict[str, Any]:
         return {
@@ -93,7 +147,32 @@ class SkillLoaderTool(BaseTool):
         if not skill:
             return self._format_not_found(name)
 
-        return self._format_skill(skill)
+        result = self._format_skill(skill)
+        self.usage.record(skill.name)
+        return result
+
+    def _rank(self, skills: list[SkillInfo]) -> list[SkillInfo]:
+        """Order skills for the description and apply the skill count limit.
+
+        Args:
+            skills: All skills in the catalog.
+
+        Returns:
+            Pinned skills, then by descending use count, then by name.
+        """
+        by_name = {skill.name: skill for skill in skills}
+        ranked: list[SkillInfo] = []
+        for name in dict.fromkeys([*self.pinned, *self.usage.most_used()]):
+            skill = by_name.pop(name, None)
+            if skill is not None:
+                ranked.append(skill)
+
+        if not self.max_skills:
+            return ranked + [by_name[name] for name in sorted(by_name)]
+        if len(ranked) >= self.max_skills:
+            return ranked[: self.max_skills]
+        rest = heapq.nsmallest(self.max_skills - len(ranked), by_name)
+        return ranked + [by_name[name] for name in rest]
 
     def _format_not_found(self, name: str) -> str:
         """Format error message when skill is not found.
@@ -107,14 +186,20 @@ class SkillLoaderTool(BaseTool):
         all_skills = self.skill_manager.all()
 
         if all_skills:
+            shown = self._rank(all_skills)
             skill_list = "\n".join(
                 [
                     f"  - {s.name}: {s.description[:80]}..."
                     if len(s.description) > 80
                     else f"  - {s.name}: {s.description}"
-                    for s in all_skills
+                    for s in shown
                 ]
             )
+            if len(shown) < len(all_skills):
+                skill_list += (
+                    f"\n  ... and {len(all_skills) - len(shown)} more "
+                    "(use search_skills to find a skill by keyword)"
+                )
             return (
                 f'Skill "{name}" not found.\n\n'
                 f"Available skills ({len(all_skills)} total):\n{skill_list}"
@@ -153,6 +238,32 @@ class SkillLoaderTool(BaseTool):
                 output.append(f"  - {resource}")
             output.append("")
 
-        output.append(skill.content.strip())
+        try:
+            content = self.skill_manager.get_content(skill)
+        except SkillParseError as e:
+            raise ToolError(f"Failed to load skill '{skill.name}': {e}") from e
+
+        output.append(content.strip())
 
         return "\n".join(output)
+
+
+def _char_budget(max_chars: int, max_tokens: int) -> int:
+    """Combine the character and token limits into one character budget.
+
+    Args:
+        max_chars: Character limit (0 = no limit).
+        max_tokens: Approximate token limit (0 = no limit).
+
+    Returns:
+        Character budget (0 = no limit).
+    """
+    limits = [limit for limit in (max_chars, max_tokens * CHARS_PER_TOKEN) if limit > 0]
+    return min(limits) if limits else 0
+
+
+def _truncate(text: str) -> str:
+    """Shorten a description for the catalog."""
+    if len(text) <= CATALOG_DESCRIPTION_CHARS:
+        return text
+    return text[: CATALOG_DESCRIPTION_CHARS - 3].rstrip() + "..."
@@ -0,0 +1,155 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Skill search tool - finds skills by keywords."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from ..skill.manager import SkillManager
+from ..skill.search import SearchResult, SkillSearchIndex
+from ..utils.logging import get_logger
+from .base import BaseTool, ToolError
+
+logger = get_logger("tools.skill_search")
+
+# Largest number of results a single query may ask for
+MAX_SEARCH_LIMIT = 100
+
+
+class SkillSearchTool(BaseTool):
+    """Tool for searching skills.
+
+    Ranks skills against a free-text query with BM25 over their names,
+    descriptions, tags, categories and headings. Unlike list_skills, the
+    output size depends on the limit rather than on the catalog size.
+    """
+
+    def __init__(self, skill_manager: SkillManager) -> None:
+        """Initialize the tool.
+
+        Args:
+            skill_manager: SkillManager instance.
+        """
+        self.skill_manager = skill_manager
+        self.index = SkillSearchIndex(skill_manager)
+
+    @property
+    def name(self) -> str:
+        return "search_skills"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Search the available skills by keywords and return the best matches. "
+            "Prefer this over list_skills when there are many skills. "
+            "Results can be narrowed down by category or tag."
+        )
+
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Keywords describing the task (e.g., 'convert pdf to text')",
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Only return skills in this category or its subcategories",
+                },
+                "tag": {
+                    "type": "string",
+                    "description": "Only return skills with this tag",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": f"Maximum number of results (default: 10, max: {MAX_SEARCH_LIMIT})",
+                    "default": 10,
+                },
+            },
+            "required": ["query"],
+        }
+
+    def execute(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 10,
+        **kwargs: Any,
+    ) -> str:
+        """Search skills.
+
+        Args:
+            query: Free-text query.
+            category: Optional category filter.
+            tag: Optional tag filter.
+            limit: Maximum number of results.
+
+        Returns:
+            Formatted search results.
+
+        Raises:
+            ToolError: If the limit is invalid.
+        """
+        if not isinstance(limit, int) or limit < 1:
+            raise ToolError("limit must be a positive integer")
+        limit = min(limit, MAX_SEARCH_LIMIT)
+
+        logger.info(f"Searching skills: {query!r}")
+
+        results = self.index.search(query, category=category, tag=tag, limit=limit)
+        if not results:
+            return self._format_no_results(query, category, tag)
+
+        return self._format_results(query, results)
+
+    def _format_no_results(self, query: str, category: Optional[str], tag: Optional[str]) -> str:
+        """Format message when nothing matches.
+
+        Args:
+            query: Search query.
+            category: Category filter.
+            tag: Tag filter.
+
+        Returns:
+            Formatted message.
+        """
+        filters = [f"category '{category}'" if category else "", f"tag '{tag}'" if tag else ""]
+        filters = [f for f in filters if f]
+        suffix = f" with {' and '.join(filters)}" if filters else ""
+        return (
+            f"No skills found for '{query}'{suffix}.\n"
+            "Try different keywords or use list_skills to see all skills."
+        )
+
+    def _format_results(self, query: str, results: list[SearchResult]) -> str:
+        """Format the search results.
+
+        Args:
+            query: Search query.
+            results: Search results, best first.
+
+        Returns:
+            Formatted results list.
+        """
+        title = f"Skills matching '{query}'" if query.strip() else "Skills"
+        output = [
+            f"## {title} ({len(results)} shown)",
+            "",
+        ]
+
+        for result in results:
+            skill = result.skill
+            category = skill.category or "uncategorized"
+            output.append(f"- **{skill.name}** ({category}): {skill.description}")
+            if skill.tags:
+                output.append(f"  Tags: {', '.join(skill.tags)}")
+
+        output.append("")
+        output.append("Use the skill tool to load a skill by name.")
+
+        return "\n".join(output)
@@ -0,0 +1,104 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Workspaces the file and script tools operate in.
+
+By default every client shares the configured workspace directory.
+With per-session workspaces, the server sets `current_workspace` to a
+fresh Workspace for each client session; tools read it instead of the
+workspace given at construction. Session workspaces are created on
+first use and deleted when the session ends.
+"""
+
+from __future__ import annotations
+
+import shutil
+import uuid
+import weakref
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional
+
+from ..security.path_validator import PathValidator
+from ..utils.logging import get_logger
+
+logger = get_logger("tools.workspace")
+
+# Workspace of the session the current tool call belongs to (None = default)
+current_workspace: ContextVar[Optional[Workspace]] = ContextVar("current_workspace", default=None)
+
+
+class Workspace:
+    """A workspace directory with its cached path validator.
+
+    The directory is created the first time it is used.
+    """
+
+    def __init__(self, root: Path, ephemeral: bool = False) -> None:
+        """Initialize the workspace.
+
+        Args:
+            root: Workspace directory.
+            ephemeral: Delete the directory on remove() (or, failing that,
+                when the workspace is garbage collected or the server exits).
+        """
+        self._root = root.resolve()
+        self._validator: Optional[PathValidator] = None
+        self._created = False
+        self._finalizer = (
+            weakref.finalize(self, _remove_workspace, self._root) if ephemeral else None
+        )
+
+    @property
+    def root(self) -> Path:
+        """Get the workspace directory, creating it if needed."""
+        if not self._created:
+            self._root.mkdir(parents=True, exist_ok=True)
+            self._created = True
+        return self._root
+
+    @property
+    def path_validator(self) -> PathValidator:
+        """Get the path validator confining paths to the workspace."""
+        if self._validator is None:
+            self._validator = PathValidator(self.root)
+        return self._validator
+
+    def remove(self) -> None:
+        """Delete an ephemeral workspace and everything in it."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __repr__(self) -> str:
+        return f"Workspace({str(self._root)!r})"
+
+
+class WorkspaceManager:
+    """Hands out one ephemeral workspace per client session.
+
+    Session workspaces are subdirectories of the base directory, named
+    after a random id so that clients cannot guess each other's.
+    """
+
+    def __init__(self, base_dir: Path) -> None:
+        """Initialize the manager.
+
+        Args:
+            base_dir: Directory holding the session workspaces.
+        """
+        self.base_dir = base_dir
+
+    def create(self) -> Workspace:
+        """Create the workspace of a new session.
+
+        Returns:
+            Ephemeral Workspace; its directory is created on first use.
+        """
+        return Workspace(self.base_dir / f"session-{uuid.uuid4().hex[:12]}", ephemeral=True)
+
+
+def _remove_workspace(root: Path) -> None:
+    """Delete a session workspace and everything in it."""
+    if root.exists():
+        shutil.rmtree(root, ignore_errors=True)
+        logger.debug(f"Removed workspace {root}")
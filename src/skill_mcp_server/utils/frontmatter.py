@@ -12,6 +12,9 @@ from __future__ import annotations
 import re
 from typing import Any
 
+# Line that opens and closes a frontmatter block
+FRONTMATTER_DELIMITER = "---"
+
 # Pattern to match YAML frontmatter delimited by ---
 FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
 
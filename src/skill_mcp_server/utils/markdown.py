@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+# Returned by extract_description() when the content has no usable line
+NO_DESCRIPTION = "No description available"
+
 
 def extract_description(content: str, max_length: int = 100) -> str:
     """Extract a description from markdown content.
@@ -46,7 +49,7 @@ def extract_description(content: str, max_length: int = 100) -> str:
         if line:
             return _truncate(line, max_length)
 
-    return "No description available"
+    return NO_DESCRIPTION
 
 
 def _truncate(text: str, max_length: int) -> str:
@@ -0,0 +1,59 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Tests for concurrent tool calls."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import anyio
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from skill_mcp_server.config.settings import Settings
+from skill_mcp_server.core.server import SkillMCPServer
+
+# Seconds the script sleeps
+SCRIPT_SECONDS = 2.0
+
+
+async def test_file_read_not_blocked_by_script(
+    skills_dir: Path, workspace_dir: Path, temp_dir: Path
+) -> None:
+    """A file read returns while a slow script is still running."""
+    (skills_dir / "sample-skill" / "scripts" / "sleep.py").write_text(
+        f"import time\ntime.sleep({SCRIPT_SECONDS})\nprint('done')\n"
+    )
+    (workspace_dir / "notes.txt").write_text("hello")
+
+    server = SkillMCPServer(
+        Settings(skills_dir=skills_dir, workspace_dir=workspace_dir, cache_dir=temp_dir / "cache")
+    )
+    finished: dict[str, float] = {}
+
+    async with create_connected_server_and_client_session(server.server) as client:
+        start = time.monotonic()
+
+        async def run_script() -> None:
+            result = await client.call_tool(
+                "skill_script", {"skill_name": "sample-skill", "script_path": "scripts/sleep.py"}
+            )
+            assert not result.isError
+            assert "done" in result.content[0].text
+            finished["script"] = time.monotonic() - start
+
+        async def read_file() -> None:
+            # Give the script call a head start so both are in flight
+            await anyio.sleep(0.2)
+            result = await client.call_tool("file_read", {"file_path": "notes.txt"})
+            assert not result.isError
+            assert "hello" in result.content[0].text
+            finished["read"] = time.monotonic() - start
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_script)
+            tg.start_soon(read_file)
+
+    assert finished["script"] >= SCRIPT_SECONDS
+    assert finished["read"] < SCRIPT_SECONDS / 2
@@ -0,0 +1,48 @@
+# Copyright (c) 2025
+# SPDX-License-Identifier: MIT
+
+"""Memory benchmark for skill discovery."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from skill_mcp_server.skill.manager import SkillManager
+
+# Skills in the synthetic catalog
+SKILL_COUNT = 5000
+
+# Bytes a discovered skill may keep alive: SkillInfo plus its share of the
+# manager's lookup tables. About 615 are measured; a SkillInfo without
+# slots that holds its location as a Path takes nearly 880.
+MAX_BYTES_PER_SKILL = 768
+
+
+@pytest.mark.slow
+def test_discover_memory_per_skill(temp_dir: Path) -> None:
+    """Retained memory per discovered skill stays bounded."""
+    for category in range(100):
+        (temp_dir / f"cat{category}").mkdir()
+    for i in range(SKILL_COUNT):
+        skill_dir = temp_dir / f"cat{i % 100}" / f"skill-{i}"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{i}\ndescription: Synthetic skill number {i}\n---\n\n# Skill {i}\n"
+        )
+
+    manager = SkillManager(skill_dirs=[temp_dir], scan_patterns=("*/*/SKILL.md",))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        skills = manager.discover()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(skills) == SKILL_COUNT
+    assert retained / SKILL_COUNT < MAX_BYTES_PER_SKILL